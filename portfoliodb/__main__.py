@@ -1,6 +1,12 @@
 """Entry point for: python -m portfoliodb"""
 
-from portfoliodb.cli import cli
+import sys
 
 if __name__ == "__main__":
-    cli()
+    # Answered before importing click or any command module.
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        from portfoliodb import __version__
+        print(f"portfoliodb {__version__}")
+    else:
+        from portfoliodb.cli import main
+        main()
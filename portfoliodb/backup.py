@@ -30,7 +30,7 @@ import sqlite3
 from datetime import datetime
 from pathlib import Path
 
-from portfoliodb.db import DB_PATH
+from portfoliodb.db import DB_PATH, close_connection
 
 # Master is the Mac mini; Dropbox cold-backup target lives next to the synced
 # family-wealth memory under PJHub/portfolio-db/. Overridable for tests / other
@@ -153,5 +153,7 @@ def restore_backup(src: Path, force: bool = False) -> Path:
         safety = DB_PATH.with_name(f"portfolio.pre-restore-{_timestamp()}.db")
         shutil.copy2(DB_PATH, safety)
 
+    # Never swap the file out from under an open (WAL-mode) connection.
+    close_connection()
     shutil.copy2(src, DB_PATH)
     return DB_PATH
@@ -21,13 +21,69 @@ Example credentials.json:
 }
 """
 
-import json
+import os
+import tempfile
 
 from portfoliodb.db import APP_DIR
 
+# orjson is optional — faster parse/serialise and works on bytes directly. The
+# stdlib fallback keeps the same on-disk format (2-space indent, raw UTF-8).
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 CREDENTIALS_DIR = APP_DIR
 CREDENTIALS_PATH = CREDENTIALS_DIR / "credentials.json"
 
+# Parsed credentials.json, stamped with (path, st_mtime_ns, st_size) of the
+# file it was read from. Broker login + `sync credentials` would otherwise
+# re-parse the same file 2-3x per CLI run; an edit on disk changes the stamp
+# and invalidates it (size catches two writes within one coarse mtime tick).
+# Callers only ever get copies of the cached broker dicts.
+_CREDS_CACHE: tuple[tuple[str, int, int], dict] | None = None
+
+
+def _stamp() -> tuple[str, int, int]:
+    """Cache key for the current credentials.json. Raises FileNotFoundError."""
+    st = CREDENTIALS_PATH.stat()
+    return (str(CREDENTIALS_PATH), st.st_mtime_ns, st.st_size)
+
+
+def _cached(stamp: tuple[str, int, int]) -> dict | None:
+    if _CREDS_CACHE is not None and _CREDS_CACHE[0] == stamp:
+        return _CREDS_CACHE[1]
+    return None
+
+
+def _parse(stamp: tuple[str, int, int], raw: bytes) -> dict:
+    global _CREDS_CACHE
+    all_creds = _loads(raw)
+    _CREDS_CACHE = (stamp, all_creds)
+    return all_creds
+
+
+def _load_all() -> dict:
+    """Return the parsed credentials.json, re-reading only if the file changed.
+
+    Raises FileNotFoundError if the file doesn't exist.
+    """
+    stamp = _stamp()
+    cached = _cached(stamp)
+    if cached is not None:
+        return cached
+    return _parse(stamp, CREDENTIALS_PATH.read_bytes())
+
 
 def load_credentials(broker: str) -> dict:
     """Load credentials for a specific broker.
@@ -42,14 +98,13 @@ def load_credentials(broker: str) -> dict:
         FileNotFoundError: If credentials.json doesn't exist.
         KeyError: If the broker section is missing.
     """
-    if not CREDENTIALS_PATH.exists():
+    try:
+        all_creds = _load_all()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Credentials file not found at {CREDENTIALS_PATH}\n"
             f"Please create it with your API keys. See documentation for format."
-        )
-
-    with open(CREDENTIALS_PATH, "r", encoding="utf-8") as f:
-        all_creds = json.load(f)
+        ) from None
 
     if broker not in all_creds:
         raise KeyError(
@@ -57,28 +112,53 @@ def load_credentials(broker: str) -> dict:
             f"Available brokers: {', '.join(all_creds.keys())}"
         )
 
-    return all_creds[broker]
+    return dict(all_creds[broker])
 
 
 def save_credentials(broker: str, credentials: dict) -> None:
     """Save or update credentials for a broker."""
+    global _CREDS_CACHE
     CREDENTIALS_DIR.mkdir(parents=True, exist_ok=True)
 
-    all_creds = {}
-    if CREDENTIALS_PATH.exists():
-        with open(CREDENTIALS_PATH, "r", encoding="utf-8") as f:
-            all_creds = json.load(f)
+    try:
+        # Copy so a failed write below never leaves the cache ahead of disk.
+        all_creds = dict(_load_all())
+    except FileNotFoundError:
+        all_creds = {}
+
+    all_creds[broker] = dict(credentials)
 
-    all_creds[broker] = credentials
+    # Serialise to bytes once and swap the file in atomically: a crash mid-write
+    # leaves the previous credentials.json intact rather than half-written.
+    # mkstemp gives a unique name (concurrent savers don't share a temp file)
+    # created 0600, so the replaced file is never readable by other users.
+    fd, tmp = tempfile.mkstemp(dir=CREDENTIALS_DIR, prefix=".credentials.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_dumps(all_creds))
+        os.replace(tmp, CREDENTIALS_PATH)
+    except BaseException:
+        os.unlink(tmp)
+        raise
 
-    with open(CREDENTIALS_PATH, "w", encoding="utf-8") as f:
-        json.dump(all_creds, f, indent=2, ensure_ascii=False)
+    _CREDS_CACHE = (_stamp(), all_creds)
 
 
 def has_credentials(broker: str) -> bool:
     """Check if credentials exist for a broker."""
-    if not CREDENTIALS_PATH.exists():
+    try:
+        stamp = _stamp()
+    except FileNotFoundError:
+        return False
+
+    cached = _cached(stamp)
+    if cached is not None:
+        return broker in cached
+
+    raw = CREDENTIALS_PATH.read_bytes()
+    # credentials.json is written by save_credentials() (or by hand, same
+    # shape): top-level keys are plain ASCII broker names, never escaped. If
+    # the quoted name doesn't appear anywhere, it can't be a key — skip the parse.
+    if f'"{broker}"'.encode() not in raw:
         return False
-    with open(CREDENTIALS_PATH, "r", encoding="utf-8") as f:
-        all_creds = json.load(f)
-    return broker in all_creds
+    return broker in _parse(stamp, raw)
@@ -20,32 +20,93 @@ Usage:
     broker.login()
     holdings = broker.get_holdings()
     balance = broker.get_balance()
+
+    # or both in one go (the two SDK calls run concurrently):
+    snapshot = broker.get_snapshot()
 """
 
-from portfoliodb.brokers.config import load_credentials
+from __future__ import annotations
+
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+from portfoliodb.brokers.types import BrokerHolding
+
+# Suffix appended to the SDK's bare stock codes ("2330" -> "2330.TW").
+_TW = ".TW"
+
+# get_balance() shape; Fubon Neo bank balances are always TWD.
+_BALANCE_TEMPLATE = {"balance": 0.0, "currency": "TWD"}
+
+
+def _pick(sample, primary: str, fallback: str) -> str:
+    """Return whichever of two SDK field spellings `sample` actually carries.
+
+    The Neo SDK has shipped both spellings across versions (e.g. quantity vs
+    qty), but every row in one response shares the same shape — so the
+    choice is made once per response, not once per row.
+    """
+    return primary if hasattr(sample, primary) else fallback
+
+
+def _holdings_row_parser(sample):
+    """Build a row -> BrokerHolding function specialised to `sample`'s schema."""
+    code = _pick(sample, "stock_no", "symbol")
+    qty = _pick(sample, "quantity", "qty")
+    cost = _pick(sample, "cost_price", "price")
+    pnl = _pick(sample, "unrealized_profit", "pnl")
+
+    def parse(item) -> BrokerHolding:
+        return BrokerHolding(
+            ticker=getattr(item, code) + _TW,
+            shares=float(getattr(item, qty, 0) or 0),
+            avg_cost=float(getattr(item, cost, 0) or 0),
+            last_price=float(getattr(item, "market_price", 0) or 0),
+            pnl=float(getattr(item, pnl, 0) or 0),
+        )
+    return parse
+
+
+def _parse_balance(result) -> dict:
+    """bank_remain() response -> balance dict."""
+    out = _BALANCE_TEMPLATE.copy()
+    if result.is_success and result.data:
+        out["balance"] = float(result.data)
+    return out
 
 
 class FubonBroker:
     """Interface to Fubon Securities via Fubon Neo SDK."""
 
+    # FubonSDK class, imported on first login and reused by later logins.
+    _sdk_cls = None
+
     def __init__(self):
         self.sdk = None
         self.accounts = None
+        self._account = None
+        self._holdings_parser = None
         self._logged_in = False
 
     def login(self) -> None:
         """Login to Fubon Neo API using stored credentials."""
-        try:
-            from fubon_neo.sdk import FubonSDK
-        except ImportError:
-            raise ImportError(
-                "Fubon Neo SDK is not installed.\n"
-                "Download the .whl file from https://www.fbs.com.tw/TradeAPI/\n"
-                "Then run: pip install fubon_neo-<version>.whl"
-            )
-
+        cls = type(self)
+        if cls._sdk_cls is None:
+            try:
+                from fubon_neo.sdk import FubonSDK
+            except ImportError:
+                raise ImportError(
+                    "Fubon Neo SDK is not installed.\n"
+                    "Download the .whl file from https://www.fbs.com.tw/TradeAPI/\n"
+                    "Then run: pip install fubon_neo-<version>.whl"
+                )
+            cls._sdk_cls = FubonSDK
+
+        from portfoliodb.brokers.config import load_credentials
         creds = load_credentials("fubon")
-        self.sdk = FubonSDK()
+        self.sdk = cls._sdk_cls()
+        self._account = None
+        self._holdings_parser = None
         self.accounts = self.sdk.login(
             creds["user_id"],
             creds["password"],
@@ -59,44 +120,42 @@ class FubonBroker:
             raise RuntimeError("Not logged in. Call login() first.")
 
     def _get_account(self):
-        """Get the first available stock account."""
+        """Get the first available stock account (resolved once per login)."""
+        if self._account is not None:
+            return self._account
         if self.accounts and hasattr(self.accounts, 'data'):
             account_list = self.accounts.data
             if account_list:
-                return account_list[0]
+                self._account = account_list[0]
+                return self._account
         raise RuntimeError("No trading accounts found")
 
-    def get_holdings(self) -> list[dict]:
+    def _parse_holdings(self, result) -> list[BrokerHolding]:
+        """unrealized_gains_and_loses() response -> list of BrokerHolding.
+
+        The row parser is specialised on the first non-empty response and
+        kept for the rest of the session (reset on login), so later calls
+        skip the schema probe too.
+        """
+        if not (result.is_success and result.data):
+            return []
+        if self._holdings_parser is None:
+            self._holdings_parser = _holdings_row_parser(result.data[0])
+        return list(map(self._holdings_parser, result.data))
+
+    def get_holdings(self) -> list[BrokerHolding]:
         """Get current stock holdings with unrealized P&L.
 
-        Returns list of dicts:
-            [{"ticker": "2330.TW", "shares": 1000, "avg_cost": 580.5,
-              "last_price": 1915.0, "pnl": 1334500.0}, ...]
+        Returns list of BrokerHolding:
+            [BrokerHolding(ticker="2330.TW", shares=1000, avg_cost=580.5,
+                           last_price=1915.0, pnl=1334500.0), ...]
         """
         self._ensure_logged_in()
         account = self._get_account()
 
         # Use unrealized_gains_and_loses for detailed position data
         result = self.sdk.accounting.unrealized_gains_and_loses(account)
-
-        holdings = []
-        if result.is_success and result.data:
-            for item in result.data:
-                ticker = f"{item.stock_no}.TW" if hasattr(item, 'stock_no') else f"{item.symbol}.TW"
-                shares = float(getattr(item, 'quantity', 0) or getattr(item, 'qty', 0))
-                avg_cost = float(getattr(item, 'cost_price', 0) or getattr(item, 'price', 0))
-                last_price = float(getattr(item, 'market_price', 0) or 0)
-                pnl = float(getattr(item, 'unrealized_profit', 0) or getattr(item, 'pnl', 0))
-
-                holdings.append({
-                    "ticker": ticker,
-                    "shares": shares,
-                    "avg_cost": avg_cost,
-                    "last_price": last_price,
-                    "pnl": pnl,
-                })
-
-        return holdings
+        return self._parse_holdings(result)
 
     def get_balance(self) -> dict:
         """Get bank cash balance.
@@ -108,30 +167,56 @@ class FubonBroker:
         account = self._get_account()
 
         result = self.sdk.accounting.bank_remain(account)
+        return _parse_balance(result)
 
-        balance = 0.0
-        if result.is_success and result.data:
-            balance = float(result.data)
+    def get_snapshot(self) -> dict:
+        """Get holdings and cash balance together.
 
-        return {
-            "balance": balance,
-            "currency": "TWD",
-        }
+        The two SDK round-trips are independent, so they run concurrently
+        instead of back to back.
 
-    def get_inventories(self) -> list[dict]:
-        """Get raw inventory data (alternative to get_holdings)."""
+        Returns:
+            {"holdings": [...as get_holdings()], "balance": {...as get_balance()}}
+        """
+        self._ensure_logged_in()
+        account = self._get_account()
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            holdings = pool.submit(self.sdk.accounting.unrealized_gains_and_loses, account)
+            balance = pool.submit(self.sdk.accounting.bank_remain, account)
+            return {
+                "holdings": self._parse_holdings(holdings.result()),
+                "balance": _parse_balance(balance.result()),
+            }
+
+    def iter_inventories(self, include_raw: bool = False) -> Iterator[dict]:
+        """Yield inventory rows one at a time (lazy get_inventories).
+
+        Nothing runs — not even the login check or the SDK call — until the
+        first next(), and rows past the point a caller stops are never built.
+
+        Args:
+            include_raw: Also return `str(item)` per row under "raw" — handy
+                when probing an unfamiliar SDK version, but stringifying SDK
+                objects is costly, so it's off by default.
+        """
         self._ensure_logged_in()
         account = self._get_account()
 
         result = self.sdk.accounting.inventories(account)
 
-        items = []
-        if result.is_success and result.data:
-            for item in result.data:
-                items.append({
-                    "raw": str(item),
-                    "ticker": getattr(item, 'stock_no', None) or getattr(item, 'symbol', None),
-                    "shares": getattr(item, 'quantity', None) or getattr(item, 'qty', None),
-                })
+        if not (result.is_success and result.data):
+            return
 
-        return items
+        first = result.data[0]
+        code = _pick(first, "stock_no", "symbol")
+        qty = _pick(first, "quantity", "qty")
+        for item in result.data:
+            row = {"ticker": getattr(item, code, None), "shares": getattr(item, qty, None)}
+            if include_raw:
+                row["raw"] = str(item)
+            yield row
+
+    def get_inventories(self, include_raw: bool = False) -> list[dict]:
+        """Get raw inventory data (alternative to get_holdings)."""
+        return list(self.iter_inventories(include_raw))
@@ -20,30 +20,76 @@ Usage:
     broker.login()
     holdings = broker.get_holdings()
     balance = broker.get_balance()
+    snapshot = broker.get_snapshot()  # both, fetched concurrently
     broker.logout()
 """
 
-from portfoliodb.brokers.config import load_credentials
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from portfoliodb.brokers.types import BrokerHolding
+
+# Suffix appended to Shioaji's bare stock codes ("2330" -> "2330.TW").
+_TW = ".TW"
+
+# Position direction -> sign on shares. "Buy" is a long position; "Sell" a short.
+_SIGN = {"Buy": 1.0, "Sell": -1.0}
+
+# get_balance() shape; the Shioaji stock account settles in TWD.
+_BALANCE_TEMPLATE = {"balance": 0.0, "currency": "TWD", "date": None}
+
+
+def _parse_positions(positions) -> list[BrokerHolding]:
+    """list_positions() response -> list of BrokerHolding."""
+    return [
+        BrokerHolding(
+            ticker=pos.code + _TW,
+            shares=_SIGN.get(pos.direction.value, 1.0) * float(pos.quantity),
+            avg_cost=float(pos.price),
+            last_price=float(pos.last_price) if hasattr(pos, 'last_price') else None,
+            pnl=float(pos.pnl) if hasattr(pos, 'pnl') else None,
+        )
+        for pos in positions
+    ]
+
+
+def _parse_balance(bal) -> dict:
+    """account_balance() response -> balance dict."""
+    out = _BALANCE_TEMPLATE.copy()
+    out["balance"] = float(bal.acc_balance)
+    if hasattr(bal, 'date'):
+        out["date"] = str(bal.date)
+    return out
 
 
 class SinoPacBroker:
     """Interface to SinoPac Securities via Shioaji."""
 
+    # Shioaji class, imported on first login and reused by later logins.
+    _sdk_cls = None
+
     def __init__(self):
         self.api = None
+        self._stock_account = None
+        self._futopt_account = None
         self._logged_in = False
 
     def login(self) -> None:
         """Login to Shioaji API using stored credentials."""
-        try:
-            import shioaji as sj
-        except ImportError:
-            raise ImportError(
-                "Shioaji is not installed. Run: pip install shioaji[speed]"
-            )
-
+        cls = type(self)
+        if cls._sdk_cls is None:
+            try:
+                from shioaji import Shioaji
+            except ImportError:
+                raise ImportError(
+                    "Shioaji is not installed. Run: pip install shioaji[speed]"
+                )
+            cls._sdk_cls = Shioaji
+
+        from portfoliodb.brokers.config import load_credentials
         creds = load_credentials("sinopac")
-        self.api = sj.Shioaji()
+        self.api = cls._sdk_cls()
         self.api.login(
             api_key=creds["api_key"],
             secret_key=creds["secret_key"],
@@ -56,46 +102,65 @@ class SinoPacBroker:
                 ca_passwd=creds.get("ca_password", ""),
             )
 
+        # Shioaji resolves these through accessors that may touch the session;
+        # bind them once per login instead of on every query.
+        self._stock_account = self.api.stock_account
+        self._futopt_account = getattr(self.api, 'futopt_account', None)
         self._logged_in = True
 
     def logout(self) -> None:
         """Logout from Shioaji."""
         if self.api and self._logged_in:
             self.api.logout()
+            self._stock_account = None
+            self._futopt_account = None
             self._logged_in = False
 
     def _ensure_logged_in(self):
         if not self._logged_in:
             raise RuntimeError("Not logged in. Call login() first.")
 
-    def get_holdings(self) -> list[dict]:
+    def get_holdings(self) -> list[BrokerHolding]:
         """Get current stock holdings.
 
-        Returns list of dicts:
-            [{"ticker": "2330.TW", "shares": 1000, "avg_cost": 580.5,
-              "last_price": 1915.0, "pnl": 1334500.0}, ...]
+        Returns list of BrokerHolding:
+            [BrokerHolding(ticker="2330.TW", shares=1000, avg_cost=580.5,
+                           last_price=1915.0, pnl=1334500.0), ...]
         """
         self._ensure_logged_in()
-        positions = self.api.list_positions(self.api.stock_account)
-
-        holdings = []
-        for pos in positions:
-            # Shioaji returns code like "2330", we append ".TW"
-            ticker = f"{pos.code}.TW"
-            shares = pos.quantity
-            # direction: "Buy" means long position
-            if pos.direction.value == "Sell":
-                shares = -shares
-
-            holdings.append({
-                "ticker": ticker,
-                "shares": float(shares),
-                "avg_cost": float(pos.price),
-                "last_price": float(pos.last_price) if hasattr(pos, 'last_price') else None,
-                "pnl": float(pos.pnl) if hasattr(pos, 'pnl') else None,
-            })
-
-        return holdings
+        positions = self.api.list_positions(self._stock_account)
+        return _parse_positions(positions)
+
+    def get_holdings_arrays(self) -> dict:
+        """Column-oriented get_holdings() for pandas / numpy consumers.
+
+        Numeric columns are filled straight into float64 arrays, skipping the
+        per-row BrokerHolding objects and the reboxing a DataFrame build would
+        do on them. numpy is imported here (it ships with yfinance/pandas)
+        so plain syncs don't pay for it.
+
+        Returns:
+            {"ticker": ["2330.TW", ...], "shares": ndarray, "avg_cost": ndarray,
+             "last_price": ndarray, "pnl": ndarray}
+            last_price / pnl are NaN where Shioaji didn't report them.
+        """
+        import numpy as np
+
+        self._ensure_logged_in()
+        positions = self.api.list_positions(self._stock_account)
+        n = len(positions)
+        nan = float("nan")
+
+        def column(values):
+            return np.fromiter(values, dtype=np.float64, count=n)
+
+        return {
+            "ticker": [pos.code + _TW for pos in positions],
+            "shares": column(_SIGN.get(pos.direction.value, 1.0) * pos.quantity for pos in positions),
+            "avg_cost": column(pos.price for pos in positions),
+            "last_price": column(getattr(pos, 'last_price', nan) for pos in positions),
+            "pnl": column(getattr(pos, 'pnl', nan) for pos in positions),
+        }
 
     def get_balance(self) -> dict:
         """Get account cash balance.
@@ -105,18 +170,33 @@ class SinoPacBroker:
         """
         self._ensure_logged_in()
         bal = self.api.account_balance()
+        return _parse_balance(bal)
 
-        return {
-            "balance": float(bal.acc_balance),
-            "currency": "TWD",
-            "date": str(bal.date) if hasattr(bal, 'date') else None,
-        }
+    def get_snapshot(self) -> dict:
+        """Get holdings and cash balance together.
+
+        The two API round-trips are independent, so they run concurrently
+        instead of back to back.
+
+        Returns:
+            {"holdings": [...as get_holdings()], "balance": {...as get_balance()}}
+        """
+        self._ensure_logged_in()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            positions = pool.submit(self.api.list_positions, self._stock_account)
+            balance = pool.submit(self.api.account_balance)
+            return {
+                "holdings": _parse_positions(positions.result()),
+                "balance": _parse_balance(balance.result()),
+            }
 
     def get_margin(self) -> dict | None:
         """Get futures/options margin info (if applicable)."""
         self._ensure_logged_in()
+        if self._futopt_account is None:
+            return None
         try:
-            margin = self.api.margin(self.api.futopt_account)
+            margin = self.api.margin(self._futopt_account)
             return {
                 "equity": float(margin.equity),
                 "available_margin": float(margin.available_margin),
@@ -0,0 +1,21 @@
+"""Row types returned by the broker integrations."""
+
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+
+@dataclass(slots=True)
+class BrokerHolding:
+    """One position as reported by a broker API (or rebuilt from a CSV import).
+
+    Slotted rather than a plain dict: a sync can carry one of these per
+    position, and slot instances are a fraction of a dict's footprint.
+    """
+    ticker: str
+    shares: float
+    avg_cost: float
+    last_price: Optional[float] = None
+    pnl: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
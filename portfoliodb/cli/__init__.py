@@ -0,0 +1,97 @@
+"""CLI entry point for PortfolioDB.
+
+Each command group lives in its own `_<group>.py` module. The root group is a
+`LazyGroup` that imports a group's module only when Click looks that group up,
+so `tx list` never builds the Click objects (or imports the services) behind
+`summary`/`sync`/...
+"""
+
+import importlib
+
+import click
+
+from portfoliodb import __version__
+from portfoliodb.cli import _ui as ui
+
+
+# ─── Root command group ──────────────────────────────────────────────
+
+# name → ("module:attribute", short help). The short help is what bare
+# `--help` lists without importing anything, so it must track the group's
+# docstring.
+_SUBCOMMANDS = {
+    "backup":  ("portfoliodb.cli._backup:backup", "Off-machine DB cold backup (Dropbox)."),
+    "user":    ("portfoliodb.cli._user:user", "User management."),
+    "account": ("portfoliodb.cli._account:account", "Account management."),
+    "holding": ("portfoliodb.cli._holding:holding", "Holdings management."),
+    "tx":      ("portfoliodb.cli._tx:tx", "Transaction management (buy/sell)."),
+    "cash":    ("portfoliodb.cli._cash:cash", "Cash position management."),
+    "order":   ("portfoliodb.cli._order:order", "Planned orders management."),
+    "rank":    ("portfoliodb.cli._rank:rank",
+                "Individual-stock ranking snapshots (PEG / Kelly f* / 15-point framework)."),
+    "price":   ("portfoliodb.cli._price:price", "Stock price utilities."),
+    "summary": ("portfoliodb.cli._summary:summary", "Portfolio summaries."),
+    "fx":      ("portfoliodb.cli._fx:fx", "Exchange rate utilities."),
+    "sync":    ("portfoliodb.cli._sync:sync", "Sync data from brokers and CSV files."),
+}
+
+
+class LazyGroup(click.Group):
+    """click.Group whose subcommands are imported on first lookup.
+
+    ``lazy_subcommands`` maps a name to ``("module:attribute", short help)``.
+    get_command() imports the module the first time Click resolves that name;
+    the help listing uses the recorded short help instead, so `--help` imports
+    no command module at all.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx, name):
+        if name in self.lazy_subcommands and name not in self.commands:
+            module, attr = self.lazy_subcommands[name][0].split(":")
+            self.add_command(getattr(importlib.import_module(module), attr), name)
+        return super().get_command(ctx, name)
+
+    def format_commands(self, ctx, formatter):
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(n) for n in names)
+        rows = []
+        for name in names:
+            if name in self.lazy_subcommands and name not in self.commands:
+                rows.append((name, self.lazy_subcommands[name][1]))
+                continue
+            cmd = self.get_command(ctx, name)
+            if cmd is not None and not cmd.hidden:
+                rows.append((name, cmd.get_short_help_str(limit)))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=_SUBCOMMANDS)
+@click.version_option(__version__, "-V", "--version", prog_name="portfoliodb",
+                      message="%(prog)s %(version)s")
+def cli():
+    """PortfolioDB - Multi-Account Portfolio Management System"""
+    pass
+
+
+# ─── init ────────────────────────────────────────────────────────────
+
+@cli.command()
+def init():
+    """Initialize the database (create tables)."""
+    from portfoliodb.db import init_db, DB_PATH
+    init_db()
+    ui.console.print(f"[green][OK][/green] Database initialized at {DB_PATH}")
+
+
+def main():
+    cli()
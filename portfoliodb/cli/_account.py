@@ -0,0 +1,94 @@
+"""`account` command group."""
+
+import click
+
+from portfoliodb.cli import _ui as ui
+
+_MARKET_CHOICE = click.Choice(["TW", "US", "SG"], case_sensitive=False)
+_ACCT_TYPE_CHOICE = click.Choice(["brokerage", "bank"])
+
+_ACCOUNT_COLUMNS = (
+    ("ID", {"style": "cyan"}),
+    ("Legal Owner", {}),
+    ("Economic Owner", {}),
+    ("Account Name", {"style": "bold"}),
+    ("Broker", {}),
+    ("Market", {}),
+    ("Currency", {}),
+    ("Type", {}),
+)
+
+
+# ─── account commands ────────────────────────────────────────────────
+
+@click.group()
+def account():
+    """Account management."""
+    pass
+
+
+@account.command("add")
+@click.argument("legal_owner")
+@click.argument("account_name")
+@click.argument("broker")
+@click.argument("market", type=_MARKET_CHOICE)
+@click.option("--economic-owner", "economic_owner", default=None,
+              help="實際擁有人 username（不給=同 legal_owner）")
+@click.option("--type", "account_type", default="brokerage",
+              type=_ACCT_TYPE_CHOICE, help="Account type")
+@ui.safe
+def account_add(legal_owner, account_name, broker, market, economic_owner, account_type):
+    """Create an account.
+
+    LEGAL_OWNER = 戶頭掛在誰名下；--economic-owner = 實際是誰的錢（預設同 legal）
+
+    Examples:
+      account add ian "Firstrade" Firstrade US
+      account add dad "Fubon TW" Fubon TW --economic-owner ian
+    """
+    from portfoliodb.services.user_service import get_user_by_username
+    from portfoliodb.services.account_service import create_account
+    legal = get_user_by_username(legal_owner)
+    economic = get_user_by_username(economic_owner) if economic_owner else legal
+    acc = create_account(
+        legal.id, economic.id, account_name, broker,
+        market.upper(), account_type,
+    )
+    same = legal.id == economic.id
+    owner_label = legal.display_name if same else f"{legal.display_name} → {economic.display_name}"
+    ui.console.print(
+        f"[green][OK][/green] Account created: {acc.account_name} "
+        f"({acc.broker}, {acc.market}/{acc.currency}, owner: {owner_label}) "
+        f"[bold][ID: {acc.id}][/bold]"
+    )
+
+
+@account.command("list")
+@click.option("--legal", "legal_username", default=None, help="Filter by legal owner")
+@click.option("--economic", "economic_username", default=None,
+              help="Filter by economic owner（誰的錢）")
+def account_list(legal_username, economic_username):
+    """List accounts."""
+    from portfoliodb.services.account_service import iter_accounts
+    from portfoliodb.services.user_service import get_user, get_user_by_username
+
+    legal_id = get_user_by_username(legal_username).id if legal_username else None
+    economic_id = get_user_by_username(economic_username).id if economic_username else None
+
+    accounts = iter_accounts(legal_owner_id=legal_id, economic_owner_id=economic_id)
+
+    user_cache = {}
+    def name_of(uid):
+        if uid not in user_cache:
+            user_cache[uid] = get_user(uid).display_name
+        return user_cache[uid]
+
+    ui.print_table("Accounts", _ACCOUNT_COLUMNS, (
+        (
+            str(a.id),
+            name_of(a.legal_owner_id),
+            name_of(a.economic_owner_id),
+            a.account_name, a.broker, a.market, a.currency, a.account_type,
+        )
+        for a in accounts
+    ), empty="No accounts found.")
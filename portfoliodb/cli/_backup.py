@@ -0,0 +1,78 @@
+"""`backup` command group."""
+
+from datetime import datetime
+
+import click
+
+from portfoliodb.cli import _ui as ui
+
+
+# ─── backup commands ─────────────────────────────────────────────────
+
+@click.group(invoke_without_command=True)
+@click.pass_context
+def backup(ctx):
+    """Off-machine DB cold backup (Dropbox). Bare `backup` snapshots now."""
+    if ctx.invoked_subcommand is not None:
+        return
+    from portfoliodb.backup import create_backup
+    from portfoliodb.db import DB_PATH
+    path = create_backup()
+    if path is None:
+        ui.console.print("[yellow]No database found; nothing to back up.[/yellow]")
+        ui.console.print(f"[dim]Expected at: {DB_PATH}[/dim]")
+        return
+    ui.console.print(
+        f"[green][OK][/green] Backup created: {path.name} "
+        f"({path.stat().st_size:,} bytes)"
+    )
+    ui.console.print(f"[dim]{path.parent}[/dim]")
+
+
+@backup.command("list")
+def backup_list():
+    """List available cold backups (newest first)."""
+    from portfoliodb.backup import list_backups, backup_dir
+    items = list_backups()
+    if not items:
+        ui.console.print(f"[yellow]No backups in {backup_dir()}[/yellow]")
+        return
+    table = ui.Table(title=f"Backups in {backup_dir()} ({len(items)})")
+    table.add_column("File")
+    table.add_column("Size", justify="right")
+    table.add_column("Modified")
+    for p in items:
+        st = p.stat()
+        table.add_row(
+            p.name,
+            f"{st.st_size:,}",
+            datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M"),
+        )
+    ui.console.print(table)
+
+
+@backup.command("restore")
+@click.argument("filename", required=False)
+@click.option("--force", is_flag=True,
+              help="Overwrite existing DB (current DB saved to pre-restore copy first)")
+def backup_restore(filename, force):
+    """Restore a backup into the live DB. No FILENAME = newest backup."""
+    from portfoliodb.backup import list_backups, restore_backup, backup_dir
+    if filename is None:
+        items = list_backups()
+        if not items:
+            ui.console.print(f"[red]No backups available in {backup_dir()}[/red]")
+            return
+        src = items[0]
+        ui.console.print(f"[dim]No file given; using newest: {src.name}[/dim]")
+    else:
+        src = backup_dir() / filename
+    try:
+        dest = restore_backup(src, force=force)
+    except FileExistsError as e:
+        ui.console.print(f"[red]Refused:[/red] {e}")
+        return
+    except FileNotFoundError as e:
+        ui.console.print(f"[red]Not found:[/red] {e}")
+        return
+    ui.console.print(f"[green][OK][/green] Restored {src.name} → {dest}")
@@ -0,0 +1,87 @@
+"""`cash` command group."""
+
+import click
+
+from portfoliodb.cli import _ui as ui
+from portfoliodb.utils.constants import CURRENCIES
+from portfoliodb.utils.formatting import format_currency
+
+_CCY_CHOICE = click.Choice(sorted(CURRENCIES), case_sensitive=False)
+
+# ─── cash commands ───────────────────────────────────────────────────
+
+@click.group()
+def cash():
+    """Cash position management."""
+    pass
+
+
+@cash.command("set")
+@click.argument("account_id", type=int)
+@click.argument("currency", type=_CCY_CHOICE)
+@click.argument("amount", type=float)
+@ui.safe
+def cash_set(account_id, currency, amount):
+    """Set cash balance directly. Example: cash set 1 TWD 500000"""
+    from portfoliodb.services.cash_service import set_cash
+    from portfoliodb.services.account_service import get_account
+    acc = get_account(account_id)
+    cp = set_cash(account_id, currency.upper(), amount)
+    ui.console.print(
+        f"[green][OK][/green] Cash set: {format_currency(cp.balance, cp.currency)} "
+        f"in {acc.account_name}"
+    )
+
+
+@cash.command("deposit")
+@click.argument("account_id", type=int)
+@click.argument("currency", type=_CCY_CHOICE)
+@click.argument("amount", type=float)
+@click.option("--date", "executed_at", default=None, help="Date (YYYY-MM-DD)")
+@click.option("--desc", "description", default=None, help="Description")
+@ui.safe
+def cash_deposit(account_id, currency, amount, executed_at, description):
+    """Deposit cash into account."""
+    from portfoliodb.services.cash_service import record_cash_transaction
+    ct = record_cash_transaction(
+        account_id, currency.upper(), abs(amount), "DEPOSIT", description, executed_at
+    )
+    ui.console.print(
+        f"[green][OK][/green] Deposited {format_currency(abs(amount), currency.upper())}"
+    )
+
+
+@cash.command("withdraw")
+@click.argument("account_id", type=int)
+@click.argument("currency", type=_CCY_CHOICE)
+@click.argument("amount", type=float)
+@click.option("--date", "executed_at", default=None, help="Date (YYYY-MM-DD)")
+@click.option("--desc", "description", default=None, help="Description")
+@ui.safe
+def cash_withdraw(account_id, currency, amount, executed_at, description):
+    """Withdraw cash from account."""
+    from portfoliodb.services.cash_service import record_cash_transaction
+    ct = record_cash_transaction(
+        account_id, currency.upper(), -abs(amount), "WITHDRAWAL", description, executed_at
+    )
+    ui.console.print(
+        f"[green][OK][/green] Withdrew {format_currency(abs(amount), currency.upper())}"
+    )
+
+
+@cash.command("list")
+@click.argument("account_id", type=int)
+def cash_list(account_id):
+    """List cash positions in an account."""
+    from portfoliodb.services.cash_service import list_cash
+    from portfoliodb.services.account_service import get_account
+
+    acc = get_account(account_id)
+    positions = list_cash(account_id)
+    if not positions:
+        ui.console.print(f"No cash in account {acc.account_name}.")
+        return
+
+    ui.print_small_table(f"Cash - {acc.account_name}", ui.CASH_COLUMNS, (
+        (cp.currency, format_currency(cp.balance, cp.currency)) for cp in positions
+    ))
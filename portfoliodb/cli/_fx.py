@@ -0,0 +1,45 @@
+"""`fx` command group."""
+
+import click
+
+from portfoliodb.cli import _ui as ui
+
+_RATE_COLUMNS = (
+    ("Currency", {"style": "bold"}),
+    ("Rate", {"justify": "right"}),
+)
+
+
+# ─── fx commands ─────────────────────────────────────────────────────
+
+@click.group()
+def fx():
+    """Exchange rate utilities."""
+    pass
+
+
+@fx.command("rate")
+@click.argument("from_currency")
+@click.argument("to_currency")
+@ui.safe
+def fx_rate(from_currency, to_currency):
+    """Show exchange rate. Example: fx rate USD TWD"""
+    from portfoliodb.services.fx_service import fetch_rate
+    from portfoliodb.db import init_db
+    init_db()
+    rate = fetch_rate(from_currency, to_currency)
+    ui.console.print(f"{from_currency.upper()}/{to_currency.upper()} = {rate:.4f}")
+
+
+@fx.command("rates")
+@click.option("--base", "base_currency", default="TWD", help="Base currency")
+@ui.safe
+def fx_rates(base_currency):
+    """Show all exchange rates to base currency."""
+    from portfoliodb.services.fx_service import get_all_rates
+    from portfoliodb.db import init_db
+    init_db()
+    rates = get_all_rates(base_currency.upper())
+    ui.print_small_table(f"Exchange Rates (to {base_currency.upper()})", _RATE_COLUMNS, (
+        (curr, f"{rate:.4f}") for curr, rate in sorted(rates.items())
+    ))
@@ -0,0 +1,66 @@
+"""`holding` command group."""
+
+from functools import partial
+
+import click
+
+from portfoliodb.cli import _ui as ui
+from portfoliodb.utils.formatting import format_currency, format_shares
+
+_HOLDING_COLUMNS = (
+    ("Ticker", {"style": "bold"}),
+    ("Shares", {"justify": "right"}),
+    ("Avg Cost", {"justify": "right"}),
+)
+
+
+# ─── holding commands ────────────────────────────────────────────────
+
+@click.group()
+def holding():
+    """Holdings management."""
+    pass
+
+
+@holding.command("add")
+@click.argument("account_id", type=int)
+@click.argument("ticker")
+@click.argument("shares", type=float)
+@click.argument("avg_cost", type=float)
+@ui.safe
+def holding_add(account_id, ticker, shares, avg_cost):
+    """Import a holding. Example: holding add 1 2330.TW 1000 580.5"""
+    from portfoliodb.services.holding_service import add_holding
+    from portfoliodb.services.account_service import get_account
+    acc = get_account(account_id)
+    h = add_holding(account_id, ticker, shares, avg_cost)
+    ui.console.print(
+        f"[green][OK][/green] Added: {h.ticker} x {format_shares(h.shares)} shares "
+        f"@ {format_currency(h.avg_cost, acc.currency)} avg cost"
+    )
+
+
+@holding.command("list")
+@click.argument("account_id", type=int)
+def holding_list(account_id):
+    """List holdings in an account."""
+    from portfoliodb.services.holding_service import iter_holdings
+    from portfoliodb.services.account_service import get_account
+
+    acc = get_account(account_id)
+    fs = partial(format_shares, market=acc.market)
+    fc = partial(format_currency, currency=acc.currency)
+    ui.print_table(f"Holdings - {acc.account_name}", _HOLDING_COLUMNS, (
+        (h.ticker, fs(h.shares), fc(h.avg_cost)) for h in iter_holdings(account_id)
+    ), empty=f"No holdings in account {acc.account_name}.")
+
+
+@holding.command("remove")
+@click.argument("account_id", type=int)
+@click.argument("ticker")
+@ui.safe
+def holding_remove(account_id, ticker):
+    """Remove a holding from an account."""
+    from portfoliodb.services.holding_service import remove_holding
+    remove_holding(account_id, ticker)
+    ui.console.print(f"[green][OK][/green] Removed {ticker.upper()} from account {account_id}")
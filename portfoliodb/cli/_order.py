@@ -0,0 +1,200 @@
+"""`order` command group."""
+
+import click
+
+from portfoliodb.cli import _ui as ui
+from portfoliodb.utils.formatting import format_shares
+
+_PRIORITY_CHOICE = click.Choice(["HIGH", "NORMAL", "LOW"], case_sensitive=False)
+_ORDER_STATUS_CHOICE = click.Choice(["PENDING", "EXECUTED", "CANCELLED", "ALL"], case_sensitive=False)
+
+_ORDER_COLUMNS = (
+    ("ID", {"style": "cyan"}),
+    ("Ticker", {"style": "bold"}),
+    ("Action", {}),
+    ("Shares", {"justify": "right"}),
+    ("Target Price", {"justify": "right"}),
+    ("Priority", {}),
+    ("Status", {}),
+    ("Reason", {}),
+)
+
+
+# ─── order commands ──────────────────────────────────────────────────
+
+@click.group()
+def order():
+    """Planned orders management."""
+    pass
+
+
+@order.command("add", context_settings={"ignore_unknown_options": True})
+@click.argument("account_id", type=int)
+@click.argument("ticker")
+@click.argument("shares", type=str)
+@click.option("--price", "target_price", type=float, default=None, help="Target price")
+@click.option("--reason", default=None, help="Reason for this order")
+@click.option("--priority", default="NORMAL",
+              type=_PRIORITY_CHOICE)
+@ui.safe
+def order_add(account_id, ticker, shares, target_price, reason, priority):
+    """Create a planned order. SHARES = signed shorthand (+N buy, -N sell) or 'buy N'/'sell N'.
+
+    Examples:
+      order add 3 2330 +1000 --price 1180 --reason "AI 加碼"
+      order add 1 2383 -1000 --price 5400 --reason "trim"
+      order add 1 2383 sell 1000 --price 5400   (alternative for shells eating leading -)
+    """
+    from portfoliodb.services.order_service import create_order
+    import sys
+    s = shares.strip().lower()
+    action = None
+    n = None
+    if s.startswith("+"):
+        action, n = "BUY", float(s[1:])
+    elif s.startswith("-") and len(s) > 1 and s[1].isdigit():
+        action, n = "SELL", float(s[1:])
+    elif s in ("buy", "sell", "b", "s"):
+        # legacy explicit form: "buy 1000" / "sell 500" — next positional is shares
+        # Click consumed shares as the keyword、real shares 在 sys.argv 下一個
+        # 不過 click 沒幫我 capture、要 fallback: read sys.argv directly
+        try:
+            idx = sys.argv.index(shares)
+            n = float(sys.argv[idx + 1])
+            action = "BUY" if s.startswith("b") else "SELL"
+        except (ValueError, IndexError):
+            ui.console.print(f"[red][ERROR][/red] usage: order add <account_id> <ticker> buy|sell <shares>")
+            return
+    else:
+        ui.console.print(f"[red][ERROR][/red] SHARES must be '+1000' (buy), '-500' (sell), or 'buy 1000'/'sell 500'")
+        return
+    o = create_order(account_id, ticker, action, n, target_price, reason, priority)
+    price_str = f"@ {o.target_price:,.2f}" if o.target_price else "@ market"
+    sign = "+" if o.action == "BUY" else "-"
+    ui.console.print(
+        f"[green][OK][/green] Planned order [bold][ID: {o.id}][/bold]: "
+        f"{o.ticker} {sign}{format_shares(o.shares)} {price_str} "
+        f"({o.priority}{', ' + o.reason if o.reason else ''})"
+    )
+
+
+@order.command("list")
+@click.option("--account", "account_id", type=int, default=None, help="Filter by account")
+@click.option("--status", default="PENDING",
+              type=_ORDER_STATUS_CHOICE)
+def order_list(account_id, status):
+    """List planned orders."""
+    from portfoliodb.services.order_service import list_orders
+
+    status_filter = None if status == "ALL" else status
+    orders = list_orders(account_id=account_id, status=status_filter)
+    if not orders:
+        ui.console.print("No orders found.")
+        return
+
+    Text, action_style, status_style = ui.Text, ui.ACTION_STYLE.get, ui.STATUS_STYLE.get
+    ui.print_table("Planned Orders", _ORDER_COLUMNS, (
+        (
+            str(o.id), o.ticker,
+            Text(o.action, style=action_style(o.action, "red")),
+            f"{o.shares:,.2f}",
+            f"{o.target_price:,.2f}" if o.target_price else "market",
+            o.priority,
+            Text(o.status, style=status_style(o.status, "white")),
+            o.reason or "",
+        )
+        for o in orders
+    ))
+
+
+@order.command("execute")
+@click.argument("order_id", type=int)
+@click.argument("actual_price", type=float)
+@click.option("--fee", default=0.0, help="Commission/fee")
+@click.option("--tax", default=0.0, help="Transaction tax")
+@ui.safe
+def order_execute(order_id, actual_price, fee, tax):
+    """Execute a planned order at actual price."""
+    from portfoliodb.services.order_service import execute_order
+    o = execute_order(order_id, actual_price, fee, tax)
+    ui.console.print(
+        f"[green][OK][/green] Order #{o.id} executed: "
+        f"{o.action} {format_shares(o.shares)} shares {o.ticker} @ {actual_price:,.2f}"
+    )
+
+
+@order.command("cancel")
+@click.argument("order_id", type=int)
+@ui.safe
+def order_cancel(order_id):
+    """Cancel a pending planned order."""
+    from portfoliodb.services.order_service import cancel_order
+    o = cancel_order(order_id)
+    ui.console.print(f"[green][OK][/green] Order #{o.id} cancelled")
+
+
+@order.command("review")
+@click.option("--since", "since_days", type=int, default=180,
+              help="Look back N days (default 180)")
+def order_review(since_days):
+    """Retrospective stats — counts, lag, repeated tickers, unexecuted outcomes."""
+    from portfoliodb.services.order_service import review_orders
+    from portfoliodb.services.price_service import fetch_prices
+
+    r = review_orders(since_days=since_days)
+    ui.console.print()
+    ui.console.rule(f"[bold] Order Review — past {r['since_days']} days [/bold]")
+
+    c = r["counts"]
+    ui.console.print(f"\n[bold]Counts[/bold]: total={c['total']}  "
+                  f"PENDING=[yellow]{c['PENDING']}[/yellow]  "
+                  f"EXECUTED=[green]{c['EXECUTED']}[/green]  "
+                  f"CANCELLED=[dim]{c['CANCELLED']}[/dim]")
+
+    if r["execution_lag"]:
+        ui.console.print(f"\n[bold]Execution lag (create → execute)[/bold]")
+        t = ui.Table()
+        t.add_column("Order ID"); t.add_column("Ticker")
+        t.add_column("Days", justify="right")
+        for e in r["execution_lag"]:
+            t.add_row(str(e["order_id"]), e["ticker"], f"{e['days']:.1f}")
+        ui.console.print(t)
+
+    if r["repeated_tickers"]:
+        ui.console.print(f"\n[bold]反覆出現的個股[/bold]（心裡惦記但未必下手）")
+        for ticker, count in r["repeated_tickers"]:
+            ui.console.print(f"  {ticker}: {count} 次")
+
+    if r["unexecuted"]:
+        ui.console.print(f"\n[bold]未執行 plan + 當前股價對照[/bold]")
+        tickers = list({o["ticker"] for o in r["unexecuted"]})
+        prices = fetch_prices(tickers) if tickers else {}
+        t = ui.Table()
+        t.add_column("ID"); t.add_column("Ticker"); t.add_column("Action")
+        t.add_column("Shares", justify="right"); t.add_column("Target", justify="right")
+        t.add_column("現價", justify="right"); t.add_column("Status"); t.add_column("Reason")
+        for o in r["unexecuted"]:
+            cur = prices.get(o["ticker"], {}).get("price")
+            cur_str = f"{cur:.2f}" if cur is not None else "—"
+            target_str = f"{o['target_price']:.2f}" if o["target_price"] else "market"
+            t.add_row(
+                str(o["id"]), o["ticker"], o["action"],
+                f"{o['shares']:,.0f}", target_str, cur_str,
+                f"[dim]{o['status']}[/dim]", o["reason"] or "",
+            )
+        ui.console.print(t)
+
+        # Data-quality warnings (e.g. yfinance returned no quote) — surfaced
+        # so a missing price is flagged rather than hidden, but kept out of
+        # the main table so it doesn't disrupt the price-alignment scan.
+        warnings = [
+            (k, v.get("warning"))
+            for k, v in prices.items()
+            if v.get("warning")
+        ]
+        if warnings:
+            joined = "、".join(f"{tk} ({w})" for tk, w in warnings)
+            ui.console.print(f"[dim]Data warnings: {joined}[/dim]")
+
+    if c["total"] == 0:
+        ui.console.print("\n[dim]無 order data 可 review。先用 `order add` 寫幾個 plan、累積 data。[/dim]")
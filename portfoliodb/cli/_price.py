@@ -0,0 +1,73 @@
+"""`price` command group."""
+
+import click
+
+from portfoliodb.cli import _ui as ui
+from portfoliodb.utils.formatting import format_currency
+
+
+# ─── price commands ──────────────────────────────────────────────────
+
+@click.group()
+def price():
+    """Stock price utilities."""
+    pass
+
+
+@price.command("get")
+@click.argument("ticker")
+@ui.safe
+def price_get(ticker):
+    """Fetch current price for a ticker."""
+    from portfoliodb.services.price_service import fetch_price
+    from portfoliodb.db import init_db
+    init_db()  # Ensure DB exists for cache
+    p = fetch_price(ticker)
+    cached_tag = " [dim](cached)[/dim]" if p["cached"] else ""
+    ui.console.print(
+        f"{ticker.upper()}: {format_currency(p['price'], p['currency'])}{cached_tag}"
+    )
+
+
+@price.command("batch")
+@click.argument("tickers", nargs=-1)
+def price_batch(tickers):
+    """Fetch prices for multiple tickers. Example: price batch 2330.TW AAPL NVDA"""
+    from portfoliodb.services.price_service import fetch_prices_iter
+    from portfoliodb.db import init_db
+    if not tickers:
+        ui.console.print("Provide at least one ticker.")
+        return
+
+    init_db()
+    table = ui.Table(title="Stock Prices")
+    table.add_column("Ticker", style="bold")
+    table.add_column("Price", justify="right")
+    table.add_column("Currency")
+    table.add_column("Status")
+    # Rows are added as quotes arrive (completion order, not argument order).
+    stream = fetch_prices_iter(list(tickers))
+    if not ui.console.is_terminal:
+        # Nothing to animate when piped, and Live's non-terminal fallback
+        # leaves the final render without a trailing newline.
+        for ticker, info in stream:
+            _add_price_row(table, ticker, info)
+        ui.console.print(table)
+        return
+    from rich.live import Live
+    with Live(table, console=ui.console, refresh_per_second=4) as live:
+        for ticker, info in stream:
+            _add_price_row(table, ticker, info)
+            live.refresh()
+
+
+def _add_price_row(table, ticker, info):
+    if info.get("price") is not None:
+        table.add_row(
+            ticker,
+            format_currency(info["price"], info["currency"]),
+            info["currency"],
+            "[dim]cached[/dim]" if info.get("cached") else "[green]live[/green]",
+        )
+    else:
+        table.add_row(ticker, "-", "-", f"[red]{info.get('error', 'unknown')}[/red]")
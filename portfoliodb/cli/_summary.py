@@ -0,0 +1,277 @@
+"""`summary` command group."""
+
+from functools import partial
+
+import click
+
+from portfoliodb.cli import _ui as ui
+from portfoliodb.utils.formatting import (
+    PNL_COLORS, format_currency, format_pnl, format_percent, format_shares,
+)
+
+_HOLDING_COLUMNS = (
+    ("Ticker", {"style": "bold"}),
+    ("Shares", {"justify": "right"}),
+    ("Avg Cost", {"justify": "right"}),
+    ("Current", {"justify": "right"}),
+    ("Market Value", {"justify": "right"}),
+    ("P&L", {"justify": "right"}),
+    ("Return", {"justify": "right"}),
+)
+
+# One `summary user` holding line; filled with str.format per holding.
+_HOLDING_LINE = (
+    "    {ticker:12s} {shares:>10s} shares @ {avg:>12s} -> {cur:>12s}  "
+    "[{color}]{pnl:>12s} ({pct})[/{color}]"
+)
+
+
+# ─── summary commands ────────────────────────────────────────────────
+
+@click.group()
+def summary():
+    """Portfolio summaries."""
+    pass
+
+
+def _flush(lines):
+    """Print buffered markup lines with a single console.print call.
+
+    Each print re-runs Rich's markup/render pass, so the per-line output of
+    the summaries is collected into a list and written once.
+    """
+    ui.console.print("\n".join(lines))
+
+
+@summary.command("account")
+@click.argument("account_id", type=int)
+def summary_account(account_id):
+    """Show summary for a single account."""
+    from portfoliodb.services.portfolio_service import get_account_summary
+    from portfoliodb.db import init_db
+
+    init_db()
+    s = get_account_summary(account_id)
+    acc = s["account"]
+    curr = s["currency"]
+
+    ui.console.print()
+    ui.console.rule(f"[bold] Account: {acc.account_name} ({acc.broker}, {acc.market}/{curr}) [/bold]")
+
+    # Holdings table
+    if s["holdings"]:
+        # Loop-local bindings: the row loop calls these once per holding.
+        Text, fp, fpct, colors = ui.Text, format_pnl, format_percent, PNL_COLORS
+        fs = partial(format_shares, market=acc.market)
+        fc = partial(format_currency, currency=curr)
+        rows = []
+        append = rows.append
+        for hd in s["holdings"]:
+            h = hd["holding"]
+            price, pnl = hd["current_price"], hd["unrealized_pnl"]
+            if price is not None:
+                color = colors[(pnl > 0) - (pnl < 0) + 1]
+                append((
+                    h.ticker, fs(h.shares), fc(h.avg_cost), fc(price),
+                    fc(hd["market_value"]),
+                    Text(fp(pnl, curr), style=color),
+                    Text(fpct(hd["pnl_pct"]), style=color),
+                ))
+            else:
+                append((h.ticker, fs(h.shares), fc(h.avg_cost), "-", "-", "-", "-"))
+        ui.print_table("Holdings", _HOLDING_COLUMNS, rows)
+    else:
+        ui.console.print("[dim]No holdings[/dim]")
+
+    # Cash
+    if s["cash"]:
+        ui.console.print()
+        ui.print_table("Cash", ui.CASH_COLUMNS, (
+            (cp.currency, format_currency(cp.balance, cp.currency)) for cp in s["cash"]
+        ))
+
+    _flush([
+        "",
+        f"  Stock Value: [bold]{format_currency(s['total_stock_value'], curr)}[/bold]",
+        f"  Cash Value:  [bold]{format_currency(s['total_cash_value'], curr)}[/bold]",
+        f"  [bold]Total:       {format_currency(s['total_value'], curr)}[/bold]",
+        "",
+    ])
+
+
+@summary.command("user")
+@click.argument("username")
+@click.option("--currency", "base_currency", default="TWD", help="Base currency for conversion")
+def summary_user(username, base_currency):
+    """Show summary for all accounts of a user."""
+    from portfoliodb.services.portfolio_service import get_user_summary
+    from portfoliodb.db import init_db
+
+    init_db()
+    s = get_user_summary(username, base_currency.upper())
+
+    ui.console.print()
+    ui.console.rule(f"[bold] {s['user'].display_name} ({s['user'].username}) [/bold]")
+
+    lines = []
+    fp, fpct, colors, holding_line = format_pnl, format_percent, PNL_COLORS, _HOLDING_LINE.format
+    for acc_s in s["accounts"]:
+        acc = acc_s["account"]
+        curr = acc_s["currency"]
+        lines.append("")
+        lines.append(
+            f"  [bold]{acc.account_name}[/bold] ({acc.broker}, {acc.market}) "
+            f"- Total: {format_currency(acc_s['total_value'], curr)}"
+        )
+        if curr != base_currency.upper():
+            lines.append(
+                f"    Converted: {format_currency(acc_s['converted_total'], base_currency.upper())} "
+                f"(rate: {acc_s['fx_rate']:.4f})"
+            )
+
+        fs = partial(format_shares, market=acc.market)
+        fc = partial(format_currency, currency=curr)
+        priced = acc_s["priced"]
+        lines += [
+            holding_line(
+                ticker=ticker, shares=fs(shares), avg=fc(avg), cur=fc(price),
+                color=colors[(pnl > 0) - (pnl < 0) + 1], pnl=fp(pnl, curr), pct=fpct(pct),
+            )
+            for ticker, shares, avg, price, pnl, pct in zip(
+                priced["ticker"], priced["shares"], priced["avg_cost"],
+                priced["current_price"], priced["unrealized_pnl"], priced["pnl_pct"],
+            )
+        ]
+
+    lines += [
+        "",
+        f"  [bold]Grand Total: {format_currency(s['grand_total'], base_currency.upper())}[/bold]",
+        "",
+    ]
+    _flush(lines)
+
+
+@summary.command("all")
+@click.option("--currency", "base_currency", default="TWD", help="Base currency for conversion")
+def summary_all(base_currency):
+    """Show summary across ALL users."""
+    from portfoliodb.services.portfolio_service import get_total_summary
+    from portfoliodb.db import init_db
+
+    init_db()
+    s = get_total_summary(base_currency.upper())
+
+    ui.console.print()
+    ui.console.rule("[bold] Portfolio Overview - All Users [/bold]")
+
+    lines = []
+    fc = format_currency
+    for user_s in s["users"]:
+        lines.append("")
+        lines.append(
+            f"  [bold]{user_s['user'].display_name}[/bold]: "
+            f"{format_currency(user_s['grand_total'], base_currency.upper())}"
+        )
+        for acc_s in user_s["accounts"]:
+            acc = acc_s["account"]
+            lines.append(
+                f"    {acc.account_name:20s} {fc(acc_s['total_value'], acc_s['currency']):>15s} "
+                f"({acc_s['currency']})"
+            )
+
+    lines += [
+        "",
+        f"  [bold]Grand Total: {format_currency(s['grand_total'], base_currency.upper())}[/bold]",
+        "",
+    ]
+    _flush(lines)
+
+
+@summary.command("breakdown")
+@click.option("--currency", "base_currency", default="TWD", help="Base currency")
+def summary_breakdown(base_currency):
+    """Family-wide breakdown: every position + multi-dim aggregations."""
+    from portfoliodb.services.portfolio_service import get_family_breakdown
+    from portfoliodb.db import init_db
+
+    init_db()
+    base = base_currency.upper()
+    s = get_family_breakdown(base)
+    total = s["grand_total"]
+
+    ui.console.print()
+    ui.console.rule(f"[bold] Family Portfolio Breakdown ({base}) [/bold]")
+    ui.console.print(
+        f"  總資產: [bold]{format_currency(total, base)}[/bold]   "
+        f"FX: " + ", ".join(f"{c}={r:.4f}" for c, r in s["fx_rates"].items() if c != base)
+    )
+
+    labels = {
+        "by_economic_owner": "經濟所有人",
+        "by_legal_owner":    "法律名義人",
+        "by_type":           "資產類別 (stock/cash)",
+        "by_currency":       "幣別",
+        "by_market":         "市場",
+        "by_broker":         "券商/銀行",
+        "by_account_type":   "帳戶類型",
+        "by_ticker":         "個股 concentration",
+    }
+    pending_intents = s.get("pending_intents", {})
+    fc = format_currency
+    for key, label in labels.items():
+        t = ui.Table(title=f"by {label}", show_header=True, header_style="bold")
+        t.add_column("項目")
+        t.add_column(f"{base} 市值", justify="right")
+        t.add_column("%", justify="right")
+        # Annotate ticker rows with pending order intent (per Athena ship list 2026-05-26)
+        if key == "by_ticker":
+            t.add_column("intent")
+        for k, v in s["aggregations"][key].items():
+            pct = v / total * 100 if total else 0
+            if key == "by_ticker":
+                intent = " / ".join(pending_intents.get(str(k).upper(), [])) or ""
+                t.add_row(str(k), fc(v, base), f"{pct:.1f}%", intent)
+            else:
+                t.add_row(str(k), fc(v, base), f"{pct:.1f}%")
+        ui.console.print(t)
+
+    flat = ui.Table(
+        title="Flat positions (every holding + cash, sorted by base-currency value)",
+        show_header=True, header_style="bold",
+    )
+    flat.add_column("#", justify="right", no_wrap=True)
+    flat.add_column("類別", no_wrap=True)
+    flat.add_column("標的", no_wrap=True)
+    flat.add_column("股數", justify="right", no_wrap=True)
+    flat.add_column("均價", justify="right", no_wrap=True)
+    flat.add_column("現價", justify="right", no_wrap=True)
+    flat.add_column("幣", no_wrap=True)
+    flat.add_column("原幣市值", justify="right", no_wrap=True)
+    flat.add_column(f"{base} 市值", justify="right", no_wrap=True)
+    flat.add_column("%", justify="right", no_wrap=True)
+    flat.add_column("帳戶", no_wrap=True)
+    flat.add_column("econ", no_wrap=True)
+
+    for i, p in enumerate(s["positions"], 1):
+        flat.add_row(
+            str(i),
+            "股票" if p["type"] == "stock" else "現金",
+            p["ticker"],
+            f"{p['shares']:,.4f}" if p["shares"] is not None else "",
+            f"{p['avg_cost']:.4f}" if p["avg_cost"] is not None else "",
+            f"{p['current_price']:.2f}" if p["current_price"] is not None else "",
+            p["currency"],
+            fc(p["mv_local"], p["currency"]),
+            fc(p["mv_base"], base),
+            f"{p['weight']:.1f}%",
+            p["account_name"],
+            p["economic_owner"],
+        )
+    # Use a wider console for the flat table so columns don't get truncated.
+    # (Plain, non-terminal output never truncates.)
+    if ui.console.is_terminal:
+        from rich.console import Console
+        Console(width=200, **ui.CONSOLE_OPTIONS).print(flat)
+    else:
+        ui.console.print(flat)
+    ui.console.print()
@@ -0,0 +1,164 @@
+"""`sync` command group (broker API + CSV import)."""
+
+import click
+
+from portfoliodb.cli import _ui as ui
+from portfoliodb.utils.formatting import format_currency
+
+_BROKER_CHOICE = click.Choice(["sinopac", "fubon"])
+
+
+# ─── sync commands (broker API + CSV import) ─────────────────────────
+
+@click.group()
+def sync():
+    """Sync data from brokers and CSV files."""
+    pass
+
+
+@sync.command("sinopac")
+@click.argument("account_id", type=int)
+@ui.safe
+def sync_sinopac_cmd(account_id):
+    """Sync holdings & cash from SinoPac (永豐金) via Shioaji API."""
+    from portfoliodb.services.sync_service import sync_sinopac
+    try:
+        ui.console.print("Connecting to SinoPac (永豐金)...")
+        result = sync_sinopac(account_id)
+        h = result["holdings"]
+        ui.console.print(
+            f"[green][OK][/green] SinoPac sync complete: "
+            f"{h['added']} added, {h['updated']} updated, {h['removed']} removed"
+        )
+        if result["cash_synced"]:
+            ui.console.print("[green][OK][/green] Cash balance synced")
+    except ImportError as e:
+        ui.console.print(f"[red][ERROR][/red] {e}")
+        ui.console.print("Install with: [bold]pip install shioaji[speed][/bold]")
+    except FileNotFoundError as e:
+        from portfoliodb.brokers.config import CREDENTIALS_PATH
+        ui.console.print(f"[red][ERROR][/red] {e}")
+        ui.console.print(
+            f"\nCreate credentials file at:\n  {CREDENTIALS_PATH}\n"
+            "\nFormat:\n"
+            '  {"sinopac": {"api_key": "...", "secret_key": "...", '
+            '"ca_path": "...", "ca_password": "..."}}'
+        )
+
+
+@sync.command("fubon")
+@click.argument("account_id", type=int)
+@ui.safe
+def sync_fubon_cmd(account_id):
+    """Sync holdings & cash from Fubon (富邦) via Neo API."""
+    from portfoliodb.services.sync_service import sync_fubon
+    try:
+        ui.console.print("Connecting to Fubon (富邦)...")
+        result = sync_fubon(account_id)
+        h = result["holdings"]
+        ui.console.print(
+            f"[green][OK][/green] Fubon sync complete: "
+            f"{h['added']} added, {h['updated']} updated, {h['removed']} removed"
+        )
+        if result["cash_synced"]:
+            ui.console.print("[green][OK][/green] Cash balance synced")
+    except ImportError as e:
+        ui.console.print(f"[red][ERROR][/red] {e}")
+    except FileNotFoundError as e:
+        from portfoliodb.brokers.config import CREDENTIALS_PATH
+        ui.console.print(f"[red][ERROR][/red] {e}")
+        ui.console.print(
+            f"\nCreate credentials file at:\n  {CREDENTIALS_PATH}\n"
+            "\nFormat:\n"
+            '  {"fubon": {"user_id": "...", "password": "...", '
+            '"pfx_path": "...", "pfx_password": "..."}}'
+        )
+
+
+@sync.command("firstrade")
+@click.argument("account_id", type=int)
+@click.argument("csv_path", type=click.Path(exists=True))
+@ui.safe
+def sync_firstrade_cmd(account_id, csv_path):
+    """Import holdings & cash from Firstrade CSV file.
+
+    Download CSV from: Firstrade > Accounts > Tax Center > Excel CSV Files
+    """
+    from portfoliodb.services.sync_service import import_firstrade_csv
+    result = import_firstrade_csv(account_id, csv_path)
+    ui.console.print(
+        f"[green][OK][/green] Firstrade import complete: "
+        f"{result['holdings_imported']} holdings, "
+        f"{result['transactions_count']} transactions parsed"
+    )
+    ui.console.print(f"[green][OK][/green] Cash balance set from CSV")
+
+
+@sync.command("scb")
+@click.argument("account_id", type=int)
+@click.argument("csv_path", type=click.Path(exists=True))
+@ui.safe
+def sync_scb_cmd(account_id, csv_path):
+    """Import cash balance from Standard Chartered SG CSV file.
+
+    Download CSV from: SCB Online Banking > Account > Download & Print > CSV
+    """
+    from portfoliodb.services.sync_service import import_scb_csv
+    result = import_scb_csv(account_id, csv_path)
+    ui.console.print(
+        f"[green][OK][/green] SCB import complete: "
+        f"cash {format_currency(result['cash_balance'], result['currency'])}, "
+        f"{result['transactions_count']} transactions parsed"
+    )
+
+
+@sync.command("credentials")
+@click.argument("broker", type=_BROKER_CHOICE)
+def sync_credentials(broker):
+    """Setup or check API credentials for a broker."""
+    from portfoliodb.brokers.config import has_credentials, CREDENTIALS_PATH, CREDENTIALS_DIR
+
+    if has_credentials(broker):
+        ui.console.print(f"[green][OK][/green] Credentials found for {broker}")
+    else:
+        ui.console.print(f"[yellow]No credentials for {broker}[/yellow]")
+        ui.console.print(f"\nCreate the file at:\n  {CREDENTIALS_PATH}")
+
+        if broker == "sinopac":
+            ui.console.print(
+                '\nFormat:\n'
+                '{\n'
+                '  "sinopac": {\n'
+                '    "api_key": "YOUR_API_KEY",\n'
+                '    "secret_key": "YOUR_SECRET_KEY",\n'
+                '    "ca_path": "C:/path/to/Sinopac.pfx",\n'
+                '    "ca_password": "YOUR_ID_NUMBER"\n'
+                '  }\n'
+                '}'
+            )
+            ui.console.print(
+                "\n[bold]How to get API access:[/bold]\n"
+                "  1. Visit SinoPac branch to sign API risk disclosure\n"
+                "  2. Apply for API Key at https://www.sinotrade.com.tw\n"
+                "  3. Download Sinopac.pfx certificate\n"
+                "  4. Docs: https://sinotrade.github.io/"
+            )
+        elif broker == "fubon":
+            ui.console.print(
+                '\nFormat:\n'
+                '{\n'
+                '  "fubon": {\n'
+                '    "user_id": "YOUR_USER_ID",\n'
+                '    "password": "YOUR_PASSWORD",\n'
+                '    "pfx_path": "C:/path/to/fubon_cert.pfx",\n'
+                '    "pfx_password": "YOUR_PFX_PASSWORD"\n'
+                '  }\n'
+                '}'
+            )
+            ui.console.print(
+                "\n[bold]How to get API access:[/bold]\n"
+                "  1. Apply at https://www.fbs.com.tw/TradeAPI/\n"
+                "  2. Download certificate via CATool\n"
+                "  3. Download fubon_neo .whl and install\n"
+                "  4. Docs: https://www.fbs.com.tw/TradeAPI/en/docs/"
+            )
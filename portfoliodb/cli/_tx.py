@@ -0,0 +1,93 @@
+"""`tx` command group."""
+
+import click
+
+from portfoliodb.cli import _ui as ui
+from portfoliodb.utils.formatting import format_currency, format_shares
+
+_TX_COLUMNS = (
+    ("ID", {"style": "cyan"}),
+    ("Date", {}),
+    ("Action", {}),
+    ("Ticker", {"style": "bold"}),
+    ("Shares", {"justify": "right"}),
+    ("Price", {"justify": "right"}),
+    ("Fee", {"justify": "right"}),
+    ("Tax", {"justify": "right"}),
+    ("Note", {}),
+)
+
+
+# ─── transaction commands ────────────────────────────────────────────
+
+@click.group()
+def tx():
+    """Transaction management (buy/sell)."""
+    pass
+
+
+@tx.command("buy")
+@click.argument("account_id", type=int)
+@click.argument("ticker")
+@click.argument("shares", type=float)
+@click.argument("price", type=float)
+@click.option("--fee", default=0.0, help="Commission/fee")
+@click.option("--tax", default=0.0, help="Transaction tax")
+@click.option("--date", "executed_at", default=None, help="Trade date (YYYY-MM-DD)")
+@click.option("--note", "notes", default=None, help="Optional note")
+@ui.safe
+def tx_buy(account_id, ticker, shares, price, fee, tax, executed_at, notes):
+    """Record a BUY transaction."""
+    from portfoliodb.services.transaction_service import record_transaction
+    t = record_transaction(account_id, ticker, "BUY", shares, price, fee, tax, executed_at, notes)
+    total = shares * price + fee + tax
+    ui.console.print(
+        f"[green][OK][/green] BUY: {format_shares(shares)} shares of {t.ticker} "
+        f"@ {format_currency(price, t.currency)} "
+        f"(total: {format_currency(total, t.currency)})"
+    )
+
+
+@tx.command("sell")
+@click.argument("account_id", type=int)
+@click.argument("ticker")
+@click.argument("shares", type=float)
+@click.argument("price", type=float)
+@click.option("--fee", default=0.0, help="Commission/fee")
+@click.option("--tax", default=0.0, help="Transaction tax")
+@click.option("--date", "executed_at", default=None, help="Trade date (YYYY-MM-DD)")
+@click.option("--note", "notes", default=None, help="Optional note")
+@ui.safe
+def tx_sell(account_id, ticker, shares, price, fee, tax, executed_at, notes):
+    """Record a SELL transaction."""
+    from portfoliodb.services.transaction_service import record_transaction
+    t = record_transaction(account_id, ticker, "SELL", shares, price, fee, tax, executed_at, notes)
+    total = shares * price - fee - tax
+    ui.console.print(
+        f"[green][OK][/green] SELL: {format_shares(shares)} shares of {t.ticker} "
+        f"@ {format_currency(price, t.currency)} "
+        f"(net: {format_currency(total, t.currency)})"
+    )
+
+
+@tx.command("list")
+@click.option("--account", "account_id", type=int, default=None, help="Filter by account ID")
+@click.option("--ticker", default=None, help="Filter by ticker")
+@click.option("--limit", default=20, help="Max records to show")
+def tx_list(account_id, ticker, limit):
+    """List transaction history."""
+    from portfoliodb.services.transaction_service import iter_transactions
+
+    txns = iter_transactions(account_id=account_id, ticker=ticker, limit=limit)
+    Text, action_style = ui.Text, ui.ACTION_STYLE.get
+    ui.print_table("Transactions", _TX_COLUMNS, (
+        (
+            str(t.id), t.executed_at,
+            Text(t.action, style=action_style(t.action, "red")),
+            t.ticker,
+            f"{t.shares:,.2f}", f"{t.price:,.2f}",
+            f"{t.fee:,.2f}", f"{t.tax:,.2f}",
+            t.notes or "",
+        )
+        for t in txns
+    ), empty="No transactions found.")
@@ -0,0 +1,205 @@
+"""Output objects shared by every command module.
+
+Rich is imported on first use (PEP 562 module ``__getattr__``), so commands
+reach these through the module — ``ui.console.print(...)``, ``ui.Table(...)``
+— rather than binding them at import time.
+
+When stdout is not a terminal (piped to a file, ``grep``, cron mail) Rich is
+not imported at all: ``console``, ``Table`` and ``Text`` resolve to the plain
+stand-ins at the bottom of this module, which strip markup and print tables
+as space-aligned columns.
+"""
+
+import functools
+import re
+import sys
+import unicodedata
+
+# Console settings for all CLI output. Auto-highlighting (a regex pass over
+# every printed string and table cell) only recolours numbers and dates here,
+# and :emoji: substitution has nothing to match in our output.
+CONSOLE_OPTIONS = {"highlight": False, "emoji": False}
+
+# Cell styles for list tables. Rows pass ``ui.Text(value, style=...)`` instead
+# of inline ``[green]...[/green]`` markup, which Rich would re-parse per cell.
+ACTION_STYLE = {"BUY": "green", "SELL": "red"}
+STATUS_STYLE = {"PENDING": "yellow", "EXECUTED": "green", "CANCELLED": "dim"}
+
+# Column specs for print_table(): ``(header, add_column kwargs)``. Shared by
+# `cash list` and `summary account`.
+CASH_COLUMNS = (
+    ("Currency", {"style": "bold"}),
+    ("Balance", {"justify": "right"}),
+)
+
+
+def __getattr__(name):
+    if name in ("console", "Table", "Text") and not sys.stdout.isatty():
+        value = {"console": _PlainConsole(), "Table": _PlainTable, "Text": _plain_text}[name]
+    elif name == "console":
+        from rich.console import Console
+        value = Console(**CONSOLE_OPTIONS)
+    elif name == "Table":
+        from rich.table import Table as value
+    elif name == "Text":
+        from rich.text import Text as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+# Attribute access on the module object goes through __getattr__ above;
+# bare names inside this module's functions would not.
+_self = sys.modules[__name__]
+
+
+def safe(fn):
+    """Report any exception from a command as one ``[ERROR]`` line.
+
+    Goes directly above the ``def`` (below the click decorators). Commands
+    that print extra hints for specific errors keep their own ``except``
+    clauses for those; everything else falls through to here.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            _self.console.print(f"[red][ERROR][/red] {e}")
+    return wrapper
+
+
+def print_table(title, columns, rows, empty=None):
+    """Build a Table from ``(header, add_column kwargs)`` specs and print it.
+
+    ``rows`` may be any iterable, including a generator over a DB cursor.
+    If it turns out to be empty and ``empty`` is given, that message is
+    printed instead of an empty table.
+    """
+    table = _self.Table(title=title)
+    for header, kwargs in columns:
+        table.add_column(header, **kwargs)
+    for row in rows:
+        table.add_row(*row)
+    if not table.row_count and empty is not None:
+        _self.console.print(empty)
+        return
+    _self.console.print(table)
+
+
+def print_small_table(title, columns, rows, threshold=5):
+    """print_table() for tables that are usually a handful of rows.
+
+    Up to ``threshold`` rows on a terminal — and always when output is piped —
+    it prints space-aligned columns under a bold title instead of laying out
+    a bordered Table. Cells must be plain strings.
+    """
+    rows = list(rows)
+    if len(rows) > threshold and _self.console.is_terminal:
+        print_table(title, columns, rows)
+        return
+    header = tuple(h for h, _ in columns)
+    right = [kw.get("justify") == "right" for _, kw in columns]
+    _self.console.print(title, style="bold", markup=False)
+    _self.console.print("\n".join(_aligned_lines(header, rows, right)), markup=False)
+
+
+def _aligned_lines(header, rows, right):
+    """Header + rows as space-separated columns, each padded to its widest cell."""
+    table = (header, *rows)
+    widths = [max(_cell_width(r[i]) for r in table) for i in range(len(header))]
+    return [
+        "  ".join(
+            _pad(cell, w, r) for cell, w, r in zip(row, widths, right)
+        ).rstrip()
+        for row in table
+    ]
+
+
+def _cell_width(text):
+    """Terminal columns taken by ``text`` (CJK wide/fullwidth chars count 2)."""
+    return sum(2 if unicodedata.east_asian_width(c) in "WF" else 1 for c in text)
+
+
+def _pad(text, width, right):
+    fill = " " * (width - _cell_width(text))
+    return fill + text if right else text + fill
+
+
+# ─── non-terminal stand-ins ──────────────────────────────────────────
+
+# Rich's markup tag syntax: a tag opens with a lowercase letter, '#', '/' or
+# '@', so literals such as "[OK]", "[ERROR]" or "[ID: 3]" are left alone.
+_MARKUP = re.compile(r"\[[a-z#/@][^\[\]]*\]")
+
+
+def _strip_markup(text):
+    return _MARKUP.sub("", text)
+
+
+def _plain_text(text="", style=None, **_):
+    """Text() stand-in: styles are dropped, so the cell is just the string."""
+    return text
+
+
+class _PlainTable:
+    """Table() stand-in collecting headers and rows for _PlainConsole.
+
+    Accepts (and ignores) Rich's styling keywords so command code can build
+    tables the same way in both modes.
+    """
+
+    def __init__(self, title=None, **_):
+        self.title = title
+        self.headers = []
+        self.right = []
+        self.rows = []
+
+    def add_column(self, header="", justify="left", **_):
+        self.headers.append(header)
+        self.right.append(justify == "right")
+
+    def add_row(self, *cells):
+        cells = [_strip_markup(str(c)) for c in cells]
+        cells += [""] * (len(self.headers) - len(cells))
+        self.rows.append(cells)
+
+    @property
+    def row_count(self):
+        return len(self.rows)
+
+    def render(self):
+        lines = _aligned_lines(self.headers, self.rows, self.right)
+        if self.title:
+            lines.insert(0, _strip_markup(self.title))
+        return "\n".join(lines)
+
+
+class _PlainConsole:
+    """Console() stand-in that writes straight to stdout.
+
+    Covers the subset of the Console API the commands use: print() with
+    markup stripped and rule() drawn as a plain 80-column line.
+    """
+
+    is_terminal = False
+    width = 80
+
+    def print(self, *objects, sep=" ", end="\n", markup=True, **_):
+        parts = []
+        for obj in objects:
+            if isinstance(obj, _PlainTable):
+                parts.append(obj.render())
+            else:
+                parts.append(_strip_markup(str(obj)) if markup else str(obj))
+        sys.stdout.write(sep.join(parts) + end)
+
+    def rule(self, title="", **_):
+        title = _strip_markup(title).strip()
+        if not title:
+            sys.stdout.write("─" * self.width + "\n")
+            return
+        fill = max(self.width - _cell_width(title) - 2, 2)
+        left = fill // 2
+        sys.stdout.write(f"{'─' * left} {title} {'─' * (fill - left)}\n")
@@ -0,0 +1,45 @@
+"""`user` command group."""
+
+import click
+
+from portfoliodb.cli import _ui as ui
+
+_USER_COLUMNS = (
+    ("ID", {"style": "cyan"}),
+    ("Username", {"style": "bold"}),
+    ("Display Name", {}),
+    ("Created", {}),
+)
+
+
+# ─── user commands ───────────────────────────────────────────────────
+
+@click.group()
+def user():
+    """User management."""
+    pass
+
+
+@user.command("add")
+@click.argument("username")
+@click.argument("display_name")
+@ui.safe
+def user_add(username, display_name):
+    """Create a new user."""
+    from portfoliodb.services.user_service import create_user
+    u = create_user(username, display_name)
+    ui.console.print(f"[green][OK][/green] User created: {u.username} ({u.display_name})")
+
+
+@user.command("list")
+def user_list():
+    """List all users."""
+    from portfoliodb.services.user_service import list_users
+    users = list_users()
+    if not users:
+        ui.console.print("No users found. Use [bold]user add[/bold] to create one.")
+        return
+
+    ui.print_small_table("Users", _USER_COLUMNS, (
+        (str(u.id), u.username, u.display_name, u.created_at) for u in users
+    ))
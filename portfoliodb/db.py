@@ -2,8 +2,9 @@
 
 import platform
 import sqlite3
+import threading
 from pathlib import Path
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 
 
 def _app_dir() -> Path:
@@ -190,9 +191,11 @@ CREATE TABLE IF NOT EXISTS company_aliases (
 -- "literal duplicate" (Spock, 2026-07-08 follow-up review).
 -- Note: method_version was added via `ALTER TABLE ... ADD COLUMN` on the
 -- already-deployed prod table, so its physical column position there is
--- last (after created_at), not third as declared below — harmless since
--- every read/write in this codebase goes by column name, never position,
--- but worth knowing before "fixing" the declared order for cosmetic reasons.
+-- last (after created_at), not third as declared below. Harmless: Ranking
+-- reads rows by column name, and every other model's queries name their
+-- columns ({Model.COLUMNS}) rather than relying on the physical order of
+-- SELECT * — but worth knowing before "fixing" the declared order for
+-- cosmetic reasons.
 CREATE TABLE IF NOT EXISTS rankings (
     id             INTEGER PRIMARY KEY AUTOINCREMENT,
     ticker         TEXT    NOT NULL,
@@ -206,33 +209,156 @@ CREATE TABLE IF NOT EXISTS rankings (
     created_at     TEXT    NOT NULL DEFAULT (datetime('now')),
     UNIQUE(ticker, method, score_date)
 );
+
+-- Lookup indexes for the hot list/filter queries. cash_positions and
+-- holdings need none: their UNIQUE(account_id, ...) already is one.
+CREATE INDEX IF NOT EXISTS idx_accounts_legal_active    ON accounts(legal_owner_id, is_active);
+CREATE INDEX IF NOT EXISTS idx_accounts_economic_active ON accounts(economic_owner_id, is_active);
+CREATE INDEX IF NOT EXISTS idx_tx_account_date          ON transactions(account_id, executed_at);
+CREATE INDEX IF NOT EXISTS idx_tx_ticker_date           ON transactions(ticker, executed_at);
+CREATE INDEX IF NOT EXISTS idx_tx_date                  ON transactions(executed_at);
+CREATE INDEX IF NOT EXISTS idx_cashtx_account_date      ON cash_transactions(account_id, executed_at);
 """
 
 
+# One connection per thread, opened on first use and reused by every later
+# get_connection() on that thread. Connecting and running the PRAGMAs cost
+# more than most of the single-row queries the services issue.
+_local = threading.local()
+
+# Per-connection settings. journal_mode is not here: WAL is recorded in the
+# DB file itself, so _thread_connection() only switches it on once per file.
+_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    # In WAL mode NORMAL skips the fsync on every COMMIT (the WAL is synced
+    # at checkpoint instead). A power cut can lose the last few commits but
+    # cannot corrupt the DB.
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    # Read pages through a memory map instead of a read() call per page, and
+    # keep up to 64 MiB of them cached (negative cache_size is in KiB). The
+    # connection lives for the process, so the cache survives across calls.
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+)
+
+
+def _thread_connection() -> sqlite3.Connection:
+    """This thread's connection to DB_PATH, (re)opened if DB_PATH moved."""
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != DB_PATH:
+        if conn is not None:
+            conn.close()
+        # isolation_level=None: get_connection() issues BEGIN/COMMIT itself.
+        # timeout: busy_timeout, how long BEGIN IMMEDIATE / COMMIT wait on
+        # another writer before raising "database is locked" (the sqlite3
+        # default, spelled out because the write paths rely on it).
+        # cached_statements: the connection lives for the whole process, and
+        # the IN (?, ?, ...) cache lookups add one statement per list length,
+        # so allow more than the default 128 prepared statements.
+        conn = sqlite3.connect(str(DB_PATH), isolation_level=None, timeout=5.0,
+                               cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        if conn.execute("PRAGMA journal_mode").fetchone()[0] != "wal":
+            conn.execute("PRAGMA journal_mode = WAL")
+        _local.conn, _local.path, _local.depth = conn, DB_PATH, 0
+    return conn
+
+
+def close_connection() -> None:
+    """Close this thread's cached connection (e.g. before replacing the DB file)."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+
 @contextmanager
-def get_connection():
+def get_connection(immediate: bool = False):
     """Get a database connection with auto-commit/rollback.
 
+    The outermost block on a thread runs in a BEGIN/COMMIT transaction;
+    blocks nested inside it (a service called while another holds the
+    connection) get a SAVEPOINT, so an error in the inner block only undoes
+    the inner block's writes.
+
+    immediate=True starts the outermost transaction with BEGIN IMMEDIATE,
+    taking the write lock before the first read. Use it for blocks that read
+    and then write: a deferred transaction that has read can't be upgraded
+    once another connection has committed, and fails with SQLITE_BUSY rather
+    than waiting. Nested blocks ignore it (the outer BEGIN already decided).
+
     Usage:
         with get_connection() as conn:
             conn.execute("INSERT INTO ...")
     """
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("PRAGMA journal_mode = WAL")
+    conn = _thread_connection()
+    depth = _local.depth
+    if depth == 0:
+        conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    else:
+        conn.execute(f"SAVEPOINT sp{depth}")
+    _local.depth = depth + 1
     try:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
+    except BaseException:
+        if conn.in_transaction:
+            if depth == 0:
+                conn.execute("ROLLBACK")
+            else:
+                conn.execute(f"ROLLBACK TO sp{depth}")
+                conn.execute(f"RELEASE sp{depth}")
         raise
+    else:
+        # The block may have ended the transaction itself (dry-run rollback).
+        if conn.in_transaction:
+            conn.execute("COMMIT" if depth == 0 else f"RELEASE sp{depth}")
     finally:
-        conn.close()
+        _local.depth = depth
+
+
+def use_connection(conn: sqlite3.Connection | None = None):
+    """`with use_connection(conn) as c:` — the caller's open connection, else get_connection().
+
+    For read helpers that take an optional `conn`: a caller already inside a
+    `with get_connection()` block passes its connection through and the read
+    joins that transaction instead of opening a nested SAVEPOINT.
+    """
+    return get_connection() if conn is None else nullcontext(conn)
+
+
+# The services read back inserted/updated rows with INSERT/UPDATE ...
+# RETURNING, added in SQLite 3.35.
+_MIN_SQLITE_VERSION = (3, 35, 0)
+
+# DB_PATH that init_db() last ran the schema script against. Keyed by path
+# rather than a bare flag so a redirected DB_PATH (tests) still gets its schema.
+_INITIALIZED_PATH = None
 
 
 def init_db():
-    """Create the database directory and all tables."""
+    """Create the database directory and all tables (once per process per DB)."""
+    global _INITIALIZED_PATH
+    if _INITIALIZED_PATH == DB_PATH:
+        return
+    if sqlite3.sqlite_version_info < _MIN_SQLITE_VERSION:
+        raise RuntimeError(
+            f"SQLite {sqlite3.sqlite_version} is too old: PortfolioDB needs "
+            f"{'.'.join(map(str, _MIN_SQLITE_VERSION))}+ (for RETURNING)"
+        )
     DB_DIR.mkdir(parents=True, exist_ok=True)
     with get_connection() as conn:
-        conn.executescript(SCHEMA_SQL)
+        # executescript() commits the open transaction and then runs each
+        # statement in autocommit mode, one commit per CREATE. Re-open the
+        # transaction inside the script so the schema (and the ANALYZE below)
+        # land in get_connection()'s single COMMIT.
+        conn.executescript("BEGIN;\n" + SCHEMA_SQL)
+        # Gather planner statistics once per DB file so the indexes above get
+        # picked; sqlite_stat1 only exists after the first ANALYZE.
+        if conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone() is None:
+            conn.execute("ANALYZE")
+    _INITIALIZED_PATH = DB_PATH
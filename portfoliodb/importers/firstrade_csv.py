@@ -15,8 +15,60 @@ Notes:
 """
 
 import csv
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from datetime import datetime
+
+# Deleted from number cells before float(): thousands commas, stray quotes
+# and whitespace. One translate() pass instead of a replace/strip chain.
+_NUMBER_JUNK = str.maketrans("", "", ', \t\r\n"')
+
+# Cash-movement row types → (category, sign of amount, append symbol to
+# description). BUY/SELL are handled separately; anything else is skipped.
+_CASH_TYPES = {
+    "DIVIDEND":        ("DIVIDEND", 1, True),
+    "INTEREST":        ("INTEREST", 1, True),
+    "DEPOSIT":         ("DEPOSIT", 1, False),
+    "ACH DEPOSIT":     ("DEPOSIT", 1, False),
+    "WIRE DEPOSIT":    ("DEPOSIT", 1, False),
+    "WITHDRAWAL":      ("WITHDRAWAL", -1, False),
+    "ACH WITHDRAWAL":  ("WITHDRAWAL", -1, False),
+    "WIRE WITHDRAWAL": ("WITHDRAWAL", -1, False),
+    "FEE":             ("FEE", -1, True),
+}
+
+
+@lru_cache(maxsize=1024)
+def _iso_date(date_str: str) -> str | None:
+    """MM/DD/YYYY (or already-ISO YYYY-MM-DD) → YYYY-MM-DD; None if unparseable.
+
+    Cached (bounded) because a history file repeats the same few hundred
+    trading days.
+    Both fast paths avoid strptime, which dominates a per-row parse; it is
+    only the fallback for odd shapes such as an unpadded 2026-1-6.
+    """
+    parts = date_str.split("/")
+    if (len(parts) == 3 and all(p.isdigit() for p in parts)
+            and len(parts[0]) <= 2 and len(parts[1]) <= 2 and len(parts[2]) == 4):
+        try:
+            return date(int(parts[2]), int(parts[0]), int(parts[1])).isoformat()
+        except ValueError:
+            return None
+    try:
+        if len(date_str) == 10 and date_str[4] == date_str[7] == "-":
+            date.fromisoformat(date_str)
+        else:
+            datetime.strptime(date_str, "%Y-%m-%d")
+    except ValueError:
+        return None
+    return date_str
+
+
+def _number(value: str | None) -> float:
+    """Parse a CSV number that may carry thousands separators; blank → 0.0."""
+    value = (value or "").translate(_NUMBER_JUNK)
+    return float(value) if value else 0.0
 
 
 def parse_firstrade_csv(file_path: str) -> dict:
@@ -49,102 +101,70 @@ def parse_firstrade_csv(file_path: str) -> dict:
 
     transactions = []
     cash_movements = []
+    cash_types = _CASH_TYPES
+    trade_cash = 0.0  # - buys + sells, summed while parsing
 
     with open(path, "r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-
-        for row in reader:
-            # Clean amount field (remove commas from quoted values)
-            amount_str = row.get("Amount", "0").replace(",", "").strip()
-            amount = float(amount_str) if amount_str else 0.0
-
-            date_str = row.get("Date", "").strip()
+        for row in csv.DictReader(f):
+            date_str = (row.get("Date") or "").strip()
             if not date_str:
                 continue
+            date_iso = _iso_date(date_str)
+            if date_iso is None:
+                continue  # Skip unparseable rows
+
+            symbol = (row.get("Symbol") or "").strip().upper()
+            tx_type = (row.get("Type") or "").strip().upper()
+            amount = abs(_number(row.get("Amount")))
+
+            if tx_type in ("BUY", "SELL"):
+                if symbol:
+                    trade_cash += amount if tx_type == "SELL" else -amount
+                    transactions.append({
+                        "date": date_iso,
+                        "ticker": symbol,
+                        "action": tx_type,
+                        "shares": abs(_number(row.get("Quantity"))),
+                        "price": abs(_number(row.get("Price"))),
+                        "amount": amount,
+                    })
+                continue
 
-            # Convert MM/DD/YYYY to YYYY-MM-DD
-            try:
-                date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-                date_iso = date_obj.strftime("%Y-%m-%d")
-            except ValueError:
-                # Try other date formats
-                try:
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                    date_iso = date_str
-                except ValueError:
-                    continue  # Skip unparseable rows
-
-            symbol = row.get("Symbol", "").strip().upper()
-            tx_type = row.get("Type", "").strip().upper()
-            quantity_str = row.get("Quantity", "0").replace(",", "").strip()
-            quantity = float(quantity_str) if quantity_str else 0.0
-            price_str = row.get("Price", "0").replace(",", "").strip()
-            price = float(price_str) if price_str else 0.0
-
-            if tx_type in ("BUY", "SELL") and symbol:
-                transactions.append({
-                    "date": date_iso,
-                    "ticker": symbol,
-                    "action": tx_type,
-                    "shares": abs(quantity),
-                    "price": abs(price),
-                    "amount": abs(amount),
-                })
-            elif tx_type in ("DIVIDEND", "INTEREST"):
-                cash_movements.append({
-                    "date": date_iso,
-                    "category": tx_type,
-                    "amount": abs(amount),
-                    "description": f"{tx_type}" + (f" - {symbol}" if symbol else ""),
-                })
-            elif tx_type in ("DEPOSIT", "ACH DEPOSIT", "WIRE DEPOSIT"):
-                cash_movements.append({
-                    "date": date_iso,
-                    "category": "DEPOSIT",
-                    "amount": abs(amount),
-                    "description": tx_type,
-                })
-            elif tx_type in ("WITHDRAWAL", "ACH WITHDRAWAL", "WIRE WITHDRAWAL"):
-                cash_movements.append({
-                    "date": date_iso,
-                    "category": "WITHDRAWAL",
-                    "amount": -abs(amount),
-                    "description": tx_type,
-                })
-            elif tx_type == "FEE":
-                cash_movements.append({
-                    "date": date_iso,
-                    "category": "FEE",
-                    "amount": -abs(amount),
-                    "description": f"FEE" + (f" - {symbol}" if symbol else ""),
-                })
-
-    # Compute current holdings from transactions
-    holdings = {}
-    for tx in sorted(transactions, key=lambda x: x["date"]):
-        ticker = tx["ticker"]
-        if ticker not in holdings:
-            holdings[ticker] = {"shares": 0.0, "total_cost": 0.0}
-
-        if tx["action"] == "BUY":
-            holdings[ticker]["shares"] += tx["shares"]
-            holdings[ticker]["total_cost"] += tx["shares"] * tx["price"]
-        elif tx["action"] == "SELL":
-            holdings[ticker]["shares"] -= tx["shares"]
-            if holdings[ticker]["shares"] <= 0:
-                holdings[ticker] = {"shares": 0.0, "total_cost": 0.0}
-
-    # Remove tickers with 0 shares
-    holdings = {k: v for k, v in holdings.items() if v["shares"] > 0}
-
-    # Compute cash balance
-    cash_balance = sum(m["amount"] for m in cash_movements)
-    # Subtract stock purchases, add stock sales
-    for tx in transactions:
+            cash = cash_types.get(tx_type)
+            if cash is None:
+                continue
+            category, sign, with_symbol = cash
+            cash_movements.append({
+                "date": date_iso,
+                "category": category,
+                "amount": sign * amount,
+                "description": tx_type + (f" - {symbol}" if with_symbol and symbol else ""),
+            })
+
+    # Replay trades in date order. Per ticker: [shares, total_cost]; a sell
+    # that closes the position resets its cost basis.
+    positions = {}
+    for tx in sorted(transactions, key=itemgetter("date")):
+        pos = positions.get(tx["ticker"])
+        if pos is None:
+            pos = positions[tx["ticker"]] = [0.0, 0.0]
+        shares = tx["shares"]
         if tx["action"] == "BUY":
-            cash_balance -= tx["amount"]
-        elif tx["action"] == "SELL":
-            cash_balance += tx["amount"]
+            pos[0] += shares
+            pos[1] += shares * tx["price"]
+        else:  # SELL
+            pos[0] -= shares
+            if pos[0] <= 0:
+                pos[0] = pos[1] = 0.0
+
+    # Drop tickers with 0 shares
+    holdings = {
+        ticker: {"shares": shares, "total_cost": cost}
+        for ticker, (shares, cost) in positions.items() if shares > 0
+    }
+
+    # Cash balance: all cash movements, less purchases, plus sales
+    cash_balance = sum(m["amount"] for m in cash_movements) + trade_cash
 
     return {
         "transactions": transactions,
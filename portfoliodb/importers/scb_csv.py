@@ -21,8 +21,31 @@ Notes:
 """
 
 import csv
+from datetime import date
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from datetime import datetime
+
+_TOO_SHORT = "CSV file too short — expected at least 7 rows (5 header + header row + data)"
+
+# Stripped from every amount cell before float(): quotes and thousands commas.
+_AMOUNT_JUNK = str.maketrans("", "", '",')
+
+# Description keyword → cash category, checked in order: when a description
+# holds several keywords, the one listed first here wins.
+_CATEGORY_KEYWORDS = {
+    "INTEREST": "INTEREST",
+    "DIVIDEND": "DIVIDEND",
+    "WITHDRAWAL": "WITHDRAWAL",
+    "ATM": "WITHDRAWAL",
+    "DEPOSIT": "DEPOSIT",
+    "SALARY": "DEPOSIT",
+    "TRANSFER IN": "DEPOSIT",
+    "FEE": "FEE",
+    "CHARGE": "FEE",
+    "FX": "FX_CONVERSION",
+    "EXCHANGE": "FX_CONVERSION",
+}
 
 
 def parse_scb_csv(file_path: str) -> dict:
@@ -50,76 +73,72 @@ def parse_scb_csv(file_path: str) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"CSV file not found: {file_path}")
 
-    with open(path, "r", encoding="utf-8-sig") as f:
-        lines = f.readlines()
-
-    if len(lines) < 7:
-        raise ValueError("CSV file too short — expected at least 7 rows (5 header + header row + data)")
-
-    # Parse header metadata
-    account_name = lines[1].strip().strip('"')
-    account_number = lines[2].strip().strip('"')
-    currency = lines[3].strip().strip('"').upper()
-
-    # Parse balance from row 5
-    balance_parts = lines[4].strip().split(",")
-    current_balance = _parse_scb_amount(balance_parts[0]) if balance_parts else 0.0
-
-    # Parse data rows (skip first 5 header rows + column header row)
     transactions = []
     cash_movements = []
 
-    # Use csv reader for the data portion
-    data_lines = lines[5:]  # Skip metadata rows
-    reader = csv.DictReader(data_lines)
-
-    for row in reader:
-        date_str = row.get("Date", "").strip()
-        if not date_str:
-            continue
-
-        # Convert DD/MM/YYYY to YYYY-MM-DD
-        try:
-            date_obj = datetime.strptime(date_str, "%d/%m/%Y")
-            date_iso = date_obj.strftime("%Y-%m-%d")
-        except ValueError:
-            continue
-
-        description = row.get("Transaction", "").strip()
-        row_currency = row.get("Currency", currency).strip().upper()
-
-        deposit_str = row.get("Deposit", "").strip()
-        withdrawal_str = row.get("Withdrawal", "").strip()
-        balance_str = row.get("Running Balance", "").strip()
-
-        deposit = _parse_scb_amount(deposit_str) if deposit_str else 0.0
-        withdrawal = _parse_scb_amount(withdrawal_str) if withdrawal_str else 0.0
-        running_balance = _parse_scb_amount(balance_str) if balance_str else 0.0
-
-        # Determine amount (positive for deposit, negative for withdrawal)
-        if deposit > 0:
-            amount = deposit
-        elif withdrawal > 0:
-            amount = -withdrawal
-        else:
-            amount = 0.0
-
-        transactions.append({
-            "date": date_iso,
-            "description": description,
-            "currency": row_currency,
-            "amount": amount,
-            "balance": running_balance,
-        })
-
-        # Categorize for cash_movements
-        category = _categorize_scb_transaction(description)
-        cash_movements.append({
-            "date": date_iso,
-            "category": category,
-            "amount": amount,
-            "description": description,
-        })
+    # Stream the file: the 5 metadata rows come off the handle one by one and
+    # csv.DictReader reads the rest straight from it, no list of all lines.
+    with open(path, "r", encoding="utf-8-sig") as f:
+        meta = list(islice(f, 5))
+        if len(meta) < 5:
+            raise ValueError(_TOO_SHORT)
+
+        # Parse header metadata
+        account_name = meta[1].strip().strip('"')
+        account_number = meta[2].strip().strip('"')
+        currency = meta[3].strip().strip('"').upper()
+
+        # Parse balance from row 5. Go through csv: the quoted value carries its
+        # own thousands comma ("3,129.92 CR"), so a bare split(",") would cut it.
+        balance_parts = next(csv.reader([meta[4]]), [])
+        current_balance = _parse_scb_amount(balance_parts[0]) if balance_parts else 0.0
+
+        # Column header row + data rows
+        reader = csv.DictReader(f)
+
+        for row in reader:
+            date_str = row.get("Date", "").strip()
+            if not date_str:
+                continue
+
+            date_iso = _iso_date(date_str)
+            if date_iso is None:
+                continue
+
+            description = row.get("Transaction", "").strip()
+            row_currency = row.get("Currency", currency).strip().upper()
+
+            deposit = _parse_scb_amount(row.get("Deposit") or "")
+            withdrawal = _parse_scb_amount(row.get("Withdrawal") or "")
+            running_balance = _parse_scb_amount(row.get("Running Balance") or "")
+
+            # Determine amount (positive for deposit, negative for withdrawal)
+            if deposit > 0:
+                amount = deposit
+            elif withdrawal > 0:
+                amount = -withdrawal
+            else:
+                amount = 0.0
+
+            transactions.append({
+                "date": date_iso,
+                "description": description,
+                "currency": row_currency,
+                "amount": amount,
+                "balance": running_balance,
+            })
+
+            # Categorize for cash_movements
+            category = _categorize_scb_transaction(description)
+            cash_movements.append({
+                "date": date_iso,
+                "category": category,
+                "amount": amount,
+                "description": description,
+            })
+
+        if reader.line_num < 2:  # no column header or no data row
+            raise ValueError(_TOO_SHORT)
 
     return {
         "account_name": account_name,
@@ -131,31 +150,46 @@ def parse_scb_csv(file_path: str) -> dict:
     }
 
 
+@lru_cache(maxsize=1024)
+def _iso_date(date_str: str) -> str | None:
+    """DD/MM/YYYY → YYYY-MM-DD, or None if unparseable.
+
+    Cached (bounded, like the categorizer): a statement repeats each posting
+    date many times, and building the date directly skips strptime's format
+    parsing.
+    """
+    parts = date_str.split("/")
+    if (len(parts) != 3 or not all(p.isdigit() for p in parts)
+            or len(parts[0]) > 2 or len(parts[1]) > 2 or len(parts[2]) != 4):
+        return None
+    try:
+        return date(int(parts[2]), int(parts[1]), int(parts[0])).isoformat()
+    except ValueError:
+        return None
+
+
 def _parse_scb_amount(text: str) -> float:
-    """Parse SCB amount string like '"3,129.92 CR"' -> 3129.92"""
-    text = text.strip().strip('"').replace(",", "")
-    text = text.replace(" CR", "").replace(" DR", "")
+    """Parse SCB amount string like '"3,129.92 CR"' -> 3129.92 (blank -> 0.0)"""
+    text = text.translate(_AMOUNT_JUNK).replace(" CR", "").replace(" DR", "").strip()
+    if not text:
+        return 0.0
     try:
         return float(text)
     except ValueError:
         return 0.0
 
 
+@lru_cache(maxsize=1024)
 def _categorize_scb_transaction(description: str) -> str:
-    """Categorize an SCB transaction description."""
+    """Categorize an SCB transaction description.
+
+    Cached: statements repeat the same descriptions (salary, ATM, GIRO
+    payees) month after month. Bounded, because descriptions also carry
+    free-text payee and reference strings that never repeat.
+    """
     desc = description.upper()
-    if "INTEREST" in desc or "CR INTEREST" in desc:
-        return "INTEREST"
-    elif "DIVIDEND" in desc:
-        return "DIVIDEND"
-    elif "WITHDRAWAL" in desc or "ATM" in desc:
-        return "WITHDRAWAL"
-    elif "DEPOSIT" in desc or "SALARY" in desc or "TRANSFER IN" in desc:
-        return "DEPOSIT"
-    elif "FEE" in desc or "CHARGE" in desc:
-        return "FEE"
-    elif "FX" in desc or "EXCHANGE" in desc:
-        return "FX_CONVERSION"
-    else:
-        # Default: if amount is positive it's a deposit, negative is withdrawal
-        return "DEPOSIT"
+    for keyword, category in _CATEGORY_KEYWORDS.items():
+        if keyword in desc:
+            return category
+    # Default: if amount is positive it's a deposit, negative is withdrawal
+    return "DEPOSIT"
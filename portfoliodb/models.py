@@ -1,10 +1,21 @@
-"""Domain model dataclasses for PortfolioDB."""
+"""Domain model dataclasses for PortfolioDB.
 
-from dataclasses import dataclass
+Models are read-only snapshots of a row: services write through SQL and
+re-read, never by mutating an instance. They are slotted and frozen, so
+bulk listings don't carry a per-row __dict__.
+
+from_row unpacks a row by position. Each positional model carries COLUMNS,
+its field names as a SQL column list, and every query that feeds from_row
+selects (or RETURNs) `{Model.COLUMNS}`, never `*`: the physical column
+order of a hand-migrated or ALTER TABLE'd deployed DB need not match
+db.SCHEMA_SQL. Ranking predates COLUMNS and reads by name instead.
+"""
+
+from dataclasses import dataclass, fields
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class User:
     id: int
     username: str
@@ -13,15 +24,10 @@ class User:
 
     @classmethod
     def from_row(cls, row) -> "User":
-        return cls(
-            id=row["id"],
-            username=row["username"],
-            display_name=row["display_name"],
-            created_at=row["created_at"],
-        )
+        return cls(*row)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Account:
     id: int
     legal_owner_id: int
@@ -36,21 +42,11 @@ class Account:
 
     @classmethod
     def from_row(cls, row) -> "Account":
-        return cls(
-            id=row["id"],
-            legal_owner_id=row["legal_owner_id"],
-            economic_owner_id=row["economic_owner_id"],
-            account_name=row["account_name"],
-            broker=row["broker"],
-            market=row["market"],
-            currency=row["currency"],
-            account_type=row["account_type"],
-            is_active=bool(row["is_active"]),
-            created_at=row["created_at"],
-        )
+        *head, is_active, created_at = row
+        return cls(*head, bool(is_active), created_at)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Holding:
     id: int
     account_id: int
@@ -62,18 +58,10 @@ class Holding:
 
     @classmethod
     def from_row(cls, row) -> "Holding":
-        return cls(
-            id=row["id"],
-            account_id=row["account_id"],
-            ticker=row["ticker"],
-            shares=row["shares"],
-            avg_cost=row["avg_cost"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-        )
+        return cls(*row)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Transaction:
     id: int
     account_id: int
@@ -90,23 +78,10 @@ class Transaction:
 
     @classmethod
     def from_row(cls, row) -> "Transaction":
-        return cls(
-            id=row["id"],
-            account_id=row["account_id"],
-            ticker=row["ticker"],
-            action=row["action"],
-            shares=row["shares"],
-            price=row["price"],
-            fee=row["fee"],
-            tax=row["tax"],
-            currency=row["currency"],
-            notes=row["notes"],
-            executed_at=row["executed_at"],
-            created_at=row["created_at"],
-        )
+        return cls(*row)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CashPosition:
     id: int
     account_id: int
@@ -116,16 +91,10 @@ class CashPosition:
 
     @classmethod
     def from_row(cls, row) -> "CashPosition":
-        return cls(
-            id=row["id"],
-            account_id=row["account_id"],
-            currency=row["currency"],
-            balance=row["balance"],
-            updated_at=row["updated_at"],
-        )
+        return cls(*row)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CashTransaction:
     id: int
     account_id: int
@@ -138,19 +107,10 @@ class CashTransaction:
 
     @classmethod
     def from_row(cls, row) -> "CashTransaction":
-        return cls(
-            id=row["id"],
-            account_id=row["account_id"],
-            currency=row["currency"],
-            amount=row["amount"],
-            category=row["category"],
-            description=row["description"],
-            executed_at=row["executed_at"],
-            created_at=row["created_at"],
-        )
+        return cls(*row)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Ranking:
     id: int
     ticker: str
@@ -179,7 +139,7 @@ class Ranking:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlannedOrder:
     id: int
     account_id: int
@@ -196,17 +156,9 @@ class PlannedOrder:
 
     @classmethod
     def from_row(cls, row) -> "PlannedOrder":
-        return cls(
-            id=row["id"],
-            account_id=row["account_id"],
-            ticker=row["ticker"],
-            action=row["action"],
-            shares=row["shares"],
-            target_price=row["target_price"],
-            reason=row["reason"],
-            priority=row["priority"],
-            status=row["status"],
-            created_at=row["created_at"],
-            executed_at=row["executed_at"],
-            linked_transaction_id=row["linked_transaction_id"],
-        )
+        return cls(*row)
+
+
+for _model in (User, Account, Holding, Transaction, CashPosition, CashTransaction, PlannedOrder):
+    _model.COLUMNS = ", ".join(f.name for f in fields(_model))
+del _model
@@ -1,9 +1,23 @@
 """Account management: create, list, deactivate accounts."""
 
-from portfoliodb.db import get_connection
-from portfoliodb.models import Account
+from collections.abc import Iterator
+from itertools import groupby
+from operator import itemgetter
+
+from portfoliodb.db import get_connection, use_connection
+from portfoliodb.models import Account, CashPosition
 from portfoliodb.utils.constants import MARKETS, MARKET_CURRENCY, ACCOUNT_TYPES
 
+_GET_ACCOUNT_SQL = f"SELECT {Account.COLUMNS} FROM accounts WHERE id = ?"
+
+# list_accounts_with_cash: account columns, then the (possibly NULL) cash
+# position columns, each in model field order.
+_N_ACCOUNT_COLS = len(Account.COLUMNS.split(", "))
+_ACCOUNT_CASH_COLUMNS = ", ".join(
+    [f"a.{c}" for c in Account.COLUMNS.split(", ")]
+    + [f"cp.{c}" for c in CashPosition.COLUMNS.split(", ")]
+)
+
 
 def create_account(
     legal_owner_id: int,
@@ -32,24 +46,20 @@ def create_account(
     currency = MARKET_CURRENCY[market]
 
     with get_connection() as conn:
-        cursor = conn.execute(
-            """INSERT INTO accounts
+        row = conn.execute(
+            f"""INSERT INTO accounts
                  (legal_owner_id, economic_owner_id, account_name, broker, market, currency, account_type)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               RETURNING {Account.COLUMNS}""",
             (legal_owner_id, economic_owner_id, account_name, broker, market, currency, account_type),
-        )
-        row = conn.execute(
-            "SELECT * FROM accounts WHERE id = ?", (cursor.lastrowid,)
         ).fetchone()
         return Account.from_row(row)
 
 
-def get_account(account_id: int) -> Account:
+def get_account(account_id: int, conn=None) -> Account:
     """Get an account by ID. Raises if not found."""
-    with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM accounts WHERE id = ?", (account_id,)
-        ).fetchone()
+    with use_connection(conn) as conn:
+        row = conn.execute(_GET_ACCOUNT_SQL, (account_id,)).fetchone()
         if row is None:
             raise ValueError(f"Account ID {account_id} not found")
         return Account.from_row(row)
@@ -58,20 +68,69 @@ def get_account(account_id: int) -> Account:
 def list_accounts(
     legal_owner_id: int = None,
     economic_owner_id: int = None,
+    conn=None,
 ) -> list[Account]:
     """List accounts, optionally filtered by legal or economic owner."""
-    clauses = ["is_active = 1"]
+    return list(iter_accounts(legal_owner_id, economic_owner_id, conn))
+
+
+def iter_accounts(
+    legal_owner_id: int = None,
+    economic_owner_id: int = None,
+    conn=None,
+) -> Iterator[Account]:
+    """Yield accounts one at a time (lazy list_accounts).
+
+    Rows are all fetched, and the connection block left, before the first
+    yield. A generator suspended inside the block would hold its BEGIN open:
+    a write made meanwhile would nest in it as a savepoint and be rolled
+    back when the abandoned generator closes.
+    """
+    where, params = _active_accounts_where(legal_owner_id, economic_owner_id)
+    sql = f"SELECT {Account.COLUMNS} FROM accounts WHERE {where} ORDER BY id"
+    with use_connection(conn) as conn:
+        rows = conn.execute(sql, params).fetchall()
+    for r in rows:
+        yield Account.from_row(r)
+
+
+def list_accounts_with_cash(
+    legal_owner_id: int = None,
+    economic_owner_id: int = None,
+) -> list[tuple[Account, list[CashPosition]]]:
+    """list_accounts, each paired with its cash positions (ordered by currency).
+
+    One LEFT JOIN instead of list_accounts + a list_cash per account.
+    """
+    where, params = _active_accounts_where(legal_owner_id, economic_owner_id, "a.")
+    sql = (
+        f"SELECT {_ACCOUNT_CASH_COLUMNS} FROM accounts a "
+        f"LEFT JOIN cash_positions cp ON cp.account_id = a.id "
+        f"WHERE {where} ORDER BY a.id, cp.currency"
+    )
+    with get_connection() as conn:
+        rows = conn.execute(sql, params).fetchall()
+
+    result = []
+    for _, group in groupby(rows, itemgetter(0)):
+        group = list(group)
+        cash = [CashPosition.from_row(r[_N_ACCOUNT_COLS:]) for r in group
+                if r[_N_ACCOUNT_COLS] is not None]
+        result.append((Account.from_row(group[0][:_N_ACCOUNT_COLS]), cash))
+    return result
+
+
+def _active_accounts_where(legal_owner_id, economic_owner_id, alias: str = ""):
+    """WHERE clause + params shared by the account listings."""
+    clauses = [f"{alias}is_active = 1"]
     params: list = []
     if legal_owner_id is not None:
-        clauses.append("legal_owner_id = ?")
+        clauses.append(f"{alias}legal_owner_id = ?")
         params.append(legal_owner_id)
     if economic_owner_id is not None:
-        clauses.append("economic_owner_id = ?")
+        clauses.append(f"{alias}economic_owner_id = ?")
         params.append(economic_owner_id)
-    sql = f"SELECT * FROM accounts WHERE {' AND '.join(clauses)} ORDER BY id"
-    with get_connection() as conn:
-        rows = conn.execute(sql, params).fetchall()
-        return [Account.from_row(r) for r in rows]
+    return " AND ".join(clauses), params
 
 
 def deactivate_account(account_id: int) -> None:
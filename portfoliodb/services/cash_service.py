@@ -1,9 +1,13 @@
 """Cash position management: deposits, withdrawals, and balance tracking."""
 
-from portfoliodb.db import get_connection
+from portfoliodb.db import get_connection, use_connection
 from portfoliodb.models import CashPosition, CashTransaction
 from portfoliodb.utils.constants import CURRENCIES, CASH_CATEGORIES
 
+_GET_CASH_SQL = (
+    f"SELECT {CashPosition.COLUMNS} FROM cash_positions WHERE account_id = ? AND currency = ?"
+)
+
 
 def set_cash(account_id: int, currency: str, balance: float) -> CashPosition:
     """Set cash balance directly (for initial setup/import)."""
@@ -12,16 +16,13 @@ def set_cash(account_id: int, currency: str, balance: float) -> CashPosition:
         raise ValueError(f"Invalid currency '{currency}'. Must be one of: {', '.join(CURRENCIES)}")
 
     with get_connection() as conn:
-        conn.execute(
-            """INSERT INTO cash_positions (account_id, currency, balance)
+        row = conn.execute(
+            f"""INSERT INTO cash_positions (account_id, currency, balance)
                VALUES (?, ?, ?)
                ON CONFLICT(account_id, currency)
-               DO UPDATE SET balance = ?, updated_at = datetime('now')""",
+               DO UPDATE SET balance = ?, updated_at = datetime('now')
+               RETURNING {CashPosition.COLUMNS}""",
             (account_id, currency, balance, balance),
-        )
-        row = conn.execute(
-            "SELECT * FROM cash_positions WHERE account_id = ? AND currency = ?",
-            (account_id, currency),
         ).fetchone()
         return CashPosition.from_row(row)
 
@@ -31,44 +32,29 @@ def adjust_cash(conn, account_id: int, currency: str, amount: float) -> None:
 
     Takes a connection parameter to share DB transaction with transaction_service.
     """
-    currency = currency.upper()
-    existing = conn.execute(
-        "SELECT * FROM cash_positions WHERE account_id = ? AND currency = ?",
-        (account_id, currency),
-    ).fetchone()
-
-    if existing:
-        new_balance = existing["balance"] + amount
-        conn.execute(
-            """UPDATE cash_positions
-               SET balance = ?, updated_at = datetime('now')
-               WHERE account_id = ? AND currency = ?""",
-            (new_balance, account_id, currency),
-        )
-    else:
-        conn.execute(
-            """INSERT INTO cash_positions (account_id, currency, balance)
-               VALUES (?, ?, ?)""",
-            (account_id, currency, amount),
-        )
+    conn.execute(
+        """INSERT INTO cash_positions (account_id, currency, balance)
+           VALUES (?, ?, ?)
+           ON CONFLICT(account_id, currency)
+           DO UPDATE SET balance = cash_positions.balance + excluded.balance,
+                         updated_at = datetime('now')""",
+        (account_id, currency.upper(), amount),
+    )
 
 
-def get_cash(account_id: int, currency: str):
+def get_cash(account_id: int, currency: str, conn=None):
     """Get cash position for a specific currency. Returns None if not found."""
     currency = currency.upper()
-    with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM cash_positions WHERE account_id = ? AND currency = ?",
-            (account_id, currency),
-        ).fetchone()
+    with use_connection(conn) as conn:
+        row = conn.execute(_GET_CASH_SQL, (account_id, currency)).fetchone()
         return CashPosition.from_row(row) if row else None
 
 
-def list_cash(account_id: int) -> list[CashPosition]:
+def list_cash(account_id: int, conn=None) -> list[CashPosition]:
     """List all cash positions in an account."""
-    with get_connection() as conn:
+    with use_connection(conn) as conn:
         rows = conn.execute(
-            "SELECT * FROM cash_positions WHERE account_id = ? ORDER BY currency",
+            f"SELECT {CashPosition.COLUMNS} FROM cash_positions WHERE account_id = ? ORDER BY currency",
             (account_id,),
         ).fetchall()
         return [CashPosition.from_row(r) for r in rows]
@@ -102,21 +88,19 @@ def record_cash_transaction(
 
         # Record the cash transaction
         if use_raw:
-            cursor = conn.execute(
-                """INSERT INTO cash_transactions
+            row = conn.execute(
+                f"""INSERT INTO cash_transactions
                    (account_id, currency, amount, category, description, executed_at)
-                   VALUES (?, ?, ?, ?, ?, datetime('now'))""",
+                   VALUES (?, ?, ?, ?, ?, datetime('now'))
+                   RETURNING {CashTransaction.COLUMNS}""",
                 (account_id, currency, amount, category, description),
-            )
+            ).fetchone()
         else:
-            cursor = conn.execute(
-                """INSERT INTO cash_transactions
+            row = conn.execute(
+                f"""INSERT INTO cash_transactions
                    (account_id, currency, amount, category, description, executed_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   RETURNING {CashTransaction.COLUMNS}""",
                 (account_id, currency, amount, category, description, executed_at),
-            )
-
-        row = conn.execute(
-            "SELECT * FROM cash_transactions WHERE id = ?", (cursor.lastrowid,)
-        ).fetchone()
+            ).fetchone()
         return CashTransaction.from_row(row)
@@ -1,12 +1,18 @@
 """Exchange rate fetching and currency conversion."""
 
-from datetime import datetime, timedelta
+import calendar
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import yfinance as yf
 
+from portfoliodb import db as _db_mod
 from portfoliodb.db import get_connection
 from portfoliodb.utils.constants import fx_ticker, FX_CACHE_TTL_MINUTES, CURRENCIES
 
+# exchange_rates.fetched_at, as written by SQLite's datetime('now') (UTC).
+_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 
 def fetch_rate(from_currency: str, to_currency: str) -> float:
     """Fetch exchange rate, using cache if fresh.
@@ -18,23 +24,62 @@ def fetch_rate(from_currency: str, to_currency: str) -> float:
 
     if from_currency == to_currency:
         return 1.0
+    return _fresh_rates([from_currency], to_currency)[from_currency]
+
+
+# Process-local memo in front of the exchange_rates table: a summary asks for
+# the same rates once per account, and each ask would otherwise be a query.
+# (DB_PATH, from, to) -> (rate, expires_at as a time.time() value). DB_PATH
+# is read live, so a redirected DB never sees another file's rates. An entry
+# expires when its rate does: FX_CACHE_TTL_MINUTES after the cache row's
+# fetched_at (or after the quote, for a rate just fetched), so a memoized
+# rate is never older than the table would allow. _update_cache empties it.
+_RATE_MEMO: dict[tuple, tuple[float, float]] = {}
+
+
+def _fresh_rates(from_currencies: list[str], to_currency: str) -> dict[str, float]:
+    """Fresh {from_currency: rate} into to_currency for upper-cased codes.
+
+    Memo first, then one cache-table query, then concurrent live quotes for
+    what is still missing. Raises ValueError if any rate can't be fetched
+    (after caching the ones that could).
+    """
+    db_path, now = _db_mod.DB_PATH, time.time()
+    rates = {}
+    for curr in from_currencies:
+        hit = _RATE_MEMO.get((db_path, curr, to_currency))
+        if hit is not None and hit[1] > now:
+            rates[curr] = hit[0]
+    missing = [curr for curr in from_currencies if curr not in rates]
+    if not missing:
+        return rates
+
+    ttl = FX_CACHE_TTL_MINUTES * 60
+    memo = {}
+    for curr, (rate, fetched_at) in _get_cached_rates(missing, to_currency).items():
+        memo[curr] = (rate, calendar.timegm(time.strptime(fetched_at, _TS_FORMAT)) + ttl)
+    quote = [curr for curr in missing if curr not in memo]
+    if quote:
+        quoted_at = time.time()
+        memo.update(
+            (curr, (rate, quoted_at + ttl))
+            for curr, rate in _quote_rates(quote, to_currency).items()
+        )
+    for curr, entry in memo.items():
+        _RATE_MEMO[db_path, curr, to_currency] = entry
+        rates[curr] = entry[0]
+    return rates
 
-    # Check cache
-    cached = _get_cached_rate(from_currency, to_currency)
-    if cached is not None:
-        return cached
 
-    # Fetch from Yahoo Finance
+def _quote_rate(from_currency: str, to_currency: str) -> float:
+    """Live Yahoo Finance rate; no cache read or write."""
     ticker = fx_ticker(from_currency, to_currency)
     fx = yf.Ticker(ticker)
     info = fx.fast_info
     rate = info.get("lastPrice") or info.get("previousClose")
     if rate is None:
         raise ValueError(f"Could not fetch FX rate for {from_currency}/{to_currency}")
-
-    rate = float(rate)
-    _update_cache(from_currency, to_currency, rate)
-    return rate
+    return float(rate)
 
 
 def convert(amount: float, from_currency: str, to_currency: str) -> float:
@@ -46,43 +91,67 @@ def convert(amount: float, from_currency: str, to_currency: str) -> float:
 def get_all_rates(base_currency: str = "TWD") -> dict[str, float]:
     """Get exchange rates from all other currencies to the base currency.
 
+    Fresh cached rates come from one query; the rest are quoted concurrently
+    and cached in one transaction. Raises ValueError if any rate can't be
+    fetched (after caching the ones that could).
+
     Returns: {"USD": 31.58, "SGD": 24.92, "TWD": 1.0}
     """
     base_currency = base_currency.upper()
-    rates = {}
-    for curr in CURRENCIES:
-        if curr == base_currency:
-            rates[curr] = 1.0
-        else:
-            rates[curr] = fetch_rate(curr, base_currency)
+    rates = _fresh_rates([curr for curr in CURRENCIES if curr != base_currency], base_currency)
+    return {curr: 1.0 if curr == base_currency else rates[curr] for curr in CURRENCIES}
+
+
+def _quote_rates(from_currencies: list[str], to_currency: str) -> dict[str, float]:
+    """Quote several rates into one currency concurrently, then cache them."""
+    rates, error = {}, None
+    with ThreadPoolExecutor(max_workers=len(from_currencies)) as pool:
+        futures = {pool.submit(_quote_rate, curr, to_currency): curr for curr in from_currencies}
+        for fut in as_completed(futures):
+            try:
+                rates[futures[fut]] = fut.result()
+            except ValueError as e:
+                error = error or e
+    _update_cache([(curr, to_currency, rate) for curr, rate in rates.items()])
+    if error is not None:
+        raise error
     return rates
 
 
-def _get_cached_rate(from_currency: str, to_currency: str) -> float | None:
-    """Get cached rate if fresh enough."""
+def _get_cached_rates(
+    from_currencies: list[str], to_currency: str,
+) -> dict[str, tuple[float, str]]:
+    """{from_currency: (rate, fetched_at)} for the pairs into to_currency
+    with a fresh cache row."""
+    if not from_currencies:
+        return {}
     with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM exchange_rates WHERE from_currency = ? AND to_currency = ?",
-            (from_currency, to_currency),
-        ).fetchone()
-
-    if row is None:
-        return None
-
-    fetched_at = datetime.fromisoformat(row["fetched_at"])
-    if datetime.utcnow() - fetched_at > timedelta(minutes=FX_CACHE_TTL_MINUTES):
-        return None
-
-    return row["rate"]
-
-
-def _update_cache(from_currency: str, to_currency: str, rate: float) -> None:
-    """Insert or update cached exchange rate."""
+        rows = conn.execute(
+            "SELECT from_currency, rate, fetched_at FROM exchange_rates "
+            f"WHERE to_currency = ? AND from_currency IN ({', '.join('?' * len(from_currencies))})",
+            (to_currency, *from_currencies),
+        ).fetchall()
+
+    # fetched_at is datetime('now') text (UTC), which sorts chronologically;
+    # see price_service._fresh_prices.
+    cutoff = time.strftime(_TS_FORMAT, time.gmtime(time.time() - FX_CACHE_TTL_MINUTES * 60))
+    return {
+        row["from_currency"]: (row["rate"], row["fetched_at"])
+        for row in rows
+        if row["fetched_at"] >= cutoff  # else expired
+    }
+
+
+def _update_cache(rates: list[tuple[str, str, float]]) -> None:
+    """Insert or update cached exchange rates from (from, to, rate) tuples."""
+    if not rates:
+        return
+    _RATE_MEMO.clear()
     with get_connection() as conn:
-        conn.execute(
+        conn.executemany(
             """INSERT INTO exchange_rates (from_currency, to_currency, rate, fetched_at)
                VALUES (?, ?, ?, datetime('now'))
                ON CONFLICT(from_currency, to_currency)
-               DO UPDATE SET rate = ?, fetched_at = datetime('now')""",
-            (from_currency, to_currency, rate, rate),
+               DO UPDATE SET rate = excluded.rate, fetched_at = excluded.fetched_at""",
+            rates,
         )
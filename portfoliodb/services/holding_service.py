@@ -1,8 +1,23 @@
 """Holdings management: track stock positions per account."""
 
-from portfoliodb.db import get_connection
+from collections.abc import Iterator
+
+from portfoliodb.db import get_connection, use_connection
 from portfoliodb.models import Holding
 
+# Statements shared by several functions. sqlite3 caches prepared statements
+# per connection keyed by SQL text, so one string per statement means one
+# cache entry (the inline triple-quoted copies differed in indentation).
+_GET_HOLDING_SQL = f"SELECT {Holding.COLUMNS} FROM holdings WHERE account_id = ? AND ticker = ?"
+_INSERT_HOLDING_SQL = (
+    "INSERT INTO holdings (account_id, ticker, shares, avg_cost) VALUES (?, ?, ?, ?)"
+)
+_UPDATE_HOLDING_SQL = (
+    "UPDATE holdings SET shares = ?, avg_cost = ?, updated_at = datetime('now') "
+    "WHERE account_id = ? AND ticker = ?"
+)
+_DELETE_HOLDING_SQL = "DELETE FROM holdings WHERE account_id = ? AND ticker = ?"
+
 
 def add_holding(account_id: int, ticker: str, shares: float, avg_cost: float) -> Holding:
     """Add or import a holding manually (e.g. initial portfolio setup).
@@ -11,10 +26,7 @@ def add_holding(account_id: int, ticker: str, shares: float, avg_cost: float) ->
     """
     ticker = ticker.upper()
     with get_connection() as conn:
-        existing = conn.execute(
-            "SELECT * FROM holdings WHERE account_id = ? AND ticker = ?",
-            (account_id, ticker),
-        ).fetchone()
+        existing = conn.execute(_GET_HOLDING_SQL, (account_id, ticker)).fetchone()
 
         if existing:
             # Merge: recalculate weighted average cost
@@ -28,23 +40,11 @@ def add_holding(account_id: int, ticker: str, shares: float, avg_cost: float) ->
             else:
                 new_avg_cost = 0
 
-            conn.execute(
-                """UPDATE holdings
-                   SET shares = ?, avg_cost = ?, updated_at = datetime('now')
-                   WHERE account_id = ? AND ticker = ?""",
-                (new_total_shares, new_avg_cost, account_id, ticker),
-            )
+            conn.execute(_UPDATE_HOLDING_SQL, (new_total_shares, new_avg_cost, account_id, ticker))
         else:
-            conn.execute(
-                """INSERT INTO holdings (account_id, ticker, shares, avg_cost)
-                   VALUES (?, ?, ?, ?)""",
-                (account_id, ticker, shares, avg_cost),
-            )
+            conn.execute(_INSERT_HOLDING_SQL, (account_id, ticker, shares, avg_cost))
 
-        row = conn.execute(
-            "SELECT * FROM holdings WHERE account_id = ? AND ticker = ?",
-            (account_id, ticker),
-        ).fetchone()
+        row = conn.execute(_GET_HOLDING_SQL, (account_id, ticker)).fetchone()
         return Holding.from_row(row)
 
 
@@ -57,10 +57,7 @@ def update_holding_from_trade(
     Takes a connection parameter to share the same transaction.
     """
     ticker = ticker.upper()
-    existing = conn.execute(
-        "SELECT * FROM holdings WHERE account_id = ? AND ticker = ?",
-        (account_id, ticker),
-    ).fetchone()
+    existing = conn.execute(_GET_HOLDING_SQL, (account_id, ticker)).fetchone()
 
     if action == "BUY":
         if existing:
@@ -70,18 +67,9 @@ def update_holding_from_trade(
             new_avg_cost = (
                 (old_shares * old_cost) + (shares * price)
             ) / new_shares
-            conn.execute(
-                """UPDATE holdings
-                   SET shares = ?, avg_cost = ?, updated_at = datetime('now')
-                   WHERE account_id = ? AND ticker = ?""",
-                (new_shares, new_avg_cost, account_id, ticker),
-            )
+            conn.execute(_UPDATE_HOLDING_SQL, (new_shares, new_avg_cost, account_id, ticker))
         else:
-            conn.execute(
-                """INSERT INTO holdings (account_id, ticker, shares, avg_cost)
-                   VALUES (?, ?, ?, ?)""",
-                (account_id, ticker, shares, price),
-            )
+            conn.execute(_INSERT_HOLDING_SQL, (account_id, ticker, shares, price))
 
     elif action == "SELL":
         if not existing or existing["shares"] < shares:
@@ -91,10 +79,7 @@ def update_holding_from_trade(
             )
         new_shares = existing["shares"] - shares
         if new_shares == 0:
-            conn.execute(
-                "DELETE FROM holdings WHERE account_id = ? AND ticker = ?",
-                (account_id, ticker),
-            )
+            conn.execute(_DELETE_HOLDING_SQL, (account_id, ticker))
         else:
             # avg_cost stays the same on SELL
             conn.execute(
@@ -109,28 +94,52 @@ def get_holding(account_id: int, ticker: str):
     """Get a single holding. Returns None if not found."""
     ticker = ticker.upper()
     with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM holdings WHERE account_id = ? AND ticker = ?",
-            (account_id, ticker),
-        ).fetchone()
+        row = conn.execute(_GET_HOLDING_SQL, (account_id, ticker)).fetchone()
         return Holding.from_row(row) if row else None
 
 
-def list_holdings(account_id: int) -> list[Holding]:
+def list_holdings(account_id: int, conn=None) -> list[Holding]:
     """List all holdings in an account."""
-    with get_connection() as conn:
+    return list(iter_holdings(account_id, conn))
+
+
+def iter_holdings(account_id: int, conn=None) -> Iterator[Holding]:
+    """Yield an account's holdings one at a time (lazy list_holdings).
+
+    Rows are fetched before the first yield (see iter_accounts).
+    """
+    with use_connection(conn) as conn:
         rows = conn.execute(
-            "SELECT * FROM holdings WHERE account_id = ? AND shares > 0 ORDER BY ticker",
+            f"SELECT {Holding.COLUMNS} FROM holdings "
+            "WHERE account_id = ? AND shares > 0 ORDER BY ticker",
             (account_id,),
         ).fetchall()
-        return [Holding.from_row(r) for r in rows]
+    for r in rows:
+        yield Holding.from_row(r)
+
+
+def list_holdings_bulk(account_ids: list[int], conn=None) -> dict[int, list[Holding]]:
+    """list_holdings for several accounts in one query, keyed by account id.
+
+    Every requested id gets a key, with an empty list if it holds nothing.
+    """
+    result: dict[int, list[Holding]] = {account_id: [] for account_id in account_ids}
+    if not account_ids:
+        return result
+    with use_connection(conn) as conn:
+        for r in conn.execute(
+            f"SELECT {Holding.COLUMNS} FROM holdings WHERE shares > 0 "
+            f"AND account_id IN ({', '.join('?' * len(account_ids))}) "
+            "ORDER BY account_id, ticker",
+            account_ids,
+        ):
+            h = Holding.from_row(r)
+            result[h.account_id].append(h)
+    return result
 
 
 def remove_holding(account_id: int, ticker: str) -> None:
     """Remove a holding entirely from an account."""
     ticker = ticker.upper()
     with get_connection() as conn:
-        conn.execute(
-            "DELETE FROM holdings WHERE account_id = ? AND ticker = ?",
-            (account_id, ticker),
-        )
+        conn.execute(_DELETE_HOLDING_SQL, (account_id, ticker))
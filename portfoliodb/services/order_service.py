@@ -3,9 +3,24 @@
 from portfoliodb.db import get_connection
 from portfoliodb.models import PlannedOrder
 from portfoliodb.services.transaction_service import record_transaction
-from portfoliodb.utils.constants import TRANSACTION_ACTIONS, ORDER_PRIORITIES, ORDER_STATUSES
+from portfoliodb.utils.constants import TRANSACTION_ACTIONS, ORDER_PRIORITIES
 from portfoliodb.utils.ticker import canonical_ticker
 
+# list_orders' statement per (account_id given, status given), so each
+# filter combination is always the same SQL text (one sqlite3 statement
+# cache entry) and nothing is assembled per call.
+_LIST_ORDERS_SQL = {
+    (False, False): f"SELECT {PlannedOrder.COLUMNS} FROM planned_orders "
+                    "ORDER BY priority DESC, created_at",
+    (True, False):  f"SELECT {PlannedOrder.COLUMNS} FROM planned_orders WHERE account_id = ? "
+                    "ORDER BY priority DESC, created_at",
+    (False, True):  f"SELECT {PlannedOrder.COLUMNS} FROM planned_orders WHERE status = ? "
+                    "ORDER BY priority DESC, created_at",
+    (True, True):   f"SELECT {PlannedOrder.COLUMNS} FROM planned_orders "
+                    "WHERE account_id = ? AND status = ? "
+                    "ORDER BY priority DESC, created_at",
+}
+
 
 def create_order(
     account_id: int,
@@ -43,14 +58,12 @@ def create_order(
         raise ValueError(f"Invalid priority '{priority}'. Must be one of: {', '.join(ORDER_PRIORITIES)}")
 
     with get_connection() as conn:
-        cursor = conn.execute(
-            """INSERT INTO planned_orders
+        row = conn.execute(
+            f"""INSERT INTO planned_orders
                (account_id, ticker, action, shares, target_price, reason, priority)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+               VALUES (?, ?, ?, ?, ?, ?, ?)
+               RETURNING {PlannedOrder.COLUMNS}""",
             (account_id, ticker, action, shares, target_price, reason, priority),
-        )
-        row = conn.execute(
-            "SELECT * FROM planned_orders WHERE id = ?", (cursor.lastrowid,)
         ).fetchone()
         return PlannedOrder.from_row(row)
 
@@ -60,18 +73,12 @@ def list_orders(
     status: str = "PENDING",
 ) -> list[PlannedOrder]:
     """List planned orders with optional filters."""
-    conditions = []
     params = []
-
     if account_id is not None:
-        conditions.append("account_id = ?")
         params.append(account_id)
     if status is not None:
-        conditions.append("status = ?")
         params.append(status.upper())
-
-    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-    query = f"SELECT * FROM planned_orders {where} ORDER BY priority DESC, created_at"
+    query = _LIST_ORDERS_SQL[account_id is not None, status is not None]
 
     with get_connection() as conn:
         rows = conn.execute(query, params).fetchall()
@@ -84,41 +91,42 @@ def execute_order(
     fee: float = 0,
     tax: float = 0,
 ) -> PlannedOrder:
-    """Execute a planned order: create real transaction and link it."""
+    """Execute a planned order: create real transaction and link it.
+
+    One transaction covers the status change, the trade and the link, so an
+    order can't end up with its trade recorded but still PENDING. The order
+    is claimed first with a conditional UPDATE, which also takes the write
+    lock before the trade is recorded.
+    """
     with get_connection() as conn:
         row = conn.execute(
-            "SELECT * FROM planned_orders WHERE id = ?", (order_id,)
+            f"""UPDATE planned_orders
+               SET status = 'EXECUTED', executed_at = datetime('now')
+               WHERE id = ? AND status = 'PENDING'
+               RETURNING {PlannedOrder.COLUMNS}""",
+            (order_id,),
         ).fetchone()
         if row is None:
-            raise ValueError(f"Order ID {order_id} not found")
-
+            raise _not_pending(conn, order_id, "Order is already {status}")
         order = PlannedOrder.from_row(row)
-        if order.status != "PENDING":
-            raise ValueError(f"Order is already {order.status}")
-
-    # Record the actual transaction
-    tx = record_transaction(
-        account_id=order.account_id,
-        ticker=order.ticker,
-        action=order.action,
-        shares=order.shares,
-        price=actual_price,
-        fee=fee,
-        tax=tax,
-        notes=f"Executed from planned order #{order_id}",
-    )
 
-    # Update order status
-    with get_connection() as conn:
-        conn.execute(
-            """UPDATE planned_orders
-               SET status = 'EXECUTED', executed_at = datetime('now'),
-                   linked_transaction_id = ?
-               WHERE id = ?""",
-            (tx.id, order_id),
+        # Record the actual transaction (joins this transaction as a savepoint;
+        # if it raises, the claim above is rolled back with it)
+        tx = record_transaction(
+            account_id=order.account_id,
+            ticker=order.ticker,
+            action=order.action,
+            shares=order.shares,
+            price=actual_price,
+            fee=fee,
+            tax=tax,
+            notes=f"Executed from planned order #{order_id}",
         )
+
         row = conn.execute(
-            "SELECT * FROM planned_orders WHERE id = ?", (order_id,)
+            "UPDATE planned_orders SET linked_transaction_id = ? WHERE id = ? "
+            f"RETURNING {PlannedOrder.COLUMNS}",
+            (tx.id, order_id),
         ).fetchone()
         return PlannedOrder.from_row(row)
 
@@ -127,23 +135,29 @@ def cancel_order(order_id: int) -> PlannedOrder:
     """Cancel a pending planned order."""
     with get_connection() as conn:
         row = conn.execute(
-            "SELECT * FROM planned_orders WHERE id = ?", (order_id,)
-        ).fetchone()
-        if row is None:
-            raise ValueError(f"Order ID {order_id} not found")
-        if row["status"] != "PENDING":
-            raise ValueError(f"Order is already {row['status']}")
-
-        conn.execute(
-            "UPDATE planned_orders SET status = 'CANCELLED' WHERE id = ?",
+            "UPDATE planned_orders SET status = 'CANCELLED' "
+            f"WHERE id = ? AND status = 'PENDING' RETURNING {PlannedOrder.COLUMNS}",
             (order_id,),
-        )
-        row = conn.execute(
-            "SELECT * FROM planned_orders WHERE id = ?", (order_id,)
         ).fetchone()
+        if row is None:
+            raise _not_pending(conn, order_id, "Order is already {status}")
         return PlannedOrder.from_row(row)
 
 
+def _not_pending(conn, order_id: int, message: str) -> ValueError:
+    """Error for a `... WHERE id = ? AND status = 'PENDING'` that matched nothing.
+
+    Only this failure path reads the order back, to say why: missing, or
+    `message` formatted with its current status.
+    """
+    row = conn.execute(
+        "SELECT status FROM planned_orders WHERE id = ?", (order_id,)
+    ).fetchone()
+    if row is None:
+        return ValueError(f"Order ID {order_id} not found")
+    return ValueError(message.format(status=row["status"]))
+
+
 def review_orders(since_days: int = 180) -> dict:
     """Retrospective view of planned orders — pure mechanical stats, no scoring.
 
@@ -219,21 +233,14 @@ def update_order(order_id: int, **kwargs) -> PlannedOrder:
     if not updates:
         raise ValueError("No valid fields to update")
 
+    set_clause = ", ".join(f"{k} = ?" for k in updates)
+    params = list(updates.values()) + [order_id]
     with get_connection() as conn:
         row = conn.execute(
-            "SELECT * FROM planned_orders WHERE id = ?", (order_id,)
+            f"UPDATE planned_orders SET {set_clause} "
+            f"WHERE id = ? AND status = 'PENDING' RETURNING {PlannedOrder.COLUMNS}",
+            params,
         ).fetchone()
         if row is None:
-            raise ValueError(f"Order ID {order_id} not found")
-        if row["status"] != "PENDING":
-            raise ValueError(f"Cannot update order with status {row['status']}")
-
-        set_clause = ", ".join(f"{k} = ?" for k in updates)
-        params = list(updates.values()) + [order_id]
-        conn.execute(
-            f"UPDATE planned_orders SET {set_clause} WHERE id = ?", params
-        )
-        row = conn.execute(
-            "SELECT * FROM planned_orders WHERE id = ?", (order_id,)
-        ).fetchone()
+            raise _not_pending(conn, order_id, "Cannot update order with status {status}")
         return PlannedOrder.from_row(row)
@@ -1,5 +1,7 @@
 """Portfolio aggregation: summaries, P&L calculations across accounts."""
 
+from portfoliodb.db import get_connection
+from portfoliodb.models import Holding
 from portfoliodb.services import (
     account_service,
     holding_service,
@@ -8,7 +10,21 @@ from portfoliodb.services import (
     fx_service,
 )
 from portfoliodb.services.user_service import get_user_by_username
-from portfoliodb.utils.ticker import detect_market
+from portfoliodb.utils.constants import CURRENCIES
+
+# An account's holdings (as iter_holdings lists them) with each one's
+# price_cache row, so a lone account summary learns which quotes are fresh
+# from the holdings read instead of a second query. The last four columns
+# are the cache row, NULL when the ticker was never cached.
+_HOLDINGS_WITH_CACHE_SQL = (
+    "SELECT " + ", ".join(f"h.{c}" for c in Holding.COLUMNS.split(", ")) + ", "
+    "p.ticker, p.price, p.currency, p.fetched_at FROM holdings h "
+    "LEFT JOIN price_cache p ON p.ticker = h.ticker "
+    "WHERE h.account_id = ? AND h.shares > 0 ORDER BY h.ticker"
+)
+
+# prices.get() default for an unquoted holding; never mutated.
+_NO_PRICE: dict = {}
 
 
 def get_account_summary(account_id: int) -> dict:
@@ -20,6 +36,9 @@ def get_account_summary(account_id: int) -> dict:
             "holdings": [{"holding": Holding, "current_price": float,
                           "market_value": float, "unrealized_pnl": float,
                           "pnl_pct": float}, ...],
+            "priced": {"ticker": [...], "shares": [...], "avg_cost": [...],
+                       "current_price": [...], "unrealized_pnl": [...],
+                       "pnl_pct": [...]},
             "cash": [CashPosition, ...],
             "total_stock_value": float,
             "total_cash_value": float,
@@ -27,37 +46,69 @@ def get_account_summary(account_id: int) -> dict:
             "currency": str,
         }
     """
-    account = account_service.get_account(account_id)
-    holdings = holding_service.list_holdings(account_id)
-    cash_positions = cash_service.list_cash(account_id)
+    # One read transaction for the account's rows.
+    with get_connection() as conn:
+        account = account_service.get_account(account_id, conn=conn)
+        rows = conn.execute(_HOLDINGS_WITH_CACHE_SQL, (account_id,)).fetchall()
+        holdings = [Holding.from_row(r[:-4]) for r in rows]
+        cache_rows = [r[-4:] for r in rows if r[-1] is not None]
+        cash_positions = cash_service.list_cash(account_id, conn=conn)
 
     # Fetch prices for all holdings
     tickers = [h.ticker for h in holdings]
-    prices = price_service.fetch_prices(tickers) if tickers else {}
+    prices = price_service.fetch_prices(tickers, cache_rows) if tickers else {}
+    return _summarize_account(account, holdings, cash_positions, prices)
 
+
+def _summarize_account(account, holdings, cash_positions, prices) -> dict:
+    """`get_account_summary` result from rows and prices the caller already has.
+
+    `prices` is a `fetch_prices` result covering at least these holdings.
+    """
     # FX rates for converting holding prices to account currency (handles
-    # cross-currency positions like USD stocks in an SGD account).
-    fx_rates_for_acc = fx_service.get_all_rates(account.currency)
+    # cross-currency positions like USD stocks in an SGD account). Only the
+    # currencies actually quoted are fetched; usually there are none.
+    fx_rates_for_acc = _rates_into(account.currency, {
+        prices[h.ticker].get("currency") for h in holdings if h.ticker in prices
+    })
 
     holding_details = []
     total_stock_value = 0
+    # Column-oriented copy of the holdings that have a price, for callers
+    # that only walk those (summary user) and would otherwise do a handful of
+    # dict lookups per row to pull the same fields back out.
+    priced = {k: [] for k in (
+        "ticker", "shares", "avg_cost", "current_price", "unrealized_pnl", "pnl_pct",
+    )}
+    # Bound appends for the priced columns.
+    add_ticker = priced["ticker"].append
+    add_shares = priced["shares"].append
+    add_avg = priced["avg_cost"].append
+    add_price = priced["current_price"].append
+    add_pnl = priced["unrealized_pnl"].append
+    add_pct = priced["pnl_pct"].append
+    acc_currency = account.currency
 
     for h in holdings:
-        price_info = prices.get(h.ticker, {})
+        price_info = prices.get(h.ticker, _NO_PRICE)
         current_price = price_info.get("price")
-        # Use the price's own currency (e.g. USD for NVDA), not account currency.
-        price_currency = price_info.get("currency") or account.currency
 
         if current_price is not None:
-            if price_currency != account.currency:
-                fx = fx_rates_for_acc.get(price_currency, 1.0)
-                market_value = current_price * h.shares * fx
-            else:
-                market_value = current_price * h.shares
-            cost_basis = h.avg_cost * h.shares
-            unrealized_pnl = market_value - cost_basis
-            pnl_pct = ((current_price / h.avg_cost) - 1) * 100 if h.avg_cost > 0 else 0
+            shares, avg_cost = h.shares, h.avg_cost
+            market_value = current_price * shares
+            # Use the price's own currency (e.g. USD for NVDA), not account currency.
+            price_currency = price_info.get("currency") or acc_currency
+            if price_currency != acc_currency:
+                market_value *= fx_rates_for_acc.get(price_currency, 1.0)
+            unrealized_pnl = market_value - avg_cost * shares
+            pnl_pct = ((current_price / avg_cost) - 1) * 100 if avg_cost > 0 else 0
             total_stock_value += market_value
+            add_ticker(h.ticker)
+            add_shares(shares)
+            add_avg(avg_cost)
+            add_price(current_price)
+            add_pnl(unrealized_pnl)
+            add_pct(pnl_pct)
         else:
             market_value = None
             unrealized_pnl = None
@@ -77,6 +128,7 @@ def get_account_summary(account_id: int) -> dict:
     return {
         "account": account,
         "holdings": holding_details,
+        "priced": priced,
         "cash": cash_positions,
         "total_stock_value": total_stock_value,
         "total_cash_value": total_cash,
@@ -85,23 +137,35 @@ def get_account_summary(account_id: int) -> dict:
     }
 
 
-def get_user_summary(username: str, base_currency: str = "TWD") -> dict:
+def get_user_summary(username: str, base_currency: str = "TWD",
+                     fx_rates: dict[str, float] | None = None) -> dict:
     """Get summary across all accounts where this user is the **economic owner**,
     converted to base currency.
 
-    Reflects真實 portfolio (誰的錢)，not legal name on file.
+    Reflects真實 portfolio (誰的錢)，not legal name on file. `fx_rates` is
+    `get_all_rates(base_currency)` when the caller already has it.
     """
     user = get_user_by_username(username)
-    accounts = account_service.list_accounts(economic_owner_id=user.id)
+    accounts = account_service.list_accounts_with_cash(economic_owner_id=user.id)
+    holdings, prices = _holdings_and_prices(accounts)
 
-    # Pre-fetch FX rates
-    fx_rates = fx_service.get_all_rates(base_currency)
+    # Pre-fetch FX rates, for just the currencies these accounts are in
+    if fx_rates is None:
+        fx_rates = _rates_into(base_currency, {acc.currency for acc, _ in accounts})
+    return _user_summary(user, accounts, holdings, prices, base_currency, fx_rates)
+
+
+def _user_summary(user, accounts, holdings, prices, base_currency, fx_rates) -> dict:
+    """`get_user_summary` result from pre-loaded data.
 
+    `accounts` are the user's (Account, cash) pairs, `holdings` and `prices`
+    come from `_holdings_and_prices` over at least those accounts.
+    """
     account_summaries = []
     grand_total = 0
 
-    for acc in accounts:
-        summary = get_account_summary(acc.id)
+    for acc, cash_positions in accounts:
+        summary = _summarize_account(acc, holdings[acc.id], cash_positions, prices)
         # Convert account total to base currency
         rate = fx_rates.get(acc.currency, 1.0)
         converted_total = summary["total_value"] * rate
@@ -118,6 +182,33 @@ def get_user_summary(username: str, base_currency: str = "TWD") -> dict:
     }
 
 
+def _holdings_and_prices(accounts) -> tuple[dict[int, list[Holding]], dict[str, dict]]:
+    """Holdings of the given (Account, cash) pairs plus prices for all of them.
+
+    One holdings query for every account, keyed by account id, and one
+    `fetch_prices` call, so the live quotes for all accounts overlap instead
+    of running account by account.
+    """
+    holdings = holding_service.list_holdings_bulk([acc.id for acc, _ in accounts])
+    tickers = list(dict.fromkeys(h.ticker for hs in holdings.values() for h in hs))
+    prices = price_service.fetch_prices(tickers) if tickers else {}
+    return holdings, prices
+
+
+def _rates_into(base_currency: str, currencies) -> dict[str, float]:
+    """`get_all_rates(base_currency)` cut down to the given currencies.
+
+    Like get_all_rates, only CURRENCIES are looked up (callers fall back to
+    1.0 for the rest), but a portfolio held entirely in the base currency
+    needs no FX lookup at all.
+    """
+    base_currency = base_currency.upper()
+    rates = {base_currency: 1.0}
+    for curr in (currencies & CURRENCIES) - {base_currency}:
+        rates[curr] = fx_service.fetch_rate(curr, base_currency)
+    return rates
+
+
 def get_family_breakdown(base_currency: str = "TWD") -> dict:
     """Family-wide flat breakdown: every position (stock + cash) across all accounts,
     plus multi-dimensional aggregations.
@@ -126,7 +217,8 @@ def get_family_breakdown(base_currency: str = "TWD") -> dict:
     """
     from portfoliodb.services.user_service import get_user
 
-    accounts = account_service.list_accounts()
+    accounts = account_service.list_accounts_with_cash()
+    holdings_by_account, prices = _holdings_and_prices(accounts)
     fx_rates = fx_service.get_all_rates(base_currency)
     user_cache: dict[int, str] = {}
 
@@ -137,17 +229,8 @@ def get_family_breakdown(base_currency: str = "TWD") -> dict:
 
     positions: list[dict] = []
 
-    for acc in accounts:
-        holdings = holding_service.list_holdings(acc.id)
-        cash_positions = cash_service.list_cash(acc.id)
-        rate = fx_rates.get(acc.currency, 1.0)
-
-        if holdings:
-            prices = price_service.fetch_prices([h.ticker for h in holdings])
-        else:
-            prices = {}
-
-        for h in holdings:
+    for acc, cash_positions in accounts:
+        for h in holdings_by_account[acc.id]:
             price_info = prices.get(h.ticker, {})
             current = price_info.get("price")
             # Use the price's own currency so cross-currency positions
@@ -260,13 +343,19 @@ def get_total_summary(base_currency: str = "TWD") -> dict:
     from portfoliodb.services.user_service import list_users
 
     users = list_users()
-    fx_rates = fx_service.get_all_rates(base_currency)
+    accounts = account_service.list_accounts_with_cash()
+    holdings, prices = _holdings_and_prices(accounts)
+    fx_rates = _rates_into(base_currency, {acc.currency for acc, _ in accounts})
+    by_owner: dict[int, list] = {}
+    for pair in accounts:
+        by_owner.setdefault(pair[0].economic_owner_id, []).append(pair)
 
     user_summaries = []
     grand_total = 0
 
     for u in users:
-        user_sum = get_user_summary(u.username, base_currency)
+        user_sum = _user_summary(u, by_owner.get(u.id, []), holdings, prices,
+                                 base_currency, fx_rates)
         grand_total += user_sum["grand_total"]
         user_summaries.append(user_sum)
 
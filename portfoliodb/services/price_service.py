@@ -4,6 +4,8 @@ import contextlib
 import io
 import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
 import yfinance as yf
@@ -35,6 +37,21 @@ def _replay_unexpected_stderr(captured: str) -> None:
             print(line, file=sys.stderr)
 
 
+@contextlib.contextmanager
+def _quiet_stderr():
+    """Capture stderr for the block, then replay anything that isn't noise.
+
+    redirect_stderr swaps the process-wide sys.stderr, so concurrent fetches
+    must share one capture opened by the calling thread — never one per worker.
+    """
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stderr(buf):
+            yield
+    finally:
+        _replay_unexpected_stderr(buf.getvalue())
+
+
 def fetch_price(ticker: str) -> dict:
     """Fetch the latest price for a ticker, using cache if fresh.
 
@@ -45,45 +62,44 @@ def fetch_price(ticker: str) -> dict:
     handle multiple tickers should use `fetch_prices` instead — it converts
     the failure into a structured `warning` entry.
     """
+    # Capture stderr around the yfinance call so its "possibly delisted" /
+    # 404 messages don't leak into normal CLI output.
+    with _quiet_stderr():
+        return _fetch_price(ticker)
+
+
+def _fetch_price(ticker: str) -> dict:
+    """`fetch_price` without the stderr capture (the caller owns it)."""
     ticker = ticker.upper()
 
     # Check cache first
-    cached = _get_cached_price(ticker)
+    cached = _get_cached_prices([ticker]).get(ticker)
     if cached:
-        return {
-            "ticker": ticker,
-            "price": cached["price"],
-            "currency": cached["currency"],
-            "cached": True,
-        }
+        return {"ticker": ticker, **cached, "cached": True}
 
-    # Capture stderr around the yfinance call so its "possibly delisted" /
-    # 404 messages don't leak into normal CLI output.
-    buf = io.StringIO()
-    with contextlib.redirect_stderr(buf):
-        stock = yf.Ticker(ticker)
-        info = stock.fast_info
-        price = info.get("lastPrice") or info.get("previousClose")
-    _replay_unexpected_stderr(buf.getvalue())
+    quote = _quote(ticker)
+    _update_cache([(ticker, quote["price"], quote["currency"])])
+    return quote
 
-    if price is None:
-        raise ValueError(f"Could not fetch price for {ticker}")
 
-    price = float(price)
-    currency = str(info.get("currency", "USD"))
+def _quote(ticker: str) -> dict:
+    """Live yfinance quote for an upper-cased ticker; no cache read or write."""
+    stock = yf.Ticker(ticker)
+    info = stock.fast_info
+    price = info.get("lastPrice") or info.get("previousClose")
 
-    # Update cache
-    _update_cache(ticker, price, currency)
+    if price is None:
+        raise ValueError(f"Could not fetch price for {ticker}")
 
     return {
         "ticker": ticker,
-        "price": price,
-        "currency": currency,
+        "price": float(price),
+        "currency": str(info.get("currency", "USD")),
         "cached": False,
     }
 
 
-def fetch_prices(tickers: list[str]) -> dict[str, dict]:
+def fetch_prices(tickers: list[str], cache_rows=None) -> dict[str, dict]:
     """Fetch prices for multiple tickers.
 
     Returns: {ticker: {"price": float, "currency": str, "cached": bool,
@@ -93,53 +109,120 @@ def fetch_prices(tickers: list[str]) -> dict[str, dict]:
     `warning` describing the data-quality issue. yfinance's own stderr noise
     is captured at fetch time and only re-emitted for lines that don't match
     known no-quote patterns — i.e. actual problems still surface.
+
+    `cache_rows` are the tickers' price_cache rows as (ticker, price,
+    currency, fetched_at), when the caller already read them alongside its
+    own query; the cache lookup is then skipped.
     """
-    results = {}
-    for t in tickers:
-        key = t.upper()
-        try:
-            results[key] = fetch_price(t)
-        except ValueError as e:
-            results[key] = {
-                "ticker": key, "price": None, "currency": None,
-                "warning": "no quote",
-                "error": str(e),
-            }
-        except Exception as e:
-            # Unknown failure mode — preserve the diagnostic signal rather
-            # than treating it as a routine "delisted ticker" noise event.
-            results[key] = {
-                "ticker": key, "price": None, "currency": None,
-                "warning": "fetch failed",
-                "error": str(e),
-            }
-    return results
-
-
-def _get_cached_price(ticker: str) -> dict | None:
-    """Get cached price if it's fresh enough."""
-    with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM price_cache WHERE ticker = ?", (ticker,)
-        ).fetchone()
+    keys = list(dict.fromkeys(t.upper() for t in tickers))
+    with _quiet_stderr():
+        entries = dict(_price_entries(keys, cache_rows=cache_rows))
+    return {key: entries[key] for key in keys}
 
-    if row is None:
-        return None
 
-    fetched_at = datetime.fromisoformat(row["fetched_at"])
-    if datetime.utcnow() - fetched_at > timedelta(minutes=PRICE_CACHE_TTL_MINUTES):
-        return None  # Cache expired
+def fetch_prices_iter(tickers: list[str], max_workers: int = 8) -> Iterator[tuple[str, dict]]:
+    """Yield `(ticker, entry)` pairs as each quote arrives.
+
+    Same entries as `fetch_prices`: cached quotes come first, then live ones
+    in completion order, so a caller can show results while the slower quotes
+    are still in flight. Duplicate tickers are fetched once.
+    """
+    keys = list(dict.fromkeys(t.upper() for t in tickers))
+    if not keys:
+        return
+    with _quiet_stderr():
+        yield from _price_entries(keys, max_workers)
 
-    return {"price": row["price"], "currency": row["currency"]}
+
+def _price_entries(keys: list[str], max_workers: int = 8,
+                   cache_rows=None) -> Iterator[tuple[str, dict]]:
+    """`(ticker, entry)` for distinct upper-cased tickers.
+
+    One cache query covers every ticker (none when the caller passed its
+    `cache_rows`); the misses are quoted concurrently (one yfinance
+    round-trip each, overlapped rather than back to back) and the new prices
+    written back in a single transaction.
+    """
+    if cache_rows is None:
+        cached = _get_cached_prices(keys)
+    else:
+        cached = _fresh_prices(cache_rows)
+    for key, hit in cached.items():
+        yield key, {"ticker": key, **hit, "cached": True}
+
+    missing = [key for key in keys if key not in cached]
+    if not missing:
+        return
+    fresh = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+        futures = {pool.submit(_price_entry, key): key for key in missing}
+        for fut in as_completed(futures):
+            entry = fut.result()
+            if entry["price"] is not None:
+                fresh.append((entry["ticker"], entry["price"], entry["currency"]))
+            yield futures[fut], entry
+    _update_cache(fresh)
+
+
+def _price_entry(ticker: str) -> dict:
+    """One live `fetch_prices` entry: the quote, or a structured warning."""
+    key = ticker.upper()
+    try:
+        return _quote(key)
+    except ValueError as e:
+        return {
+            "ticker": key, "price": None, "currency": None,
+            "warning": "no quote",
+            "error": str(e),
+        }
+    except Exception as e:
+        # Unknown failure mode — preserve the diagnostic signal rather
+        # than treating it as a routine "delisted ticker" noise event.
+        return {
+            "ticker": key, "price": None, "currency": None,
+            "warning": "fetch failed",
+            "error": str(e),
+        }
+
+
+def _get_cached_prices(tickers: list[str]) -> dict[str, dict]:
+    """{ticker: {"price", "currency"}} for the tickers with a fresh cache row."""
+    if not tickers:
+        return {}
+    with get_connection() as conn:
+        rows = conn.execute(
+            "SELECT ticker, price, currency, fetched_at FROM price_cache "
+            f"WHERE ticker IN ({', '.join('?' * len(tickers))})",
+            tickers,
+        ).fetchall()
+    return _fresh_prices(rows)
+
+
+def _fresh_prices(rows) -> dict[str, dict]:
+    """`_get_cached_prices` result for (ticker, price, currency, fetched_at) rows."""
+    # fetched_at is SQLite's datetime('now') text (UTC, "YYYY-MM-DD HH:MM:SS"),
+    # which sorts as it reads: compare it to a cutoff in the same format
+    # rather than parsing every row.
+    cutoff = (datetime.utcnow() - timedelta(minutes=PRICE_CACHE_TTL_MINUTES)).strftime(
+        "%Y-%m-%d %H:%M:%S"
+    )
+    return {
+        ticker: {"price": price, "currency": currency}
+        for ticker, price, currency, fetched_at in rows
+        if fetched_at >= cutoff  # else expired
+    }
 
 
-def _update_cache(ticker: str, price: float, currency: str) -> None:
-    """Insert or update the price cache."""
+def _update_cache(quotes: list[tuple[str, float, str]]) -> None:
+    """Insert or update price cache rows from (ticker, price, currency) tuples."""
+    if not quotes:
+        return
     with get_connection() as conn:
-        conn.execute(
+        conn.executemany(
             """INSERT INTO price_cache (ticker, price, currency, fetched_at)
                VALUES (?, ?, ?, datetime('now'))
                ON CONFLICT(ticker)
-               DO UPDATE SET price = ?, currency = ?, fetched_at = datetime('now')""",
-            (ticker, price, currency, price, currency),
+               DO UPDATE SET price = excluded.price, currency = excluded.currency,
+                             fetched_at = excluded.fetched_at""",
+            quotes,
         )
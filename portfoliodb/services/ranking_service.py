@@ -60,21 +60,19 @@ def add_ranking(
 
     with get_connection() as conn:
         try:
-            cursor = conn.execute(
+            row = conn.execute(
                 """INSERT INTO rankings
                    (ticker, method, method_version, score_date, headline_score, weight_pct, source, notes)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                   RETURNING *""",
                 (canon, method, method_version, score_date, headline_score, weight_pct, source, notes),
-            )
+            ).fetchone()
         except sqlite3.IntegrityError:
             raise ValueError(
                 f"A {method} ranking for {canon} on {score_date} already exists. "
                 "Same-day re-scores are corrections, not new data points — "
                 f"run `rank show {canon}` to see the existing row."
             )
-        row = conn.execute(
-            "SELECT * FROM rankings WHERE id = ?", (cursor.lastrowid,)
-        ).fetchone()
         return Ranking.from_row(row)
 
 
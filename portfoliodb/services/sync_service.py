@@ -1,68 +1,73 @@
 """Sync service: pull data from broker APIs and CSV imports into the database."""
 
+from portfoliodb.brokers.types import BrokerHolding
 from portfoliodb.services import holding_service, cash_service, account_service
 from portfoliodb.db import get_connection
 
 
-def sync_broker_holdings(account_id: int, holdings_data: list[dict]) -> dict:
+def sync_broker_holdings(account_id: int, holdings_data: list[BrokerHolding]) -> dict:
     """Sync holdings from a broker API into the database.
 
     Replaces all existing holdings for this account with fresh data from broker.
 
     Args:
         account_id: Target account ID in our database
-        holdings_data: List from broker.get_holdings(), each dict has:
-            {"ticker": "2330.TW", "shares": 1000, "avg_cost": 580.5, ...}
+        holdings_data: List from broker.get_holdings(), e.g.
+            [BrokerHolding(ticker="2330.TW", shares=1000, avg_cost=580.5), ...]
 
     Returns:
         {"added": int, "updated": int, "removed": int}
     """
-    account = account_service.get_account(account_id)
-    existing = holding_service.list_holdings(account_id)
-    existing_map = {h.ticker: h for h in existing}
-
-    broker_tickers = set()
-    added = 0
-    updated = 0
-
-    with get_connection() as conn:
+    # One transaction from the read of the current holdings to the last
+    # write, so the diff is applied to exactly the rows it was computed from
+    # (IMMEDIATE: no other writer can slip in between).
+    with get_connection(immediate=True) as conn:
+        account_service.get_account(account_id, conn=conn)  # raises if the account doesn't exist
+        existing_map = {h.ticker: h for h in holding_service.iter_holdings(account_id, conn)}
+
+        # Work out every change first, then write them with one statement
+        # (executemany for the per-row values) per kind of change.
+        broker_tickers = set()
+        updates = []
+        inserts = []
         for item in holdings_data:
-            ticker = item["ticker"].upper()
-            shares = item["shares"]
-            avg_cost = item["avg_cost"]
+            ticker = item.ticker.upper()
+            shares = item.shares
+            avg_cost = item.avg_cost
             broker_tickers.add(ticker)
 
             if shares <= 0:
                 continue
 
             if ticker in existing_map:
-                # Update existing holding
                 old = existing_map[ticker]
                 if old.shares != shares or abs(old.avg_cost - avg_cost) > 0.01:
-                    conn.execute(
-                        """UPDATE holdings
-                           SET shares = ?, avg_cost = ?, updated_at = datetime('now')
-                           WHERE account_id = ? AND ticker = ?""",
-                        (shares, avg_cost, account_id, ticker),
-                    )
-                    updated += 1
+                    updates.append((shares, avg_cost, account_id, ticker))
             else:
-                # Add new holding
-                conn.execute(
-                    """INSERT INTO holdings (account_id, ticker, shares, avg_cost)
-                       VALUES (?, ?, ?, ?)""",
-                    (account_id, ticker, shares, avg_cost),
-                )
-                added += 1
-
-    # Remove holdings no longer in broker data
-    removed = 0
-    for ticker, h in existing_map.items():
-        if ticker not in broker_tickers:
-            holding_service.remove_holding(account_id, ticker)
-            removed += 1
-
-    return {"added": added, "updated": updated, "removed": removed}
+                inserts.append((account_id, ticker, shares, avg_cost))
+
+        # Remove holdings no longer in broker data
+        removals = existing_map.keys() - broker_tickers
+
+        conn.executemany(
+            """UPDATE holdings
+               SET shares = ?, avg_cost = ?, updated_at = datetime('now')
+               WHERE account_id = ? AND ticker = ?""",
+            updates,
+        )
+        conn.executemany(
+            """INSERT INTO holdings (account_id, ticker, shares, avg_cost)
+               VALUES (?, ?, ?, ?)""",
+            inserts,
+        )
+        if removals:
+            conn.execute(
+                "DELETE FROM holdings WHERE account_id = ? "
+                f"AND ticker IN ({', '.join('?' * len(removals))})",
+                (account_id, *removals),
+            )
+
+    return {"added": len(inserts), "updated": len(updates), "removed": len(removals)}
 
 
 def sync_broker_cash(account_id: int, balance_data: dict) -> None:
@@ -95,11 +100,10 @@ def sync_sinopac(account_id: int) -> dict:
     broker.login()
 
     try:
-        holdings = broker.get_holdings()
-        balance = broker.get_balance()
+        snapshot = broker.get_snapshot()
 
-        result = sync_broker_holdings(account_id, holdings)
-        sync_broker_cash(account_id, balance)
+        result = sync_broker_holdings(account_id, snapshot["holdings"])
+        sync_broker_cash(account_id, snapshot["balance"])
 
         return {"holdings": result, "cash_synced": True}
     finally:
@@ -120,11 +124,10 @@ def sync_fubon(account_id: int) -> dict:
     broker = FubonBroker()
     broker.login()
 
-    holdings = broker.get_holdings()
-    balance = broker.get_balance()
+    snapshot = broker.get_snapshot()
 
-    result = sync_broker_holdings(account_id, holdings)
-    sync_broker_cash(account_id, balance)
+    result = sync_broker_holdings(account_id, snapshot["holdings"])
+    sync_broker_cash(account_id, snapshot["balance"])
 
     return {"holdings": result, "cash_synced": True}
 
@@ -147,11 +150,11 @@ def import_firstrade_csv(account_id: int, csv_path: str) -> dict:
     holdings_data = []
     for ticker, info in data["current_holdings"].items():
         avg_cost = info["total_cost"] / info["shares"] if info["shares"] > 0 else 0
-        holdings_data.append({
-            "ticker": ticker,
-            "shares": info["shares"],
-            "avg_cost": avg_cost,
-        })
+        holdings_data.append(BrokerHolding(
+            ticker=ticker,
+            shares=info["shares"],
+            avg_cost=avg_cost,
+        ))
 
     result = sync_broker_holdings(account_id, holdings_data)
 
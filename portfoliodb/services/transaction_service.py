@@ -1,5 +1,7 @@
 """Transaction service: record buy/sell trades with double-entry (stock + cash)."""
 
+from collections.abc import Iterable, Iterator
+
 from portfoliodb.db import get_connection
 from portfoliodb.models import Transaction
 from portfoliodb.services.holding_service import update_holding_from_trade
@@ -7,6 +9,54 @@ from portfoliodb.services.cash_service import adjust_cash
 from portfoliodb.services.account_service import get_account
 from portfoliodb.utils.constants import TRANSACTION_ACTIONS
 
+# One INSERT for both cases: a NULL executed_at means "now".
+# record_transactions runs it without RETURNING (executemany cannot take
+# one) and reads the new rows back by id: under its write lock they are the
+# ids above the pre-insert maximum.
+_INSERT_TRANSACTION_NO_RETURN_SQL = (
+    "INSERT INTO transactions (account_id, ticker, action, shares, price, fee, "
+    "tax, currency, notes, executed_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, COALESCE(?, datetime('now')))"
+)
+_INSERT_TRANSACTION_SQL = f"{_INSERT_TRANSACTION_NO_RETURN_SQL} RETURNING {Transaction.COLUMNS}"
+_MAX_TRANSACTION_ID_SQL = "SELECT COALESCE(MAX(id), 0) FROM transactions"
+_TRANSACTIONS_AFTER_ID_SQL = (
+    f"SELECT {Transaction.COLUMNS} FROM transactions WHERE id > ? ORDER BY id"
+)
+_GET_TRANSACTION_SQL = f"SELECT {Transaction.COLUMNS} FROM transactions WHERE id = ?"
+# iter_transactions' statement per (account_id given, ticker given).
+_LIST_TRANSACTIONS_SQL = {
+    (False, False): f"SELECT {Transaction.COLUMNS} FROM transactions "
+                    "ORDER BY executed_at DESC LIMIT ?",
+    (True, False):  f"SELECT {Transaction.COLUMNS} FROM transactions WHERE account_id = ? "
+                    "ORDER BY executed_at DESC LIMIT ?",
+    (False, True):  f"SELECT {Transaction.COLUMNS} FROM transactions WHERE ticker = ? "
+                    "ORDER BY executed_at DESC LIMIT ?",
+    (True, True):   f"SELECT {Transaction.COLUMNS} FROM transactions "
+                    "WHERE account_id = ? AND ticker = ? "
+                    "ORDER BY executed_at DESC LIMIT ?",
+}
+
+
+def _validate_trade(ticker: str, action: str, shares: float, price: float) -> tuple[str, str]:
+    """Check one trade's inputs; return the upper-cased (ticker, action)."""
+    action = action.upper()
+    if action not in TRANSACTION_ACTIONS:
+        raise ValueError(f"Invalid action '{action}'. Must be BUY or SELL")
+    if shares <= 0:
+        raise ValueError("Shares must be positive")
+    if price <= 0:
+        raise ValueError("Price must be positive")
+    return ticker.upper(), action
+
+
+def _cash_change(action: str, shares: float, price: float, fee: float, tax: float) -> float:
+    """Signed cash movement of one trade."""
+    total_cost = shares * price
+    if action == "BUY":
+        return -(total_cost + fee + tax)
+    return total_cost - fee - tax  # SELL
+
 
 def record_transaction(
     account_id: int,
@@ -23,85 +73,114 @@ def record_transaction(
 
     BUY: holdings shares increase, cash decreases by (shares * price + fee + tax)
     SELL: holdings shares decrease, cash increases by (shares * price - fee - tax)
+
+    The returned Transaction carries the account's currency, so callers
+    that only need it for display don't have to fetch the account first.
     """
-    action = action.upper()
-    ticker = ticker.upper()
-    if action not in TRANSACTION_ACTIONS:
-        raise ValueError(f"Invalid action '{action}'. Must be BUY or SELL")
-    if shares <= 0:
-        raise ValueError("Shares must be positive")
-    if price <= 0:
-        raise ValueError("Price must be positive")
+    ticker, action = _validate_trade(ticker, action, shares, price)
 
-    # Get account to determine currency
-    account = get_account(account_id)
-    currency = account.currency
+    # Every step reads before it writes; take the write lock up front.
+    with get_connection(immediate=True) as conn:
+        # Account determines the trade currency; read under the same lock
+        # as the writes that use it.
+        currency = get_account(account_id, conn=conn).currency
 
-    with get_connection() as conn:
         # 1. Update holdings
         update_holding_from_trade(conn, account_id, ticker, action, shares, price)
 
         # 2. Update cash
-        total_cost = shares * price
-        if action == "BUY":
-            cash_change = -(total_cost + fee + tax)
-        else:  # SELL
-            cash_change = total_cost - fee - tax
-        adjust_cash(conn, account_id, currency, cash_change)
+        adjust_cash(conn, account_id, currency, _cash_change(action, shares, price, fee, tax))
 
         # 3. Record the transaction
-        if executed_at is None:
-            cursor = conn.execute(
-                """INSERT INTO transactions
-                   (account_id, ticker, action, shares, price, fee, tax, currency, notes, executed_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))""",
-                (account_id, ticker, action, shares, price, fee, tax, currency, notes),
-            )
-        else:
-            cursor = conn.execute(
-                """INSERT INTO transactions
-                   (account_id, ticker, action, shares, price, fee, tax, currency, notes, executed_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (account_id, ticker, action, shares, price, fee, tax, currency, notes, executed_at),
-            )
-
         row = conn.execute(
-            "SELECT * FROM transactions WHERE id = ?", (cursor.lastrowid,)
+            _INSERT_TRANSACTION_SQL,
+            (account_id, ticker, action, shares, price, fee, tax, currency, notes, executed_at),
         ).fetchone()
         return Transaction.from_row(row)
 
 
+def _trade_fields(ticker, action, shares, price, fee=0, tax=0, executed_at=None, notes=None):
+    """Fill in record_transaction's defaults for one record_transactions tuple."""
+    return ticker, action, shares, price, fee, tax, executed_at, notes
+
+
+def record_transactions(
+    account_id: int,
+    trades: Iterable[tuple],
+) -> list[Transaction]:
+    """Record many trades for one account in a single DB transaction.
+
+    Each trade is a tuple of record_transaction's arguments after `account_id`:
+    (ticker, action, shares, price[, fee, tax, executed_at, notes]).
+    Every trade is validated before anything is written, and if one fails
+    (e.g. overselling) none is recorded. Holdings are still applied trade by
+    trade in the given order, since average cost and the oversell check
+    depend on it; the cash change is summed into one adjust_cash and the
+    ledger rows go in with one executemany.
+    """
+    rows = []
+    cash_change = 0.0
+    for trade in trades:
+        ticker, action, shares, price, fee, tax, executed_at, notes = _trade_fields(*trade)
+        ticker, action = _validate_trade(ticker, action, shares, price)
+        cash_change += _cash_change(action, shares, price, fee, tax)
+        rows.append((ticker, action, shares, price, fee, tax, notes, executed_at))
+    if not rows:
+        return []
+
+    with get_connection(immediate=True) as conn:
+        currency = get_account(account_id, conn=conn).currency
+        for ticker, action, shares, price, *_ in rows:
+            update_holding_from_trade(conn, account_id, ticker, action, shares, price)
+        adjust_cash(conn, account_id, currency, cash_change)
+        last_id = conn.execute(_MAX_TRANSACTION_ID_SQL).fetchone()[0]
+        conn.executemany(_INSERT_TRANSACTION_NO_RETURN_SQL, [
+            (account_id, ticker, action, shares, price, fee, tax, currency, notes, executed_at)
+            for ticker, action, shares, price, fee, tax, notes, executed_at in rows
+        ])
+        return [
+            Transaction.from_row(r)
+            for r in conn.execute(_TRANSACTIONS_AFTER_ID_SQL, (last_id,))
+        ]
+
+
 def list_transactions(
     account_id: int = None,
     ticker: str = None,
     limit: int = 50,
 ) -> list[Transaction]:
     """List transactions with optional filters."""
-    conditions = []
-    params = []
+    return list(iter_transactions(account_id, ticker, limit))
 
+
+def iter_transactions(
+    account_id: int = None,
+    ticker: str = None,
+    limit: int = 50,
+) -> Iterator[Transaction]:
+    """Yield transactions one at a time (lazy list_transactions).
+
+    Rows are fetched before the first yield (see iter_accounts); only the
+    Transaction objects are built as the caller iterates.
+    """
+    params = []
     if account_id is not None:
-        conditions.append("account_id = ?")
         params.append(account_id)
     if ticker is not None:
-        conditions.append("ticker = ?")
         params.append(ticker.upper())
-
-    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-    query = f"SELECT * FROM transactions {where} ORDER BY executed_at DESC LIMIT ?"
     params.append(limit)
+    query = _LIST_TRANSACTIONS_SQL[account_id is not None, ticker is not None]
 
     with get_connection() as conn:
         rows = conn.execute(query, params).fetchall()
-        return [Transaction.from_row(r) for r in rows]
+    for r in rows:
+        yield Transaction.from_row(r)
 
 
 def get_transaction(transaction_id: int) -> Transaction:
     """Get a single transaction by ID."""
     with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM transactions WHERE id = ?", (transaction_id,)
-        ).fetchone()
+        row = conn.execute(_GET_TRANSACTION_SQL, (transaction_id,)).fetchone()
         if row is None:
             raise ValueError(f"Transaction ID {transaction_id} not found")
         return Transaction.from_row(row)
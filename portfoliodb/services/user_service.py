@@ -3,26 +3,26 @@
 from portfoliodb.db import get_connection
 from portfoliodb.models import User
 
+_INSERT_USER_SQL = (
+    f"INSERT INTO users (username, display_name) VALUES (?, ?) RETURNING {User.COLUMNS}"
+)
+_GET_USER_SQL = f"SELECT {User.COLUMNS} FROM users WHERE id = ?"
+_GET_USER_BY_USERNAME_SQL = f"SELECT {User.COLUMNS} FROM users WHERE username = ?"
+# Keyset page over the rowid; LIMIT -1 is SQLite for "no limit".
+_LIST_USERS_SQL = f"SELECT {User.COLUMNS} FROM users WHERE id > ? ORDER BY id LIMIT ?"
+
 
 def create_user(username: str, display_name: str) -> User:
     """Create a new user. Raises if username already exists."""
     with get_connection() as conn:
-        cursor = conn.execute(
-            "INSERT INTO users (username, display_name) VALUES (?, ?)",
-            (username, display_name),
-        )
-        row = conn.execute(
-            "SELECT * FROM users WHERE id = ?", (cursor.lastrowid,)
-        ).fetchone()
+        row = conn.execute(_INSERT_USER_SQL, (username, display_name)).fetchone()
         return User.from_row(row)
 
 
 def get_user(user_id: int) -> User:
     """Get a user by ID. Raises if not found."""
     with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM users WHERE id = ?", (user_id,)
-        ).fetchone()
+        row = conn.execute(_GET_USER_SQL, (user_id,)).fetchone()
         if row is None:
             raise ValueError(f"User ID {user_id} not found")
         return User.from_row(row)
@@ -31,18 +31,19 @@ def get_user(user_id: int) -> User:
 def get_user_by_username(username: str) -> User:
     """Get a user by username. Raises if not found."""
     with get_connection() as conn:
-        row = conn.execute(
-            "SELECT * FROM users WHERE username = ?", (username,)
-        ).fetchone()
+        row = conn.execute(_GET_USER_BY_USERNAME_SQL, (username,)).fetchone()
         if row is None:
             raise ValueError(f"User '{username}' not found")
         return User.from_row(row)
 
 
-def list_users() -> list[User]:
-    """List all users."""
+def list_users(limit: int | None = None, after_id: int = 0) -> list[User]:
+    """List users in id order, optionally one page at a time.
+
+    With no limit every user is returned. To page, pass `limit` and then the
+    last returned user's id as `after_id` for the next page; the id is the
+    rowid, so each page is a range read with no OFFSET skipping.
+    """
     with get_connection() as conn:
-        rows = conn.execute(
-            "SELECT * FROM users ORDER BY id"
-        ).fetchall()
+        rows = conn.execute(_LIST_USERS_SQL, (after_id, -1 if limit is None else limit)).fetchall()
         return [User.from_row(r) for r in rows]
@@ -1,4 +1,8 @@
-"""Constants for markets, currencies, and business rules."""
+"""Constants for markets, currencies, and business rules.
+
+The value sets are frozensets: they are only ever tested for membership,
+and a caller can't add to one by accident.
+"""
 
 # Market definitions: market code -> config
 MARKETS = {
@@ -7,7 +11,7 @@ MARKETS = {
     "SG": {"currency": "SGD", "suffix": ".SI", "name": "新加坡", "name_en": "Singapore"},
 }
 
-CURRENCIES = {"TWD", "USD", "SGD", "HKD", "JPY", "EUR", "CNY", "GBP", "AUD", "NZD", "ZAR"}
+CURRENCIES = frozenset({"TWD", "USD", "SGD", "HKD", "JPY", "EUR", "CNY", "GBP", "AUD", "NZD", "ZAR"})
 
 # Valid market-currency pairings
 MARKET_CURRENCY = {
@@ -17,26 +21,26 @@ MARKET_CURRENCY = {
 }
 
 # Transaction types
-TRANSACTION_ACTIONS = {"BUY", "SELL"}
+TRANSACTION_ACTIONS = frozenset({"BUY", "SELL"})
 
 # Cash transaction categories
-CASH_CATEGORIES = {
+CASH_CATEGORIES = frozenset({
     "DEPOSIT", "WITHDRAWAL", "DIVIDEND", "INTEREST", "FEE", "FX_CONVERSION",
-}
+})
 
 # Account types
-ACCOUNT_TYPES = {"brokerage", "bank"}
+ACCOUNT_TYPES = frozenset({"brokerage", "bank"})
 
 # Planned order statuses and priorities
-ORDER_STATUSES = {"PENDING", "EXECUTED", "CANCELLED"}
-ORDER_PRIORITIES = {"HIGH", "NORMAL", "LOW"}
+ORDER_STATUSES = frozenset({"PENDING", "EXECUTED", "CANCELLED"})
+ORDER_PRIORITIES = frozenset({"HIGH", "NORMAL", "LOW"})
 
 # Stock ranking methods (portfolio-db doesn't enforce a single scoring
 # framework — Sir's methodology stack has three: PEG (Lynch-style, lower is
 # better), Kelly f* (higher is better), and the V1 15-point model (掌握度 +
 # 估值吸引力 + 長期品質, higher is better). See ../peg skill and
 # scratch/20260527-投組初步想法.md (Dropbox-synced) for the source doctrine.
-RANKING_METHODS = {"peg", "kelly", "fifteen_point"}
+RANKING_METHODS = frozenset({"peg", "kelly", "fifteen_point"})
 # Explicit per-method direction (not an exclusion set) so a new method added
 # to RANKING_METHODS without a matching entry here fails loudly (KeyError)
 # instead of silently defaulting to some direction.
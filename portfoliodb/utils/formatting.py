@@ -1,24 +1,38 @@
 """Formatting helpers for currency, P&L, and percentages."""
 
+from functools import lru_cache
+
 from portfoliodb.utils.constants import CURRENCY_SYMBOLS
 
+# P&L colour by sign, indexed with ``(amount > 0) - (amount < 0) + 1``.
+PNL_COLORS = ("red", "white", "green")
+
+
+@lru_cache(maxsize=16)
+def _currency_style(currency: str) -> tuple[str, bool]:
+    """(symbol, is_twd) for a currency code, resolved once per code.
+
+    The formatters run once per table cell; this keeps the upper() and the
+    CURRENCY_SYMBOLS lookup out of that loop.
+    """
+    code = currency.upper()
+    return CURRENCY_SYMBOLS.get(code, "$"), code == "TWD"
+
 
 def format_currency(amount: float, currency: str) -> str:
     """Format amount with currency symbol. e.g. NT$1,234,567.00"""
-    symbol = CURRENCY_SYMBOLS.get(currency.upper(), "$")
-    if currency.upper() == "TWD":
-        # TWD usually shows without decimals for large amounts
-        if abs(amount) >= 1:
-            return f"{symbol}{amount:,.0f}"
-        return f"{symbol}{amount:,.2f}"
+    symbol, twd = _currency_style(currency)
+    # TWD usually shows without decimals for large amounts
+    if twd and abs(amount) >= 1:
+        return f"{symbol}{amount:,.0f}"
     return f"{symbol}{amount:,.2f}"
 
 
 def format_pnl(amount: float, currency: str) -> str:
     """Format P&L with +/- prefix."""
-    symbol = CURRENCY_SYMBOLS.get(currency.upper(), "$")
+    symbol, twd = _currency_style(currency)
     sign = "+" if amount >= 0 else ""
-    if currency.upper() == "TWD":
+    if twd:
         return f"{sign}{symbol}{amount:,.0f}"
     return f"{sign}{symbol}{amount:,.2f}"
 
@@ -30,18 +44,15 @@ def format_percent(pct: float) -> str:
 
 
 def format_shares(shares: float, market: str = "US") -> str:
-    """Format share count. Integer for TW, decimal for US/SG."""
-    if market == "TW" and shares == int(shares):
-        return f"{int(shares):,}"
-    if shares == int(shares):
+    """Format share count: whole counts without decimals, fractional to 4 places.
+
+    `market` is accepted for callers' sake; TW lots are whole shares anyway.
+    """
+    if type(shares) is int or shares.is_integer():
         return f"{int(shares):,}"
     return f"{shares:,.4f}"
 
 
 def pnl_color(amount: float) -> str:
     """Return rich color tag based on P&L direction."""
-    if amount > 0:
-        return "green"
-    elif amount < 0:
-        return "red"
-    return "white"
+    return PNL_COLORS[(amount > 0) - (amount < 0) + 1]
@@ -28,12 +28,11 @@ def detect_market(ticker: str) -> str:
         "D05.SI"   -> "SG"
     """
     ticker = ticker.upper()
-    if ticker.endswith(".TW") or ticker.endswith(".TWO"):
+    if ticker.endswith((".TW", ".TWO")):
         return "TW"
-    elif ticker.endswith(".SI"):
+    if ticker.endswith(".SI"):
         return "SG"
-    else:
-        return "US"
+    return "US"
 
 
 def normalize_ticker(ticker: str) -> str:
@@ -39,3 +39,23 @@ def tmp_db(tmp_path, monkeypatch):
 
     db_mod.init_db()
     yield db_path
+
+
+@pytest.fixture()
+def account(request, tmp_db):
+    """User "ian" and one account owned (legally + economically) by them.
+
+    Defaults to a Firstrade US account holding 1,000 USD. Parametrise with
+    ``indirect=True`` and ``(account_name, broker, market, cash)`` for
+    another kind; ``cash`` is in the market's currency, ``None`` for none.
+    """
+    from portfoliodb.services.account_service import create_account
+    from portfoliodb.services.cash_service import set_cash
+    from portfoliodb.services.user_service import create_user
+
+    name, broker, market, cash = getattr(request, "param", ("FT", "Firstrade", "US", 1000.0))
+    u = create_user("ian", "Ian")
+    acc = create_account(u.id, u.id, name, broker, market)
+    if cash is not None:
+        set_cash(acc.id, acc.currency, cash)
+    return acc
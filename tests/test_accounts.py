@@ -0,0 +1,26 @@
+"""account_service listings against the tmp_db fixture."""
+
+from portfoliodb.services.account_service import (
+    create_account, deactivate_account, list_accounts, list_accounts_with_cash,
+)
+from portfoliodb.services.cash_service import list_cash, set_cash
+from portfoliodb.services.user_service import create_user
+
+
+def test_accounts_with_cash_matches_per_account_lookups(tmp_db):
+    ian, dad = create_user("ian", "Ian"), create_user("dad", "Dad")
+    ft = create_account(ian.id, ian.id, "FT", "Firstrade", "US")
+    scb = create_account(ian.id, ian.id, "SCB", "SCB", "SG", "bank")
+    create_account(dad.id, ian.id, "Fubon", "Fubon", "TW")  # no cash at all
+    old = create_account(ian.id, ian.id, "Old", "Firstrade", "US")
+    set_cash(ft.id, "USD", 1000.0)
+    set_cash(scb.id, "USD", 5.0)
+    set_cash(scb.id, "SGD", 20.0)
+    set_cash(old.id, "USD", 1.0)
+    deactivate_account(old.id)
+
+    for filters in ({}, {"legal_owner_id": ian.id}, {"economic_owner_id": ian.id}):
+        assert list_accounts_with_cash(**filters) == [
+            (acc, list_cash(acc.id)) for acc in list_accounts(**filters)
+        ]
+    assert [len(cash) for _, cash in list_accounts_with_cash()] == [1, 2, 0]
@@ -0,0 +1,143 @@
+"""Broker row parsing against fake SDK objects — no fubon_neo / shioaji needed.
+
+The brokers' login() path needs the real SDK, so tests build a broker, mark it
+logged in, and hang a minimal fake SDK/API off it.
+"""
+
+from __future__ import annotations
+
+import math
+import subprocess
+import sys
+from types import SimpleNamespace as NS
+
+from portfoliodb.brokers.fubon_broker import FubonBroker
+from portfoliodb.brokers.sinopac_broker import SinoPacBroker
+from portfoliodb.brokers.types import BrokerHolding
+
+
+def _fubon_with(rows, balance=0.0):
+    broker = FubonBroker()
+    result = NS(is_success=True, data=rows)
+    broker.sdk = NS(accounting=NS(
+        unrealized_gains_and_loses=lambda account: result,
+        bank_remain=lambda account: NS(is_success=True, data=balance),
+        inventories=lambda account: result,
+    ))
+    broker.accounts = NS(data=["ACC-1"])
+    broker._logged_in = True
+    return broker
+
+
+def _sinopac_with(positions, balance=None):
+    broker = SinoPacBroker()
+    broker.api = NS(
+        list_positions=lambda account: positions if account == "STOCK-1" else None,
+        account_balance=lambda: balance,
+    )
+    broker._stock_account = "STOCK-1"
+    broker._logged_in = True
+    return broker
+
+
+class TestFubonHoldings:
+    def test_current_field_names(self):
+        rows = [NS(stock_no="2330", quantity=1000, cost_price=580.5,
+                   market_price=1915.0, unrealized_profit=1334500.0)]
+        assert _fubon_with(rows).get_holdings() == [BrokerHolding(
+            ticker="2330.TW", shares=1000.0, avg_cost=580.5,
+            last_price=1915.0, pnl=1334500.0,
+        )]
+
+    def test_legacy_field_names(self):
+        rows = [NS(symbol="2317", qty=2000, price=100.0, pnl=-500.0)]
+        assert _fubon_with(rows).get_holdings() == [BrokerHolding(
+            ticker="2317.TW", shares=2000.0, avg_cost=100.0,
+            last_price=0.0, pnl=-500.0,
+        )]
+
+    def test_unsuccessful_result_is_empty(self):
+        broker = _fubon_with([])
+        assert broker.get_holdings() == []
+
+    def test_balance(self):
+        assert _fubon_with([], balance=500000).get_balance() == {
+            "balance": 500000.0, "currency": "TWD",
+        }
+
+    def test_snapshot_matches_separate_calls(self):
+        rows = [NS(stock_no="2330", quantity=1000, cost_price=580.5)]
+        broker = _fubon_with(rows, balance=500000)
+        assert broker.get_snapshot() == {
+            "holdings": broker.get_holdings(),
+            "balance": broker.get_balance(),
+        }
+
+
+class TestFubonInventories:
+    def test_raw_is_opt_in(self):
+        rows = [NS(symbol="2317", qty=2000)]
+        broker = _fubon_with(rows)
+        assert broker.get_inventories() == [{"ticker": "2317", "shares": 2000}]
+        assert broker.get_inventories(include_raw=True)[0]["raw"] == str(rows[0])
+
+    def test_iter_inventories_is_lazy(self):
+        broker = _fubon_with([NS(stock_no="2330", quantity=1000)])
+        broker._logged_in = False
+        it = broker.iter_inventories()  # no login check until iterated
+        broker._logged_in = True
+        assert next(it) == {"ticker": "2330", "shares": 1000}
+
+
+class TestSinoPacHoldings:
+    def test_long_and_short_positions(self):
+        positions = [
+            NS(code="2330", quantity=1000, price=580.5, direction=NS(value="Buy"),
+               last_price=1915.0, pnl=1334500.0),
+            NS(code="2317", quantity=500, price=100.0, direction=NS(value="Sell")),
+        ]
+        assert _sinopac_with(positions).get_holdings() == [
+            BrokerHolding(ticker="2330.TW", shares=1000.0, avg_cost=580.5,
+                          last_price=1915.0, pnl=1334500.0),
+            BrokerHolding(ticker="2317.TW", shares=-500.0, avg_cost=100.0),
+        ]
+
+    def test_holdings_arrays_match_row_form(self):
+        positions = [
+            NS(code="2330", quantity=1000, price=580.5, direction=NS(value="Buy"),
+               last_price=1915.0, pnl=1334500.0),
+            NS(code="2317", quantity=500, price=100.0, direction=NS(value="Sell")),
+        ]
+        cols = _sinopac_with(positions).get_holdings_arrays()
+        assert cols["ticker"] == ["2330.TW", "2317.TW"]
+        assert cols["shares"].tolist() == [1000.0, -500.0]
+        assert cols["avg_cost"].tolist() == [580.5, 100.0]
+        assert cols["last_price"][0] == 1915.0
+        assert math.isnan(cols["last_price"][1])
+
+    def test_balance(self):
+        bal = NS(acc_balance=500000, date="2026-02-21")
+        assert _sinopac_with([], balance=bal).get_balance() == {
+            "balance": 500000.0, "currency": "TWD", "date": "2026-02-21",
+        }
+
+    def test_snapshot_matches_separate_calls(self):
+        positions = [NS(code="2330", quantity=1000, price=580.5, direction=NS(value="Buy"))]
+        broker = _sinopac_with(positions, balance=NS(acc_balance=1.0))
+        assert broker.get_snapshot() == {
+            "holdings": broker.get_holdings(),
+            "balance": broker.get_balance(),
+        }
+
+
+def test_sync_service_import_leaves_brokers_unloaded():
+    # Each sync_* function imports its own broker (and that broker its SDK)
+    # on call, so `sync firstrade` never pays for shioaji / fubon_neo.
+    code = (
+        "import sys, portfoliodb.services.sync_service; "
+        "print(sorted(m for m in sys.modules if m.split('.')[0] in "
+        "('shioaji', 'fubon_neo') or m.endswith('_broker')))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                         text=True, check=True).stdout
+    assert out.strip() == "[]"
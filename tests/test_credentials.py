@@ -0,0 +1,118 @@
+"""Broker credentials.json loading: parse cache + mtime/size invalidation.
+
+config.py binds CREDENTIALS_PATH at import time, so we patch it (and the
+module-level parse cache) to a tmp file — the real per-OS credentials file is
+never touched.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from portfoliodb.brokers import config
+
+
+@pytest.fixture()
+def creds_path(tmp_path, monkeypatch):
+    path = tmp_path / "credentials.json"
+    monkeypatch.setattr(config, "CREDENTIALS_DIR", tmp_path)
+    monkeypatch.setattr(config, "CREDENTIALS_PATH", path)
+    monkeypatch.setattr(config, "_CREDS_CACHE", None)
+    return path
+
+
+def _write(path, data, mtime_ns=None):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestLoadCredentials:
+    def test_missing_file_raises(self, creds_path):
+        with pytest.raises(FileNotFoundError):
+            config.load_credentials("fubon")
+        assert config.has_credentials("fubon") is False
+
+    def test_missing_broker_raises_key_error(self, creds_path):
+        _write(creds_path, {"fubon": {"user_id": "u"}})
+        with pytest.raises(KeyError, match="sinopac"):
+            config.load_credentials("sinopac")
+
+    def test_unchanged_file_is_parsed_once(self, creds_path, monkeypatch):
+        _write(creds_path, {"fubon": {"user_id": "u"}})
+        calls = []
+        real_loads = config._loads
+        monkeypatch.setattr(config, "_loads", lambda b: calls.append(1) or real_loads(b))
+
+        assert config.has_credentials("fubon")
+        assert config.load_credentials("fubon") == {"user_id": "u"}
+        assert config.load_credentials("fubon") == {"user_id": "u"}
+        assert len(calls) == 1
+
+    def test_has_credentials_absent_broker_skips_parse(self, creds_path, monkeypatch):
+        _write(creds_path, {"fubon": {"user_id": "u"}})
+        monkeypatch.setattr(config, "_loads", lambda b: pytest.fail("parsed"))
+        assert config.has_credentials("sinopac") is False
+
+    def test_has_credentials_needle_in_value_is_not_a_key(self, creds_path):
+        _write(creds_path, {"fubon": {"note": "sinopac"}})
+        assert config.has_credentials("sinopac") is False
+        assert config.has_credentials("fubon") is True
+
+    def test_edit_on_disk_invalidates_cache(self, creds_path):
+        _write(creds_path, {"fubon": {"user_id": "old"}}, mtime_ns=1_000_000_000)
+        assert config.load_credentials("fubon") == {"user_id": "old"}
+
+        _write(creds_path, {"fubon": {"user_id": "new"}}, mtime_ns=2_000_000_000)
+        assert config.load_credentials("fubon") == {"user_id": "new"}
+
+    def test_same_mtime_different_size_invalidates_cache(self, creds_path):
+        _write(creds_path, {"fubon": {"user_id": "old"}}, mtime_ns=1_000_000_000)
+        assert config.load_credentials("fubon") == {"user_id": "old"}
+
+        _write(creds_path, {"fubon": {"user_id": "newer"}}, mtime_ns=1_000_000_000)
+        assert config.load_credentials("fubon") == {"user_id": "newer"}
+
+    def test_caller_edits_do_not_reach_the_cache(self, creds_path):
+        _write(creds_path, {"fubon": {"user_id": "u", "person_id": "p"}})
+        config.load_credentials("fubon").pop("person_id")
+        assert config.load_credentials("fubon") == {"user_id": "u", "person_id": "p"}
+
+        mine = {"api_key": "k"}
+        config.save_credentials("sinopac", mine)
+        mine["api_key"] = "changed"
+        assert config.load_credentials("sinopac") == {"api_key": "k"}
+
+
+class TestSaveCredentials:
+    def test_save_merges_and_is_visible_to_next_load(self, creds_path):
+        _write(creds_path, {"fubon": {"user_id": "u"}})
+        config.save_credentials("sinopac", {"api_key": "k"})
+
+        assert config.load_credentials("fubon") == {"user_id": "u"}
+        assert config.load_credentials("sinopac") == {"api_key": "k"}
+        on_disk = json.loads(creds_path.read_text(encoding="utf-8"))
+        assert set(on_disk) == {"fubon", "sinopac"}
+
+    def test_save_creates_file_when_absent(self, creds_path):
+        config.save_credentials("fubon", {"user_id": "張"})
+        assert config.has_credentials("fubon")
+        assert "張" in creds_path.read_text(encoding="utf-8")
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+    def test_saved_file_is_owner_only(self, creds_path):
+        _write(creds_path, {"fubon": {"user_id": "u"}})
+        os.chmod(creds_path, 0o600)
+        config.save_credentials("sinopac", {"api_key": "k"})
+        assert creds_path.stat().st_mode & 0o777 == 0o600
+
+        creds_path.unlink()
+        config.save_credentials("fubon", {"user_id": "u"})  # fresh file too
+        assert creds_path.stat().st_mode & 0o777 == 0o600
+
+    def test_save_leaves_no_temp_file(self, creds_path):
+        config.save_credentials("fubon", {"user_id": "u"})
+        assert [p.name for p in creds_path.parent.iterdir()] == ["credentials.json"]
@@ -0,0 +1,196 @@
+"""db.init_db / get_connection behaviour against the tmp_db fixture."""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import fields
+
+import pytest
+
+from portfoliodb import db as db_mod
+from portfoliodb import models
+from portfoliodb.services import (
+    account_service, holding_service, transaction_service, user_service,
+)
+
+
+def _tables(path):
+    with sqlite3.connect(path) as conn:
+        return {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+
+
+class TestInitDb:
+    def test_second_call_skips_schema_script(self, tmp_db, monkeypatch):
+        calls = []
+        real_connect = db_mod.get_connection
+        monkeypatch.setattr(db_mod, "get_connection", lambda: calls.append(1) or real_connect())
+        db_mod.init_db()
+        db_mod.init_db()
+        assert calls == []
+
+    def test_redirected_db_path_gets_schema(self, tmp_db, tmp_path, monkeypatch):
+        other = tmp_path / "other" / "portfolio.db"
+        monkeypatch.setattr(db_mod, "DB_DIR", other.parent)
+        monkeypatch.setattr(db_mod, "DB_PATH", other)
+        db_mod.init_db()
+        assert {"users", "accounts", "holdings"} <= _tables(other)
+
+    def test_old_sqlite_is_refused_before_any_schema(self, tmp_db, tmp_path, monkeypatch):
+        other = tmp_path / "other" / "portfolio.db"
+        monkeypatch.setattr(db_mod, "DB_DIR", other.parent)
+        monkeypatch.setattr(db_mod, "DB_PATH", other)
+        monkeypatch.setattr(db_mod.sqlite3, "sqlite_version_info", (3, 31, 1))
+        with pytest.raises(RuntimeError, match=r"needs 3\.35\.0\+"):
+            db_mod.init_db()
+        assert not other.exists()
+
+    def test_schema_is_applied_atomically(self, tmp_db, tmp_path, monkeypatch):
+        other = tmp_path / "other" / "portfolio.db"
+        monkeypatch.setattr(db_mod, "DB_DIR", other.parent)
+        monkeypatch.setattr(db_mod, "DB_PATH", other)
+        monkeypatch.setattr(db_mod, "SCHEMA_SQL", "CREATE TABLE a (x); CREATE TABLE (;")
+        with pytest.raises(sqlite3.OperationalError):
+            db_mod.init_db()
+        assert "a" not in _tables(other)
+
+    @pytest.mark.parametrize("filters, index", [
+        ((False, False), "idx_tx_date"),
+        ((True, False), "idx_tx_account_date"),
+        ((False, True), "idx_tx_ticker_date"),
+        ((True, True), "idx_tx_"),
+    ])
+    def test_transaction_listings_walk_an_index(self, tmp_db, filters, index):
+        sql = transaction_service._LIST_TRANSACTIONS_SQL[filters]
+        with db_mod.get_connection() as conn:
+            plan = " ".join(r["detail"] for r in conn.execute(
+                "EXPLAIN QUERY PLAN " + sql, (1,) * sql.count("?")))
+        assert f"USING INDEX {index}" in plan
+        assert "TEMP B-TREE" not in plan  # ORDER BY executed_at DESC off the index
+
+
+class TestGetConnection:
+    def test_connection_is_reused_per_thread(self, tmp_db):
+        with db_mod.get_connection() as a:
+            pass
+        with db_mod.get_connection() as b:
+            assert b is a
+
+    def test_nested_failure_only_undoes_inner_block(self, tmp_db):
+        with db_mod.get_connection() as conn:
+            conn.execute("INSERT INTO users (username, display_name) VALUES ('a', 'A')")
+            try:
+                with db_mod.get_connection() as inner:
+                    inner.execute("INSERT INTO users (username, display_name) VALUES ('b', 'B')")
+                    raise RuntimeError("boom")
+            except RuntimeError:
+                pass
+        with sqlite3.connect(tmp_db) as check:
+            names = [r[0] for r in check.execute("SELECT username FROM users")]
+        assert names == ["a"]
+
+    def test_use_connection_joins_the_callers_transaction(self, tmp_db):
+        statements = []
+        with db_mod.get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            with db_mod.use_connection(conn) as c:
+                assert c is conn
+            with db_mod.use_connection() as c:
+                assert c is conn
+            conn.set_trace_callback(None)
+        assert statements == ["SAVEPOINT sp1", "RELEASE sp1"]  # only the second block
+
+    def test_immediate_takes_the_write_lock_before_any_write(self, tmp_db):
+        other = sqlite3.connect(tmp_db, timeout=0, isolation_level=None)
+        with db_mod.get_connection(immediate=True) as conn:
+            conn.execute("SELECT 1 FROM users").fetchall()
+            with pytest.raises(sqlite3.OperationalError, match="locked"):
+                other.execute("BEGIN IMMEDIATE")
+        other.execute("BEGIN IMMEDIATE")  # released on commit
+        other.execute("ROLLBACK")
+        other.close()
+
+    @pytest.mark.parametrize("make_iter", [
+        lambda acc: account_service.iter_accounts(),
+        lambda acc: holding_service.iter_holdings(acc.id),
+        lambda acc: transaction_service.iter_transactions(account_id=acc.id),
+    ], ids=["accounts", "holdings", "transactions"])
+    def test_abandoned_iterator_keeps_writes_made_meanwhile(self, account, make_iter):
+        transaction_service.record_transaction(account.id, "NVDA", "BUY", 1, 10.0)
+        it = make_iter(account)
+        next(it)
+        user_service.create_user("b", "B")
+        del it  # closes the generator
+        assert [u.username for u in user_service.list_users()] == ["ian", "b"]
+
+    def test_wal_with_synchronous_normal(self, tmp_db):
+        with db_mod.get_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+            # 0 where SQLite was built without mmap (SQLITE_MAX_MMAP_SIZE=0)
+            assert conn.execute("PRAGMA mmap_size").fetchone()[0] in (0, 268435456)
+
+
+@pytest.mark.parametrize("model, table", [
+    (models.User, "users"),
+    (models.Account, "accounts"),
+    (models.Holding, "holdings"),
+    (models.Transaction, "transactions"),
+    (models.CashPosition, "cash_positions"),
+    (models.CashTransaction, "cash_transactions"),
+    (models.PlannedOrder, "planned_orders"),
+])
+def test_positional_models_follow_table_column_order(tmp_db, model, table):
+    # A fresh DB declares the columns in model field order. Reads don't rely
+    # on it (see the drift test below), but COLUMNS is built from the fields.
+    with db_mod.get_connection() as conn:
+        columns = [r["name"] for r in conn.execute(f"PRAGMA table_info({table})")]
+    assert columns == [f.name for f in fields(model)]
+    assert model.COLUMNS == ", ".join(columns)
+
+
+def test_models_load_by_column_name_on_a_drifted_table(tmp_db, monkeypatch):
+    # A hand-migrated DB: users and holdings rebuilt with their columns in
+    # another physical order, transactions with an extra column appended by
+    # ALTER TABLE. Every service query names {Model.COLUMNS}, never *.
+    raw = sqlite3.connect(tmp_db, isolation_level=None)
+    raw.executescript("""
+        DROP TABLE users;
+        CREATE TABLE users (
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            display_name TEXT NOT NULL,
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL UNIQUE
+        );
+        DROP TABLE holdings;
+        CREATE TABLE holdings (
+            avg_cost REAL NOT NULL DEFAULT 0,
+            updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+            ticker TEXT NOT NULL,
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            shares REAL NOT NULL DEFAULT 0,
+            account_id INTEGER NOT NULL REFERENCES accounts(id),
+            created_at TEXT NOT NULL DEFAULT (datetime('now')),
+            UNIQUE(account_id, ticker)
+        );
+        ALTER TABLE transactions ADD COLUMN broker_ref TEXT;
+    """)
+    raw.close()
+
+    from portfoliodb.services import portfolio_service, price_service
+    monkeypatch.setattr(price_service, "fetch_prices", lambda tickers, cache_rows=None: {
+        t: {"price": 12.0, "currency": "USD"} for t in tickers
+    })
+
+    u = user_service.create_user("ian", "Ian")
+    assert (u.username, u.display_name) == ("ian", "Ian")
+    assert user_service.list_users() == [user_service.get_user_by_username("ian")] == [u]
+    acc = account_service.create_account(u.id, u.id, "FT", "Firstrade", "US")
+    h = holding_service.add_holding(acc.id, "aapl", 10, 100.0)
+    assert (h.account_id, h.ticker, h.shares, h.avg_cost) == (acc.id, "AAPL", 10, 100.0)
+    t = transaction_service.record_transaction(acc.id, "AAPL", "BUY", 5, 10.0, fee=1.0)
+    assert (t.ticker, t.shares, t.price, t.fee, t.currency) == ("AAPL", 5, 10.0, 1.0, "USD")
+    assert transaction_service.get_transaction(t.id) == t
+    (held,) = portfolio_service.get_account_summary(acc.id)["holdings"]
+    assert (held["holding"].ticker, held["holding"].shares) == ("AAPL", 15)
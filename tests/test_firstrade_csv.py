@@ -0,0 +1,60 @@
+"""parse_firstrade_csv against a small hand-written export."""
+
+import pytest
+
+from portfoliodb.importers.firstrade_csv import parse_firstrade_csv
+
+CSV = """﻿Date,Symbol,Type,Quantity,Price,Amount
+02/20/2026,AAPL,BUY,10,178.50,"1,785.00"
+02/21/2026,aapl,Sell,4,180.00,720.00
+02/10/2026,AAPL,DIVIDEND,0,0.00,25.50
+01/05/2026,,ACH DEPOSIT,0,0.00,"5,000.00"
+2026-01-06,,WITHDRAWAL,0,0.00,100.00
+01/07/2026,,FEE,0,0.00,1.00
+02/30/2026,,DEPOSIT,0,0.00,999.00
+,,DEPOSIT,0,0.00,999.00
+01/08/2026,,JOURNAL,0,0.00,50.00
+"""
+
+
+@pytest.fixture()
+def parsed(tmp_path):
+    path = tmp_path / "firstrade.csv"
+    path.write_text(CSV, encoding="utf-8")
+    return parse_firstrade_csv(str(path))
+
+
+class TestParseFirstradeCsv:
+    def test_trades(self, parsed):
+        assert parsed["transactions"] == [
+            {"date": "2026-02-20", "ticker": "AAPL", "action": "BUY",
+             "shares": 10.0, "price": 178.5, "amount": 1785.0},
+            {"date": "2026-02-21", "ticker": "AAPL", "action": "SELL",
+             "shares": 4.0, "price": 180.0, "amount": 720.0},
+        ]
+        assert parsed["current_holdings"] == {"AAPL": {"shares": 6.0, "total_cost": 1785.0}}
+
+    def test_cash_movements_skip_bad_dates_and_unknown_types(self, parsed):
+        assert [(m["date"], m["category"], m["amount"], m["description"])
+                for m in parsed["cash_movements"]] == [
+            ("2026-02-10", "DIVIDEND", 25.5, "DIVIDEND - AAPL"),
+            ("2026-01-05", "DEPOSIT", 5000.0, "ACH DEPOSIT"),
+            ("2026-01-06", "WITHDRAWAL", -100.0, "WITHDRAWAL"),
+            ("2026-01-07", "FEE", -1.0, "FEE"),
+        ]
+
+    def test_cash_balance(self, parsed):
+        assert parsed["cash_balance"] == pytest.approx(25.5 + 5000 - 100 - 1 - 1785 + 720)
+
+    def test_closed_position_resets_cost_basis(self, tmp_path):
+        path = tmp_path / "roundtrip.csv"
+        path.write_text(
+            "Date,Symbol,Type,Quantity,Price,Amount\n"
+            "03/01/2026,NVDA,BUY,2,50.00,100.00\n"   # rows out of date order
+            "01/01/2026,NVDA,BUY,5,10.00,50.00\n"
+            "02/01/2026,NVDA,SELL,5,20.00,100.00\n",
+            encoding="utf-8",
+        )
+        assert parse_firstrade_csv(str(path))["current_holdings"] == {
+            "NVDA": {"shares": 2.0, "total_cost": 100.0},
+        }
@@ -0,0 +1,89 @@
+"""fx_service.get_all_rates: one cache read, live quotes only for misses."""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+
+import pytest
+
+from portfoliodb.services import fx_service
+from portfoliodb.utils.constants import CURRENCIES, FX_CACHE_TTL_MINUTES
+
+
+def _fake_ticker(calls, bad=()):
+    class _FakeTicker:
+        def __init__(self, symbol):
+            calls.append(symbol)
+            self._symbol = symbol
+
+        @property
+        def fast_info(self):
+            return {} if self._symbol in bad else {"lastPrice": 2.0}
+    return _FakeTicker
+
+
+def test_cached_rates_skip_yahoo_and_misses_get_cached(tmp_db, monkeypatch):
+    with sqlite3.connect(tmp_db) as conn:
+        conn.execute(
+            "INSERT INTO exchange_rates (from_currency, to_currency, rate, fetched_at) "
+            "VALUES ('USD', 'TWD', 31.5, datetime('now'))"
+        )
+    calls = []
+    monkeypatch.setattr(fx_service.yf, "Ticker", _fake_ticker(calls))
+
+    rates = fx_service.get_all_rates("twd")
+    assert set(rates) == CURRENCIES
+    assert (rates["TWD"], rates["USD"], rates["SGD"]) == (1.0, 31.5, 2.0)
+    assert len(calls) == len(CURRENCIES) - 2  # neither TWD nor cached USD
+
+    calls.clear()
+    assert fx_service.get_all_rates("TWD") == rates
+    assert calls == []
+
+
+def test_failed_quote_raises_but_caches_the_rest(tmp_db, monkeypatch):
+    calls = []
+    bad = {fx_service.fx_ticker("ZAR", "TWD")}
+    monkeypatch.setattr(fx_service.yf, "Ticker", _fake_ticker(calls, bad))
+    with pytest.raises(ValueError, match="ZAR/TWD"):
+        fx_service.get_all_rates("TWD")
+    cached = fx_service._get_cached_rates(["USD", "ZAR"], "TWD")
+    assert {curr: rate for curr, (rate, _) in cached.items()} == {"USD": 2.0}
+
+
+def test_memo_expires_with_the_cache_row(tmp_db, monkeypatch):
+    calls = []
+    monkeypatch.setattr(fx_service.yf, "Ticker", _fake_ticker(calls))
+    # A row with one minute of its TTL left: the memo must not outlive it.
+    with sqlite3.connect(tmp_db) as conn:
+        conn.execute(
+            "INSERT INTO exchange_rates (from_currency, to_currency, rate, fetched_at) "
+            "VALUES ('USD', 'TWD', 31.5, datetime('now', ?))",
+            (f"-{FX_CACHE_TTL_MINUTES - 1} minutes",),
+        )
+    assert fx_service.fetch_rate("usd", "TWD") == 31.5
+    (rate, expires_at), = fx_service._RATE_MEMO.values()
+    assert rate == 31.5 and 0 < expires_at - time.time() <= 61
+
+    with sqlite3.connect(tmp_db) as conn:
+        conn.execute("UPDATE exchange_rates SET rate = 30.0")
+    assert fx_service.fetch_rate("USD", "TWD") == 31.5  # memo, not the table
+    assert calls == []
+
+    monkeypatch.setattr(fx_service.time, "time", lambda: expires_at + 1)
+    assert fx_service.fetch_rate("USD", "TWD") == 2.0  # row expired too: live quote
+    assert calls == [fx_service.fx_ticker("USD", "TWD")]
+
+
+def test_cache_write_invalidates_memo(tmp_db, monkeypatch):
+    calls = []
+    monkeypatch.setattr(fx_service.yf, "Ticker", _fake_ticker(calls))
+    rates = fx_service.get_all_rates("TWD")
+    rates["USD"] = -1.0  # callers get a copy
+    assert fx_service.get_all_rates("TWD")["USD"] == 2.0
+    assert len(calls) == len(CURRENCIES) - 1
+
+    fx_service._update_cache([("USD", "TWD", 33.0)])
+    assert fx_service.fetch_rate("USD", "TWD") == 33.0
+    assert len(calls) == len(CURRENCIES) - 1
@@ -0,0 +1,45 @@
+"""execute_order / cancel_order / update_order against the tmp_db fixture."""
+
+import pytest
+
+from portfoliodb.services import order_service
+from portfoliodb.services.cash_service import get_cash
+from portfoliodb.services.holding_service import get_holding
+from portfoliodb.services.transaction_service import list_transactions
+
+
+def test_execute_links_the_recorded_trade(account):
+    order = order_service.create_order(account.id, "NVDA", "BUY", 3, 85.0)
+    done = order_service.execute_order(order.id, 84.0)
+    (tx,) = list_transactions(account_id=account.id)
+    assert (done.status, done.linked_transaction_id) == ("EXECUTED", tx.id)
+    assert get_holding(account.id, "NVDA").shares == 3
+
+
+def test_failed_trade_leaves_order_pending(account):
+    order = order_service.create_order(account.id, "NVDA", "SELL", 3, 85.0)
+    with pytest.raises(ValueError, match="Cannot sell"):
+        order_service.execute_order(order.id, 84.0)
+    assert order_service.list_orders(account.id)[0].status == "PENDING"
+    assert list_transactions(account_id=account.id) == []
+    assert get_cash(account.id, "USD").balance == 1000.0
+
+
+def test_cancel_and_update_return_the_new_row(account):
+    order = order_service.create_order(account.id, "NVDA", "BUY", 3, 85.0)
+    assert order_service.update_order(order.id, shares=5).shares == 5
+    assert order_service.cancel_order(order.id).status == "CANCELLED"
+    with pytest.raises(ValueError, match="already CANCELLED"):
+        order_service.cancel_order(order.id)
+
+
+def test_guards_report_missing_and_non_pending_orders(account):
+    order = order_service.create_order(account.id, "NVDA", "BUY", 3, 85.0)
+    order_service.execute_order(order.id, 84.0)
+    with pytest.raises(ValueError, match="already EXECUTED"):
+        order_service.execute_order(order.id, 84.0)
+    with pytest.raises(ValueError, match="with status EXECUTED"):
+        order_service.update_order(order.id, shares=5)
+    with pytest.raises(ValueError, match="Order ID 999 not found"):
+        order_service.cancel_order(999)
+    assert len(list_transactions(account_id=account.id)) == 1
@@ -0,0 +1,110 @@
+"""portfolio_service summaries: price lookups batched across holdings, accounts, users."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from portfoliodb.services import fx_service, portfolio_service, price_service
+from portfoliodb.services.account_service import create_account
+from portfoliodb.services.holding_service import add_holding
+from portfoliodb.services.user_service import create_user
+
+
+def test_total_summary_quotes_every_ticker_in_one_call(tmp_db, monkeypatch):
+    ian, dad = create_user("ian", "Ian"), create_user("dad", "Dad")
+    ft = create_account(ian.id, ian.id, "FT", "Firstrade", "US")
+    ib = create_account(ian.id, ian.id, "IB", "IBKR", "US")
+    dad_ft = create_account(dad.id, dad.id, "FT", "Firstrade", "US")
+    add_holding(ft.id, "AAPL", 10, 100.0)
+    add_holding(ib.id, "AAPL", 1, 120.0)
+    add_holding(ib.id, "NVDA", 2, 50.0)
+    add_holding(dad_ft.id, "TSLA", 3, 200.0)
+
+    calls = []
+
+    def fake_fetch_prices(tickers):
+        calls.append(list(tickers))
+        return {t: {"price": 10.0, "currency": "USD"} for t in tickers}
+
+    monkeypatch.setattr(price_service, "fetch_prices", fake_fetch_prices)
+    rates = []
+
+    def fake_fetch_rate(from_currency, to_currency):
+        rates.append((from_currency, to_currency))
+        return 30.0
+
+    monkeypatch.setattr(fx_service, "fetch_rate", fake_fetch_rate)
+
+    s = portfolio_service.get_total_summary()
+    assert calls == [["AAPL", "NVDA", "TSLA"]]
+    assert [u["grand_total"] for u in s["users"]] == [130 * 30.0, 30 * 30.0]
+    assert s["grand_total"] == 160 * 30.0
+    assert rates == [("USD", "TWD")]  # only the accounts' currency, once
+
+    calls.clear()
+    assert portfolio_service.get_user_summary("ian")["grand_total"] == 130 * 30.0
+    assert calls == [["AAPL", "NVDA"]]
+
+
+def test_account_summary_reads_price_cache_with_holdings(tmp_db, monkeypatch):
+    ian = create_user("ian", "Ian")
+    ft = create_account(ian.id, ian.id, "FT", "Firstrade", "US")
+    add_holding(ft.id, "AAPL", 10, 100.0)
+    add_holding(ft.id, "NVDA", 2, 50.0)
+    with sqlite3.connect(tmp_db) as conn:
+        conn.execute(
+            "INSERT INTO price_cache (ticker, price, currency, fetched_at) "
+            "VALUES ('AAPL', 150.0, 'USD', datetime('now'))"
+        )
+
+    def no_cache_query(tickers):
+        raise AssertionError("cache already read with the holdings")
+
+    quoted = []
+
+    def fake_quote(ticker):
+        quoted.append(ticker)
+        return {"ticker": ticker, "price": 60.0, "currency": "USD", "cached": False}
+
+    monkeypatch.setattr(price_service, "_get_cached_prices", no_cache_query)
+    monkeypatch.setattr(price_service, "_quote", fake_quote)
+    monkeypatch.setattr(fx_service, "fetch_rate", None)  # all USD: no FX lookup
+
+    s = portfolio_service.get_account_summary(ft.id)
+    assert quoted == ["NVDA"]
+    assert [(d["holding"].ticker, d["current_price"]) for d in s["holdings"]] == [
+        ("AAPL", 150.0), ("NVDA", 60.0),
+    ]
+    assert s["total_stock_value"] == 1500.0 + 120.0
+
+
+def test_priced_columns_line_up_with_holdings(tmp_db, monkeypatch):
+    from click.testing import CliRunner
+    from portfoliodb.cli import cli
+
+    ian = create_user("ian", "Ian")
+    ft = create_account(ian.id, ian.id, "FT", "Firstrade", "US")
+    add_holding(ft.id, "AAPL", 10, 100.0)
+    add_holding(ft.id, "MISSING", 1, 5.0)  # no quote: absent from "priced"
+    add_holding(ft.id, "NVDA", 2.5, 50.0)
+    quotes = {"AAPL": 150.0, "NVDA": 40.0}
+    monkeypatch.setattr(price_service, "fetch_prices", lambda tickers: {
+        t: {"price": quotes[t], "currency": "USD"} for t in tickers if t in quotes
+    })
+    monkeypatch.setattr(fx_service, "fetch_rate", lambda f, t: 30.0)
+
+    acc_s = portfolio_service.get_user_summary("ian")["accounts"][0]
+    rows = [d for d in acc_s["holdings"] if d["current_price"] is not None]
+    priced = acc_s["priced"]
+    assert priced["ticker"] == [d["holding"].ticker for d in rows] == ["AAPL", "NVDA"]
+    assert priced["shares"] == [d["holding"].shares for d in rows]
+    assert priced["avg_cost"] == [d["holding"].avg_cost for d in rows]
+    assert priced["current_price"] == [d["current_price"] for d in rows]
+    assert priced["unrealized_pnl"] == [d["unrealized_pnl"] for d in rows]
+    assert priced["pnl_pct"] == [d["pnl_pct"] for d in rows]
+
+    out = CliRunner().invoke(cli, ["summary", "user", "ian"]).output
+    assert [line.split() for line in out.splitlines() if "shares @" in line] == [
+        ["AAPL", "10", "shares", "@", "$100.00", "->", "$150.00", "+$500.00", "(+50.00%)"],
+        ["NVDA", "2.5000", "shares", "@", "$50.00", "->", "$40.00", "$-25.00", "(-20.00%)"],
+    ]
@@ -0,0 +1,53 @@
+"""price_service cache path: one bulk read, live quotes only for misses."""
+
+from __future__ import annotations
+
+import sqlite3
+
+from portfoliodb.services import price_service
+
+
+class _FakeTicker:
+    calls: list[str] = []
+
+    def __init__(self, ticker):
+        self.calls.append(ticker)
+
+    @property
+    def fast_info(self):
+        return {"lastPrice": 10.0, "currency": "USD"}
+
+
+def test_only_cache_misses_are_quoted_and_then_cached(tmp_db, monkeypatch):
+    with sqlite3.connect(tmp_db) as conn:
+        conn.execute(
+            "INSERT INTO price_cache (ticker, price, currency, fetched_at) "
+            "VALUES ('AAPL', 150.0, 'USD', datetime('now'))"
+        )
+    _FakeTicker.calls = []
+    monkeypatch.setattr(price_service.yf, "Ticker", _FakeTicker)
+
+    first = price_service.fetch_prices(["nvda", "AAPL", "TSLA"])
+    assert list(first) == ["NVDA", "AAPL", "TSLA"]
+    assert (first["AAPL"]["price"], first["AAPL"]["cached"]) == (150.0, True)
+    assert (first["NVDA"]["price"], first["NVDA"]["cached"]) == (10.0, False)
+    assert sorted(_FakeTicker.calls) == ["NVDA", "TSLA"]
+
+    second = price_service.fetch_prices(["NVDA", "TSLA"])
+    assert all(e["cached"] for e in second.values())
+    assert sorted(_FakeTicker.calls) == ["NVDA", "TSLA"]  # no new quotes
+
+
+def test_expired_rows_are_quoted_again(tmp_db, monkeypatch):
+    with sqlite3.connect(tmp_db) as conn:
+        conn.executemany(
+            "INSERT INTO price_cache (ticker, price, currency, fetched_at) "
+            "VALUES (?, 150.0, 'USD', datetime('now', ?))",
+            [("AAPL", "-1 minutes"), ("NVDA", "-1 days")],
+        )
+    _FakeTicker.calls = []
+    monkeypatch.setattr(price_service.yf, "Ticker", _FakeTicker)
+
+    prices = price_service.fetch_prices(["AAPL", "NVDA"])
+    assert (prices["AAPL"]["cached"], prices["NVDA"]["cached"]) == (True, False)
+    assert _FakeTicker.calls == ["NVDA"]
@@ -59,8 +59,8 @@ class _FakeTickerSurprise:
 
 @pytest.fixture(autouse=True)
 def disable_price_cache(monkeypatch):
-    monkeypatch.setattr(price_service, "_get_cached_price", lambda t: None)
-    monkeypatch.setattr(price_service, "_update_cache", lambda t, p, c: None)
+    monkeypatch.setattr(price_service, "_get_cached_prices", lambda tickers: {})
+    monkeypatch.setattr(price_service, "_update_cache", lambda quotes: None)
 
 
 def test_invalid_ticker_returns_structured_warning(monkeypatch, capsys):
@@ -88,3 +88,20 @@ def test_unexpected_stderr_is_replayed_not_swallowed(monkeypatch, capsys):
     price_service.fetch_prices(["AAPL"])
     err = capsys.readouterr().err
     assert "socket reset" in err  # unknown stderr line replayed
+
+
+def test_iter_matches_fetch_prices_and_dedupes(monkeypatch):
+    monkeypatch.setattr(price_service.yf, "Ticker", _FakeTickerGood)
+    streamed = list(price_service.fetch_prices_iter(["aapl", "NVDA", "AAPL"]))
+    assert sorted(k for k, _ in streamed) == ["AAPL", "NVDA"]
+    assert dict(streamed) == price_service.fetch_prices(["AAPL", "NVDA"])
+
+
+def test_iter_swallows_noise_from_worker_threads(monkeypatch, capsys):
+    import sys
+    real_stderr = sys.stderr
+    monkeypatch.setattr(price_service.yf, "Ticker", _FakeTickerNoData)
+    streamed = dict(price_service.fetch_prices_iter(["FAKE1", "FAKE2", "FAKE3"]))
+    assert {v["warning"] for v in streamed.values()} == {"no quote"}
+    assert "possibly delisted" not in capsys.readouterr().err
+    assert sys.stderr is real_stderr
@@ -0,0 +1,43 @@
+"""parse_scb_csv against a small hand-written SCB SG statement."""
+
+import pytest
+
+from portfoliodb.importers.scb_csv import parse_scb_csv
+
+CSV = """\
+"Account transactions from 01/01/2026 to 31/01/2026"
+"Ian"
+"0123456789"
+"SGD"
+"3,129.92 CR","3,129.92 CR"
+Date,Transaction,Currency,Deposit,Withdrawal,Running Balance,SGD Equivalent Balance
+02/01/2026,SALARY ACME PTE LTD,SGD,"3,000.00",,"3,630.00 CR","3,630.00 CR"
+05/01/2026,ATM WITHDRAWAL,SGD,,500.08,"3,129.92 CR","3,129.92 CR"
+31/02/2026,BAD DATE,SGD,1.00,,"3,130.92 CR","3,130.92 CR"
+"""
+
+
+@pytest.fixture()
+def parsed(tmp_path):
+    path = tmp_path / "scb.csv"
+    path.write_text(CSV, encoding="utf-8")
+    return parse_scb_csv(str(path))
+
+
+class TestParseScbCsv:
+    def test_header(self, parsed):
+        assert (parsed["account_number"], parsed["currency"]) == ("0123456789", "SGD")
+        assert parsed["current_balance"] == pytest.approx(3129.92)
+
+    def test_rows(self, parsed):
+        assert [(t["date"], t["amount"], t["balance"]) for t in parsed["transactions"]] == [
+            ("2026-01-02", 3000.0, 3630.0),
+            ("2026-01-05", -500.08, 3129.92),
+        ]
+        assert [m["category"] for m in parsed["cash_movements"]] == ["DEPOSIT", "WITHDRAWAL"]
+
+    def test_header_only_file_is_rejected(self, tmp_path):
+        path = tmp_path / "short.csv"
+        path.write_text("\n".join(CSV.splitlines()[:6]) + "\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="too short"):
+            parse_scb_csv(str(path))
@@ -0,0 +1,37 @@
+"""sync_broker_holdings: replace an account's holdings with a broker snapshot."""
+
+import pytest
+
+from portfoliodb.brokers.types import BrokerHolding
+from portfoliodb.services.holding_service import add_holding, list_holdings
+from portfoliodb.services.sync_service import sync_broker_holdings
+
+
+# The conftest `account` fixture, as a TW broker account with no cash.
+pytestmark = pytest.mark.parametrize(
+    "account", [("Fubon", "Fubon", "TW", None)], indirect=True, ids=["fubon"],
+)
+
+
+class TestSyncBrokerHoldings:
+    def test_adds_updates_and_removes(self, account):
+        add_holding(account.id, "2330.TW", 1000, 580.0)
+        add_holding(account.id, "2317.TW", 500, 100.0)
+        add_holding(account.id, "2454.TW", 10, 900.0)
+        result = sync_broker_holdings(account.id, [
+            BrokerHolding(ticker="2330.tw", shares=1000, avg_cost=580.0),  # unchanged
+            BrokerHolding(ticker="2317.TW", shares=800, avg_cost=105.0),
+            BrokerHolding(ticker="0050.TW", shares=200, avg_cost=150.0),
+        ])
+        assert result == {"added": 1, "updated": 1, "removed": 1}
+        assert {h.ticker: h.shares for h in list_holdings(account.id)} == {
+            "0050.TW": 200, "2317.TW": 800, "2330.TW": 1000,
+        }
+
+    def test_zero_share_row_keeps_existing_holding(self, account):
+        add_holding(account.id, "2330.TW", 1000, 580.0)
+        result = sync_broker_holdings(account.id, [
+            BrokerHolding(ticker="2330.TW", shares=0, avg_cost=0.0),
+        ])
+        assert result == {"added": 0, "updated": 0, "removed": 0}
+        assert [h.ticker for h in list_holdings(account.id)] == ["2330.TW"]
@@ -1,8 +1,8 @@
-"""Unit tests for canonical_ticker — the single normalisation source."""
+"""Unit tests for canonical_ticker — the single normalisation source — and detect_market."""
 
 import pytest
 
-from portfoliodb.utils.ticker import canonical_ticker
+from portfoliodb.utils.ticker import canonical_ticker, detect_market
 
 
 class TestCanonicalTicker:
@@ -53,3 +53,11 @@ class TestCanonicalTicker:
             canonical_ticker("")
         with pytest.raises(ValueError):
             canonical_ticker("   ")
+
+
+@pytest.mark.parametrize("ticker, market", [
+    ("2330.TW", "TW"), ("8299.two", "TW"), ("D05.SI", "SG"),
+    ("AAPL", "US"), ("BRK.B", "US"), ("TW", "US"),
+])
+def test_detect_market_by_suffix(ticker, market):
+    assert detect_market(ticker) == market
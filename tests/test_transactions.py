@@ -0,0 +1,84 @@
+"""record_transaction(s) double-entry (holding + cash + ledger row) and adjust_cash."""
+
+import pytest
+
+from portfoliodb.db import get_connection
+from portfoliodb.services import cash_service, transaction_service
+from portfoliodb.services.account_service import get_account
+from portfoliodb.services.cash_service import get_cash
+from portfoliodb.services.holding_service import get_holding
+
+
+class TestRecordTransaction:
+    def test_buy_updates_holding_and_cash(self, account):
+        t = transaction_service.record_transaction(
+            account_id=account.id, ticker="nvda", action="BUY", shares=5, price=80.0, fee=1.0)
+        assert (t.ticker, t.currency) == ("NVDA", "USD")
+        assert get_holding(account.id, "NVDA").shares == 5
+        assert get_cash(account.id, "USD").balance == pytest.approx(1000 - 401)
+
+    def test_account_is_read_inside_the_write_transaction(self, account, monkeypatch):
+        seen = []
+
+        def spy(account_id, conn=None):
+            seen.append(conn is not None and conn.in_transaction)
+            return get_account(account_id, conn=conn)
+
+        monkeypatch.setattr(transaction_service, "get_account", spy)
+        t = transaction_service.record_transaction(account.id, "NVDA", "BUY", 1, 10.0)
+        assert (t.account_id, t.currency, seen) == (account.id, "USD", [True])
+
+    def test_executed_at_defaults_to_now(self, account):
+        given = transaction_service.record_transaction(
+            account.id, "NVDA", "BUY", 1, 10.0, executed_at="2024-01-02 09:30:00")
+        now = transaction_service.record_transaction(account.id, "NVDA", "BUY", 1, 10.0)
+        assert given.executed_at == "2024-01-02 09:30:00"
+        assert now.executed_at == now.created_at
+
+
+class TestIterTransactions:
+    def test_matches_list_form(self, account):
+        for price in (10.0, 11.0, 12.0):
+            transaction_service.record_transaction(account.id, "NVDA", "BUY", 1, price)
+        lazy = transaction_service.iter_transactions(account_id=account.id, limit=2)
+        assert [t.id for t in lazy] == [
+            t.id for t in transaction_service.list_transactions(account_id=account.id, limit=2)
+        ]
+
+
+class TestAdjustCash:
+    def test_adds_to_existing_and_creates_missing(self, account):
+        with get_connection() as conn:
+            cash_service.adjust_cash(conn, account.id, "usd", -250.0)
+            cash_service.adjust_cash(conn, account.id, "TWD", 3000.0)
+        assert get_cash(account.id, "USD").balance == pytest.approx(750.0)
+        assert get_cash(account.id, "TWD").balance == pytest.approx(3000.0)
+
+
+class TestRecordTransactions:
+    TRADES = [
+        ("nvda", "BUY", 5, 80.0, 1.0),
+        ("NVDA", "sell", 2, 90.0, 0.5, 0.1, "2024-01-03 10:00:00", "trim"),
+        ("AAPL", "BUY", 1, 150.0),
+    ]
+
+    def test_applies_trades_in_order(self, account):
+        batch = transaction_service.record_transactions(account_id=account.id, trades=self.TRADES)
+        assert [(t.ticker, t.action, t.currency) for t in batch] == [
+            ("NVDA", "BUY", "USD"), ("NVDA", "SELL", "USD"), ("AAPL", "BUY", "USD"),
+        ]
+        assert (batch[1].executed_at, batch[1].notes) == ("2024-01-03 10:00:00", "trim")
+        assert sorted(t.id for t in batch) == sorted(
+            t.id for t in transaction_service.list_transactions(account_id=account.id))
+        nvda = get_holding(account.id, "NVDA")
+        assert (nvda.shares, nvda.avg_cost) == (3, 80.0)
+        assert get_cash(account.id, "USD").balance == pytest.approx(
+            1000 - 401 + (180 - 0.6) - 150)
+
+    def test_failure_records_nothing(self, account):
+        with pytest.raises(ValueError, match="Cannot sell"):
+            transaction_service.record_transactions(
+                account.id, [("NVDA", "BUY", 1, 10.0), ("NVDA", "SELL", 5, 10.0)])
+        assert transaction_service.list_transactions(account_id=account.id) == []
+        assert get_holding(account.id, "NVDA") is None
+        assert get_cash(account.id, "USD").balance == pytest.approx(1000.0)
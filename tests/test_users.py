@@ -0,0 +1,13 @@
+"""user_service listing against the tmp_db fixture."""
+
+from portfoliodb.services.user_service import create_user, list_users
+
+
+def test_list_users_pages_by_id(tmp_db):
+    users = [create_user(name, name.title()) for name in ("ian", "dad", "mom", "bob")]
+    assert list_users() == list_users(limit=None) == users  # LIMIT -1: every row
+    assert list_users(limit=None, after_id=users[0].id) == users[1:]
+    assert list_users(limit=2) == users[:2]
+    assert list_users(limit=2, after_id=users[1].id) == users[2:]
+    assert list_users(limit=2, after_id=users[3].id) == []
+    assert list_users(after_id=users[3].id + 100) == []